@@ -10,6 +10,7 @@ from werkzeug.middleware.proxy_fix import ProxyFix
 
 import config
 from app.csrf import CSRFError, CSRFProtect
+from app.json_provider import OrjsonJSONProvider
 from models import User
 from app.i18n import get_catalog, get_system_dir, normalize_locale, translate
 from app.utils import _get_or_create_secret_key
@@ -74,6 +75,7 @@ def create_app() -> Flask:
         template_folder=os.path.join(_root, "templates"),
         static_folder=os.path.join(_root, "static"),
     )
+    _app.json = OrjsonJSONProvider(_app)
     _app.secret_key = _get_or_create_secret_key()
     secure_cookies = _env_flag("SESSION_SECURE_COOKIES", default=False)
     trust_proxy_headers = _env_flag("TRUST_PROXY_HEADERS", default=False)
@@ -7,8 +7,12 @@ Pages CRUD   -> app/pages/routes.py   (pages_bp)
 Settings     -> app/settings/routes.py (settings_bp)
 """
 
+import contextvars
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Dict
@@ -26,6 +30,19 @@ logger = config.get_logger("api")
 api_bp = Blueprint("api", __name__)
 _BOOTSTRAP_CACHE_TTL_SECONDS = float(os.getenv("BOOTSTRAP_CACHE_TTL_SECONDS", "30"))
 _bootstrap_cache: dict[tuple[str, str], tuple[float, Dict[str, Any]]] = {}
+# Health counters back /api/status, /api/health/status and bootstrap, which the UI polls together.
+# LRU + TTL: at most _HEALTH_CACHE_MAX_ENTRIES users, and mutations that move
+# the pipeline counters drop the user's entry (invalidate_health_cache).
+_HEALTH_CACHE_TTL_SECONDS = float(os.getenv("HEALTH_CACHE_TTL_SECONDS", "10"))
+_HEALTH_CACHE_MAX_ENTRIES = max(1, int(os.getenv("HEALTH_CACHE_MAX_ENTRIES", "512")))
+_health_cache: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+_health_cache_lock = threading.Lock()
+_HEALTH_STATUS_BUCKETS = ("retry_scheduled", "failed", "waiting_approval", "drafted")
+# Shared pool so bootstrap sections (DB reads, Graph/AI probes) overlap instead of running back to back.
+_bootstrap_executor = ThreadPoolExecutor(
+    max_workers=max(1, int(os.getenv("BOOTSTRAP_MAX_WORKERS", "8"))),
+    thread_name_prefix="bootstrap",
+)
 
 
 def _is_truthy(value) -> bool:
@@ -109,6 +126,37 @@ def _bootstrap_cache_set(cache_key: tuple[str, str], payload: Dict[str, Any]) ->
     _bootstrap_cache[cache_key] = (time.monotonic(), deepcopy(payload))
 
 
+def _health_cache_get(user_id: str):
+    if _HEALTH_CACHE_TTL_SECONDS <= 0:
+        return None
+    with _health_cache_lock:
+        cached = _health_cache.get(user_id)
+        if not cached:
+            return None
+        if time.monotonic() - cached[0] > _HEALTH_CACHE_TTL_SECONDS:
+            del _health_cache[user_id]
+            return None
+        _health_cache.move_to_end(user_id)
+    return deepcopy(cached[1])
+
+
+def _health_cache_set(user_id: str, payload: Dict[str, Any]) -> None:
+    if _HEALTH_CACHE_TTL_SECONDS <= 0:
+        return
+    entry = (time.monotonic(), deepcopy(payload))
+    with _health_cache_lock:
+        _health_cache[user_id] = entry
+        _health_cache.move_to_end(user_id)
+        while len(_health_cache) > _HEALTH_CACHE_MAX_ENTRIES:
+            _health_cache.popitem(last=False)
+
+
+def invalidate_health_cache(user_id: str) -> None:
+    """Forget the cached health counters of ``user_id`` after a pipeline change."""
+    with _health_cache_lock:
+        _health_cache.pop(user_id, None)
+
+
 def _safe_bootstrap_value(
     label: str,
     builder: Callable[[], Any],
@@ -123,6 +171,29 @@ def _safe_bootstrap_value(
         return deepcopy(default)
 
 
+def _run_bootstrap_sections(
+    sections: Dict[str, tuple[Callable[[], Any], Any]],
+    errors: list[Dict[str, str]],
+) -> Dict[str, Any]:
+    """Build independent bootstrap sections concurrently, keyed by section label.
+
+    Each builder runs inside a copy of the caller's context so Flask's ``g``,
+    ``request`` and ``current_user`` resolve exactly as they would inline.
+    """
+    futures = {
+        label: _bootstrap_executor.submit(
+            contextvars.copy_context().run,
+            _safe_bootstrap_value,
+            label,
+            builder,
+            default,
+            errors,
+        )
+        for label, (builder, default) in sections.items()
+    }
+    return {label: future.result() for label, future in futures.items()}
+
+
 def _default_health_payload() -> Dict[str, Any]:
     return {
         "ai_source": "not_configured",
@@ -152,8 +223,41 @@ def _default_health_payload() -> Dict[str, Any]:
     }
 
 
+def _load_status_counts(db, user_id: str) -> Dict[str, int]:
+    """Count processed_content per health bucket in one round-trip.
+
+    Falls back to one head-only exact count per bucket while the
+    ``processed_content_status_counts`` function (migrations/004) is missing.
+    """
+    counts = dict.fromkeys(_HEALTH_STATUS_BUCKETS, 0)
+    try:
+        rows = db.rpc(
+            "processed_content_status_counts",
+            {"p_user_id": user_id, "p_statuses": list(_HEALTH_STATUS_BUCKETS)},
+        ).execute().data or []
+    except Exception as exc:
+        logger.warning("Status count RPC unavailable, counting per bucket: %s", exc)
+        for status in _HEALTH_STATUS_BUCKETS:
+            counts[status] = _safe_count(
+                db.table("processed_content")
+                .select("id", count="exact", head=True)
+                .eq("user_id", user_id)
+                .eq("status", status)
+                .execute()
+            )
+        return counts
+    for row in rows:
+        if row.get("status") in counts:
+            counts[row["status"]] = int(row.get("count") or 0)
+    return counts
+
+
 def _load_health_status_payload(user_id: str) -> Dict:
     def builder():
+        cached = _health_cache_get(user_id)
+        if cached is not None:
+            return cached
+
         db = config.get_database_client()
         now = datetime.now(timezone.utc)
         since = (now - timedelta(days=7)).isoformat()
@@ -189,34 +293,7 @@ def _load_health_status_payload(user_id: str) -> Dict:
         ).data
         latest_error_row = latest_error_row[0] if latest_error_row else None
 
-        retry_scheduled = (
-            db.table("processed_content")
-            .select("id", count="exact")
-            .eq("user_id", user_id)
-            .eq("status", "retry_scheduled")
-            .execute()
-        )
-        failed = (
-            db.table("processed_content")
-            .select("id", count="exact")
-            .eq("user_id", user_id)
-            .eq("status", "failed")
-            .execute()
-        )
-        waiting_approval = (
-            db.table("processed_content")
-            .select("id", count="exact")
-            .eq("user_id", user_id)
-            .eq("status", "waiting_approval")
-            .execute()
-        )
-        drafted = (
-            db.table("processed_content")
-            .select("id", count="exact")
-            .eq("user_id", user_id)
-            .eq("status", "drafted")
-            .execute()
-        )
+        status_counts = _load_status_counts(db, user_id)
 
         next_scheduled_rows = (
             db.table("scheduled_posts")
@@ -229,7 +306,7 @@ def _load_health_status_payload(user_id: str) -> Dict:
         ).data or []
         queue_size = (
             db.table("scheduled_posts")
-            .select("id", count="exact")
+            .select("id", count="exact", head=True)
             .eq("user_id", user_id)
             .eq("status", "scheduled")
             .execute()
@@ -245,7 +322,7 @@ def _load_health_status_payload(user_id: str) -> Dict:
         ).data or []
         published_7d = (
             db.table("published_posts")
-            .select("id", count="exact")
+            .select("id", count="exact", head=True)
             .eq("user_id", user_id)
             .gte("published_at", since)
             .execute()
@@ -285,7 +362,7 @@ def _load_health_status_payload(user_id: str) -> Dict:
             "pexels": bool(settings.get("pexels_api_key") or os.getenv("PEXELS_API_KEY")),
         }
 
-        return {
+        payload = {
             "ai_source": ai_source,
             "page": {
                 "connected": bool(page_health.get("connected")),
@@ -302,15 +379,17 @@ def _load_health_status_payload(user_id: str) -> Dict:
             "pipeline": {
                 "queue_size": _safe_count(queue_size),
                 "next_scheduled_at": next_scheduled_rows[0].get("scheduled_time") if next_scheduled_rows else None,
-                "retry_scheduled_count": _safe_count(retry_scheduled),
-                "failed_count": _safe_count(failed),
-                "pending_approvals": _safe_count(waiting_approval),
-                "drafted_count": _safe_count(drafted),
+                "retry_scheduled_count": status_counts["retry_scheduled"],
+                "failed_count": status_counts["failed"],
+                "pending_approvals": status_counts["waiting_approval"],
+                "drafted_count": status_counts["drafted"],
                 "last_published_at": latest_published_rows[0].get("published_at") if latest_published_rows else None,
                 "published_count_7d": _safe_count(published_7d),
             },
             "last_error": last_error,
         }
+        _health_cache_set(user_id, payload)
+        return payload
 
     return _request_cache_value(f"_health_status::{user_id}", builder)
 
@@ -424,7 +503,7 @@ def _load_runtime_status_payload(user_id: str) -> Dict:
         daily_limit = int(settings.get("posts_per_day") or 3)
         published_today = (
             db.table("published_posts")
-            .select("id", count="exact")
+            .select("id", count="exact", head=True)
             .eq("user_id", user_id)
             .gte("published_at", today_start)
             .execute()
@@ -588,147 +667,116 @@ def _build_bootstrap_payload(user_id: str, page: str) -> Dict:
     errors: list[Dict[str, str]] = []
     stale_payload = _bootstrap_cache_get(cache_key, allow_stale=True)
 
-    shell_payload = {
-        "setup": _safe_bootstrap_value(
-            "shell.setup",
+    status_default = {
+        "success": False,
+        "can_post": False,
+        "post_reason": "Dashboard status is temporarily unavailable.",
+        "rate_limiter": {"can_post": False, "posts_today": 0, "daily_limit": 0, "remaining": 0},
+        "ban_detector": {"status": "unknown", "reason": "Unavailable", "severity": 0},
+        "health": "degraded",
+    }
+    sections: Dict[str, tuple[Callable[[], Any], Any]] = {
+        "shell.setup": (
             lambda: _load_setup_progress_payload(user_id),
             {"steps": [], "all_required_complete": False, "next_required_step": "facebook"},
-            errors,
-        ),
-        "status": _safe_bootstrap_value(
-            "shell.status",
-            lambda: _load_runtime_status_payload(user_id),
-            {
-                "success": False,
-                "can_post": False,
-                "post_reason": "Dashboard status is temporarily unavailable.",
-                "rate_limiter": {"can_post": False, "posts_today": 0, "daily_limit": 0, "remaining": 0},
-                "ban_detector": {"status": "unknown", "reason": "Unavailable", "severity": 0},
-                "health": "degraded",
-            },
-            errors,
         ),
+        "shell.status": (lambda: _load_runtime_status_payload(user_id), status_default),
     }
-    payload: Dict[str, Any] = {"shell": shell_payload, "page": page}
+    if page == "dashboard":
+        sections.update(
+            {
+                "dashboard.summary": (
+                    lambda: _load_dashboard_summary_payload(user_id),
+                    {"pending": [], "scheduled": [], "published": [], "ready_count": 0},
+                ),
+                "dashboard.health": (lambda: _load_health_status_payload(user_id), _default_health_payload()),
+                "dashboard.pages": (lambda: load_pages_payload(user_id), {"success": False, "pages": []}),
+            }
+        )
+    elif page == "channels":
+        sections.update(
+            {
+                "channels.pages": (lambda: load_pages_payload(user_id), {"success": False, "pages": []}),
+                "channels.facebook": (
+                    lambda: _json_from_route(get_facebook_status()),
+                    {"connected": False, "reason": "Unavailable"},
+                ),
+                "channels.instagram": (
+                    lambda: _json_from_route(get_instagram_status()),
+                    {"connected": False, "reason": "Unavailable"},
+                ),
+                "channels.telegram_code": (
+                    lambda: _json_from_route(telegram_get_code()),
+                    {"connected": False, "code": "", "deep_link": ""},
+                ),
+                "channels.telegram_status": (lambda: _json_from_route(telegram_status()), {"connected": False}),
+                "channels.telegram_summary": (
+                    lambda: _json_from_route(telegram_summary_settings_get()),
+                    {"enabled": False, "daily_summary_time": "08:00"},
+                ),
+            }
+        )
+    elif page == "settings":
+        sections["settings"] = (lambda: _load_settings_bootstrap_payload(user_id), {})
+    elif page == "diagnostics":
+        sections.update(
+            {
+                "diagnostics.health": (lambda: _load_health_status_payload(user_id), _default_health_payload()),
+                "diagnostics.events": (lambda: _load_health_events_payload(user_id), []),
+            }
+        )
+    elif page == "studio":
+        sections.update(
+            {
+                "studio": (
+                    lambda: _load_studio_bootstrap_payload(user_id),
+                    {
+                        "profile": {},
+                        "page_context": {},
+                        "drafts": [],
+                        "pending": [],
+                        "scheduled": [],
+                        "published": [],
+                        "presets": {"niches": []},
+                    },
+                ),
+                "studio.status": (
+                    lambda: _load_runtime_status_payload(user_id),
+                    {**status_default, "post_reason": "Studio status is temporarily unavailable."},
+                ),
+                "studio.pages": (lambda: load_pages_payload(user_id), {"success": False, "pages": []}),
+            }
+        )
 
+    results = _run_bootstrap_sections(sections, errors)
+    payload: Dict[str, Any] = {
+        "shell": {"setup": results["shell.setup"], "status": results["shell.status"]},
+        "page": page,
+    }
     if page == "dashboard":
         payload["dashboard"] = {
-            "summary": _safe_bootstrap_value(
-                "dashboard.summary",
-                lambda: _load_dashboard_summary_payload(user_id),
-                {"pending": [], "scheduled": [], "published": [], "ready_count": 0},
-                errors,
-            ),
-            "health": _safe_bootstrap_value(
-                "dashboard.health",
-                lambda: _load_health_status_payload(user_id),
-                _default_health_payload(),
-                errors,
-            ),
+            "summary": results["dashboard.summary"],
+            "health": results["dashboard.health"],
             "events": [],
-            "pages": _safe_bootstrap_value(
-                "dashboard.pages",
-                lambda: load_pages_payload(user_id),
-                {"success": False, "pages": []},
-                errors,
-            ),
+            "pages": results["dashboard.pages"],
         }
     elif page == "channels":
         payload["channels"] = {
-            "pages": _safe_bootstrap_value(
-                "channels.pages",
-                lambda: load_pages_payload(user_id),
-                {"success": False, "pages": []},
-                errors,
-            ),
-            "facebook": _safe_bootstrap_value(
-                "channels.facebook",
-                lambda: _json_from_route(get_facebook_status()),
-                {"connected": False, "reason": "Unavailable"},
-                errors,
-            ),
-            "instagram": _safe_bootstrap_value(
-                "channels.instagram",
-                lambda: _json_from_route(get_instagram_status()),
-                {"connected": False, "reason": "Unavailable"},
-                errors,
-            ),
-            "telegram_code": _safe_bootstrap_value(
-                "channels.telegram_code",
-                lambda: _json_from_route(telegram_get_code()),
-                {"connected": False, "code": "", "deep_link": ""},
-                errors,
-            ),
-            "telegram_status": _safe_bootstrap_value(
-                "channels.telegram_status",
-                lambda: _json_from_route(telegram_status()),
-                {"connected": False},
-                errors,
-            ),
-            "telegram_summary": _safe_bootstrap_value(
-                "channels.telegram_summary",
-                lambda: _json_from_route(telegram_summary_settings_get()),
-                {"enabled": False, "daily_summary_time": "08:00"},
-                errors,
-            ),
+            key: results[f"channels.{key}"]
+            for key in ("pages", "facebook", "instagram", "telegram_code", "telegram_status", "telegram_summary")
         }
     elif page == "settings":
-        payload["settings"] = _safe_bootstrap_value(
-            "settings",
-            lambda: _load_settings_bootstrap_payload(user_id),
-            {},
-            errors,
-        )
+        payload["settings"] = results["settings"]
     elif page == "diagnostics":
         payload["diagnostics"] = {
-            "health": _safe_bootstrap_value(
-                "diagnostics.health",
-                lambda: _load_health_status_payload(user_id),
-                _default_health_payload(),
-                errors,
-            ),
-            "events": _safe_bootstrap_value(
-                "diagnostics.events",
-                lambda: _load_health_events_payload(user_id),
-                [],
-                errors,
-            ),
+            "health": results["diagnostics.health"],
+            "events": results["diagnostics.events"],
         }
     elif page == "studio":
         payload["studio"] = {
-            **_safe_bootstrap_value(
-                "studio",
-                lambda: _load_studio_bootstrap_payload(user_id),
-                {
-                    "profile": {},
-                    "page_context": {},
-                    "drafts": [],
-                    "pending": [],
-                    "scheduled": [],
-                    "published": [],
-                    "presets": {"niches": []},
-                },
-                errors,
-            ),
-            "status": _safe_bootstrap_value(
-                "studio.status",
-                lambda: _load_runtime_status_payload(user_id),
-                {
-                    "success": False,
-                    "can_post": False,
-                    "post_reason": "Studio status is temporarily unavailable.",
-                    "rate_limiter": {"can_post": False, "posts_today": 0, "daily_limit": 0, "remaining": 0},
-                    "ban_detector": {"status": "unknown", "reason": "Unavailable", "severity": 0},
-                    "health": "degraded",
-                },
-                errors,
-            ),
-            "pages": _safe_bootstrap_value(
-                "studio.pages",
-                lambda: load_pages_payload(user_id),
-                {"success": False, "pages": []},
-                errors,
-            ),
+            **results["studio"],
+            "status": results["studio.status"],
+            "pages": results["studio.pages"],
         }
 
     if errors and stale_payload is not None:
@@ -814,25 +862,32 @@ def _run_pexels_service_test(user_id: str) -> Dict:
     return {"success": False, "service": "pexels", "message": response.text or "Pexels connection test failed."}
 
 
+def _run_database_service_test(user_id: str) -> Dict:
+    (
+        config.get_database_client()
+        .table("managed_pages")
+        .select("id")
+        .eq("user_id", user_id)
+        .limit(1)
+        .execute()
+    )
+    return {"success": True, "service": "database", "message": "Database connection succeeded."}
+
+
+_SERVICE_TESTS: Dict[str, Callable[[str], Dict]] = {
+    "facebook": _run_facebook_service_test,
+    "ai": _run_ai_service_test,
+    "pexels": _run_pexels_service_test,
+    "database": _run_database_service_test,
+}
+
+
 def _run_health_service_test(service: str, user_id: str) -> Dict:
     normalized = str(service or "").strip().lower()
-    if normalized == "facebook":
-        return _run_facebook_service_test(user_id)
-    if normalized == "ai":
-        return _run_ai_service_test(user_id)
-    if normalized == "pexels":
-        return _run_pexels_service_test(user_id)
-    if normalized == "database":
-        (
-            config.get_database_client()
-            .table("managed_pages")
-            .select("id")
-            .eq("user_id", user_id)
-            .limit(1)
-            .execute()
-        )
-        return {"success": True, "service": "database", "message": "Database connection succeeded."}
-    return {"success": False, "service": normalized or "unknown", "message": "Unknown service requested."}
+    runner = _SERVICE_TESTS.get(normalized)
+    if runner is None:
+        return {"success": False, "service": normalized or "unknown", "message": "Unknown service requested."}
+    return runner(user_id)
 
 
 # ============================================================
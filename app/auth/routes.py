@@ -106,7 +106,7 @@ def register():
             client = _get_supabase()
 
             # Check email uniqueness before touching the activation code
-            existing = client.table("users").select("id").eq("email", email).execute()
+            existing = client.table("users").select("id").eq("email", email).limit(1).execute()
             if existing.data:
                 error = "email_exists"
                 return render_template("auth/register.html", error=error)
@@ -265,7 +265,11 @@ def oauth_select_page():
             or "My Page"
         )
 
-        page_token = get_page_token(result["user_token"], page_id)
+        # /me/accounts already returned each page's token during the callback;
+        # only ask Graph again when the stored entry lacks one.
+        page_token = str((selected_page or {}).get("access_token") or "").strip()
+        if not page_token:
+            page_token = get_page_token(result["user_token"], page_id)
 
         ig_account_id = ""
         try:
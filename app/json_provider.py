@@ -0,0 +1,38 @@
+"""Flask JSON provider backed by orjson, with a stdlib fallback."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+import config
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Serialize ``jsonify`` responses and parse request bodies with orjson.
+
+    Output matches Flask's default provider for the types the app returns:
+    dates still go through ``DefaultJSONProvider.default`` (HTTP date strings),
+    keys stay sorted, and the debug/compact indentation switch is honoured.
+    Calls with other ``json.dumps`` options fall back to the stdlib provider.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        orjson = config.orjson
+        indent = kwargs.get("indent")
+        extra = set(kwargs) - {"separators", "indent"}
+        if orjson is None or extra or indent not in (None, 2):
+            return super().dumps(obj, **kwargs)
+
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return config.json_loads(s)
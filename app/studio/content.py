@@ -19,6 +19,7 @@ _clear_schedule_records = studio_helpers._clear_schedule_records
 _create_schedule_record = studio_helpers._create_schedule_record
 _current_user_id = studio_helpers._current_user_id
 _load_owned_content_row = studio_helpers._load_owned_content_row
+_load_regeneration_row = studio_helpers._load_regeneration_row
 _load_runtime_profile = studio_helpers._load_runtime_profile
 _normalize_draft_row = studio_helpers._normalize_draft_row
 _normalize_platforms = studio_helpers._normalize_platforms
@@ -255,7 +256,7 @@ def unschedule_content(content_id: str):
 def regenerate_content_by_id(content_id: str):
     try:
         data = _resolve_request_data()
-        content = _load_owned_content_row(content_id)
+        content = _load_regeneration_row(content_id)
         if not content:
             return _api_error("Content not found", 404)
         regenerated = _regenerate_existing_content(
@@ -275,19 +276,11 @@ def regenerate_content_legacy():
         content_id = data.get("content_id")
         if not content_id:
             return _api_error("Missing content_id", 400)
-        result = (
-            _client()
-            .table("processed_content")
-            .select("*")
-            .eq("id", content_id)
-            .eq("user_id", _current_user_id())
-            .single()
-            .execute()
-        )
-        if not result.data:
+        content = _load_regeneration_row(content_id)
+        if not content:
             return _api_error("Content not found", 404)
         regenerated = _regenerate_existing_content(
-            result.data,
+            content,
             instruction=str(data.get("instruction") or "").strip(),
             tone=str(data.get("tone") or "").strip().lower() or None,
         )
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import contextvars
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -14,6 +16,10 @@ logger = config.get_logger("studio")
 
 AUTO_PUBLISHABLE_FORMATS = {"post", "carousel"}
 DRAFT_ONLY_FORMATS = {"story_sequence", "reel_script"}
+# Columns read by _regenerate_existing_content; keeps the regenerate fetch (and the prompt metadata) lean.
+REGENERATION_FIELDS = "id, user_id, article_id, post_type, target_audience, generated_text, hook, call_to_action, hashtags"
+
+_prefetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="studio-prefetch")
 
 
 def _client():
@@ -72,7 +78,7 @@ def _extract_language_from_content(row: Dict[str, Any]) -> str:
     raw_generated = row.get("generated_text")
     if isinstance(raw_generated, str) and raw_generated.strip().startswith(("{", "[")):
         try:
-            payload = json.loads(raw_generated)
+            payload = config.json_loads(raw_generated)
             if isinstance(payload, dict):
                 return _normalize_ui_language(payload.get("language"), fallback="en")
         except (TypeError, ValueError) as exc:
@@ -183,7 +189,7 @@ def _parse_structured_generated_text(raw_value: Any) -> Dict[str, Any]:
     if not stripped.startswith(("{", "[")):
         return {}
     try:
-        parsed = json.loads(stripped)
+        parsed = config.json_loads(stripped)
         return parsed if isinstance(parsed, dict) else {}
     except Exception:
         return {}
@@ -326,6 +332,25 @@ def _load_owned_content_row(content_id: str, fields: str = "*") -> Optional[Dict
     return result.data or None
 
 
+def _load_regeneration_row(content_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch a row for regeneration while the owner's UserConfig loads in parallel.
+
+    The config read does not depend on the row and lands in the request-scoped
+    cache that _load_runtime_profile() consults next, so the two round-trips overlap.
+    """
+    from user_config import get_user_config
+
+    warm_config = _prefetch_executor.submit(contextvars.copy_context().run, get_user_config, _current_user_id())
+    try:
+        return _load_owned_content_row(content_id, REGENERATION_FIELDS)
+    finally:
+        # A failed warm-up must never change the outcome; the real load retries it.
+        try:
+            warm_config.result()
+        except Exception as exc:
+            logger.debug("UserConfig prefetch for regeneration failed: %s", exc)
+
+
 def _create_schedule_record(content_id: str, scheduled_time: str, timezone_name: str, platforms: str = "facebook") -> Optional[Dict[str, Any]]:
     result = (
         _client()
@@ -338,7 +363,6 @@ def _create_schedule_record(content_id: str, scheduled_time: str, timezone_name:
                 "timezone": timezone_name,
                 "status": "scheduled",
                 "platforms": platforms,
-                "created_at": datetime.now(timezone.utc).isoformat(),
             }
         )
         .execute()
@@ -386,7 +410,13 @@ def _generate_studio_content(
             language=runtime_profile.content_language,
             tone=runtime_profile.content_tone,
         )
-    raw_response = run_ai_generation(prompt, runtime_profile, max_tokens=1536 if content_format == "carousel" else 1024, temperature=0.7)
+    raw_response = run_ai_generation(
+        prompt,
+        runtime_profile,
+        max_tokens=1536 if content_format == "carousel" else 1024,
+        temperature=0.7,
+        json_response=True,
+    )
     return _normalize_generated_content(content_format=content_format, raw_response=raw_response, language=runtime_profile.content_language)
 
 
@@ -405,7 +435,13 @@ def _regenerate_existing_content(content_row: Dict[str, Any], instruction: str,
         tone=runtime_profile.content_tone,
         instruction=instruction,
     )
-    raw_response = run_ai_generation(prompt, runtime_profile, max_tokens=1536 if content_format == "carousel" else 1024, temperature=0.7)
+    raw_response = run_ai_generation(
+        prompt,
+        runtime_profile,
+        max_tokens=1536 if content_format == "carousel" else 1024,
+        temperature=0.7,
+        json_response=True,
+    )
     regenerated = _normalize_generated_content(content_format=content_format, raw_response=raw_response, language=runtime_profile.content_language)
     if content_row.get("id"):
         update_payload = _build_record_payload(
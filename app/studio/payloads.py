@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any, Dict
 
+import config
 from . import helpers as studio_helpers
 
 _client = studio_helpers._client
@@ -184,7 +184,7 @@ def _load_studio_bootstrap_payload(user_id: str) -> Dict[str, Any]:
     settings = get_user_settings(user_id) or {}
     template_defaults_raw = str(settings.get("studio_template_defaults") or "").strip()
     try:
-        template_defaults = json.loads(template_defaults_raw) if template_defaults_raw else {}
+        template_defaults = config.json_loads(template_defaults_raw) if template_defaults_raw else {}
     except Exception:
         template_defaults = {}
     normalized_template_defaults = studio_routes._normalize_template_defaults(template_defaults if isinstance(template_defaults, dict) else {})
@@ -12,6 +12,7 @@ from flask_login import current_user
 from werkzeug.utils import secure_filename
 
 import config
+from app.api.routes import invalidate_health_cache
 from app.utils import api_login_required, get_user_settings, require_user_settings_update
 from . import content as content_impl
 from . import helpers as helpers_impl
@@ -49,6 +50,7 @@ _normalize_draft_row = helpers_impl._normalize_draft_row
 _build_record_payload = helpers_impl._build_record_payload
 _save_draft_record = helpers_impl._save_draft_record
 _load_owned_content_row = helpers_impl._load_owned_content_row
+_load_regeneration_row = helpers_impl._load_regeneration_row
 _create_schedule_record = helpers_impl._create_schedule_record
 _clear_schedule_records = helpers_impl._clear_schedule_records
 _generate_studio_content = helpers_impl._generate_studio_content
@@ -145,7 +147,7 @@ def _load_template_defaults_for_user(user_id: str) -> Dict[str, Any]:
     if not raw:
         return {}
     try:
-        parsed = json.loads(raw)
+        parsed = config.json_loads(raw)
     except Exception:
         return {}
     return _normalize_template_defaults(parsed if isinstance(parsed, dict) else {})
@@ -205,6 +207,7 @@ def _wire_module_dependencies() -> None:
     content_impl._current_user_id = lambda: current_user.id
     content_impl._load_dashboard_summary_payload = lambda *args, **kwargs: _load_dashboard_summary_payload(*args, **kwargs)
     content_impl._load_owned_content_row = lambda *args, **kwargs: _load_owned_content_row(*args, **kwargs)
+    content_impl._load_regeneration_row = lambda content_id: _load_regeneration_row(content_id)
     content_impl._load_published_content_payload = lambda *args, **kwargs: _load_published_content_payload(*args, **kwargs)
     content_impl._load_runtime_profile = lambda *args, **kwargs: _load_runtime_profile(*args, **kwargs)
     content_impl._load_scheduled_content_payload = lambda *args, **kwargs: _load_scheduled_content_payload(*args, **kwargs)
@@ -221,6 +224,29 @@ def _wire_module_dependencies() -> None:
 _wire_module_dependencies()
 
 
+# Endpoints that move content between pipeline states (review, schedule,
+# publish, scheduler retries), so the cached health counters are stale after them.
+_HEALTH_MUTATING_ENDPOINTS = frozenset({
+    "studio.approve_content",
+    "studio.reject_content",
+    "studio.send_content_to_review",
+    "studio.studio_approve",
+    "studio.schedule_content",
+    "studio.unschedule_content",
+    "studio.publish_specific_content",
+    "studio.publish_next",
+    "studio.publish_now",
+    "studio.run_scheduler",
+})
+
+
+@studio_bp.after_request
+def _invalidate_health_after_mutation(response):
+    if request.endpoint in _HEALTH_MUTATING_ENDPOINTS and current_user.is_authenticated:
+        invalidate_health_cache(current_user.id)
+    return response
+
+
 @studio_bp.route("/api/content/<content_id>/approve", methods=["POST"])
 @api_login_required
 def approve_content(content_id: str):
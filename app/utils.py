@@ -127,9 +127,7 @@ def _read_env_file() -> Tuple[Path, Dict[str, str]]:
 
 
 def _write_env_file(env_path: Path, data: Dict[str, str]) -> None:
-    with open(env_path, "w", encoding="utf-8") as f:
-        for key, val in data.items():
-            f.write(f"{key}={val}\n")
+    config.write_text_atomic(env_path, "".join(f"{key}={val}\n" for key, val in data.items()))
 
 
 # ── Fernet encryption helpers ───────────────────────────────────────────────
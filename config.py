@@ -5,12 +5,25 @@ from __future__ import annotations
 import json
 import logging
 import os
+import shutil
+import tempfile
+import threading
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx when installed)
+except ImportError:
+    h2 = None
+
 BASE_DIR = Path(__file__).resolve().parent
 LOG_DIR = BASE_DIR / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -39,6 +52,9 @@ OPENROUTER_API_KEYS = [
 OPENROUTER_MODEL = os.getenv("OPENROUTER_MODEL", "anthropic/claude-3-haiku")
 
 HTTP_TIMEOUT_SECONDS = int(os.getenv("HTTP_TIMEOUT_SECONDS", "20"))
+# Connect phase only: unreachable hosts fail in seconds while slow-but-alive
+# responses still get the full read timeout.
+HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "3.05"))
 REQUEST_SLEEP_SECONDS = float(os.getenv("REQUEST_SLEEP_SECONDS", "2"))
 
 DEFAULT_KEYWORDS = [
@@ -90,10 +106,51 @@ if DEFAULT_COUNTRY_CODE not in _STATIC_COUNTRY_CODES:
     DEFAULT_COUNTRY_CODE = "OTHER"
 
 
+def json_loads(raw: str | bytes) -> Any:
+    """Parse JSON with orjson when it is installed, falling back to the stdlib.
+
+    Both backends raise a ``ValueError`` subclass on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Replace ``path`` with ``text`` so readers never see a torn file.
+
+    The content goes to a uniquely named sibling temp file (safe across
+    processes), inherits the original file's permission bits, is fsynced and
+    then swapped in with ``os.replace``. New files keep mkstemp's 0600 mode.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 @lru_cache(maxsize=1)
 def _load_static_presets() -> dict[str, Any]:
-    with STATIC_PRESETS_PATH.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = json_loads(STATIC_PRESETS_PATH.read_bytes())
     if not isinstance(payload, dict):
         raise RuntimeError("Static preset payload must be a JSON object.")
     return payload
@@ -139,6 +196,23 @@ def get_database_client():
 
 _supabase_service_instance = None
 _supabase_service_signature = None
+_supabase_service_lock = threading.Lock()
+
+
+def _build_supabase_http_client():
+    """Return a keep-alive httpx client shared by every Supabase sub-client."""
+    import httpx
+
+    return httpx.Client(
+        http2=h2 is not None,
+        follow_redirects=True,
+        timeout=HTTP_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_keepalive_connections=15,
+            max_connections=30,
+            keepalive_expiry=30.0,
+        ),
+    )
 
 
 def get_supabase_service_client():
@@ -151,11 +225,10 @@ def get_supabase_service_client():
 
     Use this only when raw Supabase SDK behaviour is required (auth, license
     validation, user lookups). Most runtime code should use
-    get_database_client() instead.
+    get_database_client() instead; in Supabase mode that adapter wraps this
+    same client, so both share one keep-alive connection pool.
     """
     global _supabase_service_instance, _supabase_service_signature
-    from supabase import create_client
-    from supabase.lib.client_options import SyncClientOptions
 
     url = require_env("SUPABASE_URL")
     key = require_env("SUPABASE_KEY")
@@ -164,16 +237,25 @@ def get_supabase_service_client():
     if _supabase_service_instance is not None and _supabase_service_signature == sig:
         return _supabase_service_instance
 
-    _supabase_service_instance = create_client(
-        url,
-        key,
-        options=SyncClientOptions(
-            postgrest_client_timeout=HTTP_TIMEOUT_SECONDS,
-            storage_client_timeout=int(HTTP_TIMEOUT_SECONDS),
-            function_client_timeout=int(min(max(HTTP_TIMEOUT_SECONDS, 1), 30)),
-        ),
-    )
-    _supabase_service_signature = sig
+    with _supabase_service_lock:
+        # Re-check under the lock: concurrent first callers must not each build a client.
+        if _supabase_service_instance is not None and _supabase_service_signature == sig:
+            return _supabase_service_instance
+
+        from supabase import create_client
+        from supabase.lib.client_options import SyncClientOptions
+
+        _supabase_service_instance = create_client(
+            url,
+            key,
+            options=SyncClientOptions(
+                httpx_client=_build_supabase_http_client(),
+                postgrest_client_timeout=HTTP_TIMEOUT_SECONDS,
+                storage_client_timeout=int(HTTP_TIMEOUT_SECONDS),
+                function_client_timeout=int(min(max(HTTP_TIMEOUT_SECONDS, 1), 30)),
+            ),
+        )
+        _supabase_service_signature = sig
     return _supabase_service_instance
 
 
@@ -19,10 +19,15 @@ import os
 import json
 import re
 import sqlite3
+import threading
+import weakref
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
+from uuid import uuid4
 
 import config
 
@@ -41,6 +46,44 @@ def get_db_mode() -> str:
     return os.getenv("DB_MODE", "sqlite").lower()
 
 
+# SQLite files whose schema/migrations already ran in this process. The DDL is
+# idempotent, so a second SQLiteDB on the same file only needs to skip it.
+_ensured_db_paths: set[str] = set()
+_ensure_lock = threading.Lock()
+
+# Stored in the file header via PRAGMA user_version once the bootstrap below has
+# run, so later processes skip the DDL entirely. Bump it whenever _create_tables
+# gains a table, column migration or index.
+_SCHEMA_VERSION = 1
+
+# Per-connection tuning. journal_mode=WAL is persistent on the file and is set
+# once by the schema bootstrap; WAL keeps ``-wal``/``-shm`` files next to the
+# database, so copy or delete all three together.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA mmap_size=268435456;"
+    "PRAGMA cache_size=-16000;"
+    "PRAGMA busy_timeout=30000;"
+)
+
+
+# INSERT ... RETURNING needs SQLite 3.35+; older builds re-read inserted rows.
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+# Bound parameters per statement (SQLITE_MAX_VARIABLE_NUMBER since 3.32).
+_SQLITE_MAX_VARIABLES = 32766
+
+
+class _ThreadConnection:
+    """One thread's persistent connection plus how deeply it is in use."""
+
+    __slots__ = ("conn", "depth", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.depth = 0
+
+
 class SQLiteDB:
     """
     SQLite database wrapper with Supabase-like API.
@@ -52,26 +95,79 @@ class SQLiteDB:
     def __init__(self, db_path: str = None):
         """Initialize SQLite connection."""
         self.db_path = db_path or str(DB_FILE)
+        self._local = threading.local()
+        # Weak so a finished thread's connection is freed with its thread-local slot.
+        self._connections: "weakref.WeakSet[_ThreadConnection]" = weakref.WeakSet()
+        self._table_columns: Dict[str, set[str]] = {}
         self._ensure_tables()
         logger.info(f"✅ SQLite database: {self.db_path}")
     
+    def _thread_connection(self) -> _ThreadConnection:
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.executescript(_CONNECTION_PRAGMAS)
+            holder = _ThreadConnection(conn)
+            self._local.holder = holder
+            self._connections.add(holder)
+        return holder
+
     @contextmanager
-    def _get_conn(self):
-        """Get database connection context manager."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def _get_conn(self, write: bool = False):
+        """Yield this thread's persistent connection.
+
+        The connection is opened (and tuned) once per thread and reused.
+        Nested uses share the outer transaction; only the outermost one
+        commits or rolls back. ``write=True`` takes the write lock up front
+        (BEGIN IMMEDIATE) so the transaction cannot fail to upgrade later.
+        """
+        holder = self._thread_connection()
+        if write and not holder.conn.in_transaction:
+            holder.conn.execute("BEGIN IMMEDIATE")
+        holder.depth += 1
         try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
+            yield holder.conn
+            if holder.depth == 1:
+                holder.conn.commit()
+        except Exception:
+            if holder.depth == 1:
+                holder.conn.rollback()
             raise
         finally:
-            conn.close()
+            holder.depth -= 1
+
+    def optimize(self) -> None:
+        """Refresh query-planner statistics where SQLite thinks they are stale."""
+        with self._get_conn() as conn:
+            conn.execute("PRAGMA optimize")
+
+    def close(self) -> None:
+        """Close every pooled connection (call on shutdown)."""
+        try:
+            self.optimize()
+        except sqlite3.Error as exc:
+            logger.debug("Skipping SQLite optimize on close: %s", exc)
+        for holder in list(self._connections):
+            holder.conn.close()
+        self._connections.clear()
+        self._local = threading.local()
     
     def _ensure_tables(self):
-        """Create tables if they don't exist."""
+        """Create tables if they don't exist (once per database file per process)."""
+        key = os.path.abspath(self.db_path) if self.db_path != ":memory:" else None
+        with _ensure_lock:
+            if key in _ensured_db_paths and os.path.exists(key):
+                return
+            self._create_tables()
+            if key is not None:
+                _ensured_db_paths.add(key)
+
+    def _create_tables(self):
         with self._get_conn() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+                return
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             
             # raw_articles
@@ -209,17 +305,45 @@ class SQLiteDB:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_scheduled_status ON scheduled_posts(status)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_scheduled_time ON scheduled_posts(scheduled_time)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_content_status ON processed_content(status)")
+            # Composite indexes for the hot tenant filters: due posts (status + time
+            # range, ordered by time), per-status content counts, and recent publishes.
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_scheduled_status_time ON scheduled_posts(status, scheduled_time)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_content_user_status ON processed_content(user_id, status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_published_user_time ON published_posts(user_id, published_at)")
             cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_content_hash ON processed_content(content_hash) WHERE content_hash IS NOT NULL")
             
+            # Collect planner stats for the indexes just created (cheap when current).
+            conn.execute("PRAGMA optimize")
+            conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
             logger.debug("✅ Database tables ready")
     
     def table(self, name: str) -> "SQLiteTable":
         """Get a table interface (Supabase-compatible)."""
         return SQLiteTable(self, name)
     
+    def columns_for(self, table_name: str) -> set[str]:
+        """Return the column names of ``table_name`` (read from the schema once)."""
+        columns = self._table_columns.get(table_name)
+        if columns is None:
+            with self._get_conn() as conn:
+                rows = conn.execute(f'PRAGMA table_info("{table_name}")').fetchall()
+            columns = {str(row["name"]) for row in rows}
+            if columns:
+                self._table_columns[table_name] = columns
+        return columns
+
+    def rpc(self, name: str, params: Optional[Dict] = None) -> "SQLiteRPC":
+        """Call a stored function (Supabase-compatible; local SQL shims)."""
+        if name not in _SQLITE_RPCS:
+            raise ValueError(f"Unknown RPC function: {name}")
+        return SQLiteRPC(self, name, params or {})
+
     def execute(self, sql: str, params: tuple = ()) -> List[Dict]:
         """Execute raw SQL and return results."""
-        with self._get_conn() as conn:
+        verb = sql.lstrip()[:6].upper()
+        if verb in ("ALTER ", "CREATE", "DROP T"):
+            self._table_columns.clear()
+        with self._get_conn(write=verb in ("INSERT", "UPDATE", "DELETE", "REPLAC")) as conn:
             cursor = conn.cursor()
             cursor.execute(sql, params)
             if cursor.description:
@@ -227,6 +351,79 @@ class SQLiteDB:
             return []
 
 
+# Columns stored as JSON text in SQLite and returned as lists (like Postgres arrays).
+_JSON_ARRAY_COLUMNS = frozenset({"hashtags", "keywords"})
+
+
+def _encode_json_columns(data: Dict) -> None:
+    """Serialize list values of the JSON array columns in place (compact form)."""
+    for key in _JSON_ARRAY_COLUMNS.intersection(data):
+        value = data[key]
+        if isinstance(value, list):
+            data[key] = json.dumps(value, separators=(",", ":"))
+
+
+# SQL text is cached per statement shape (table, columns, filter layout) so the
+# hot paths skip string building, and the identical text hits sqlite3's
+# per-connection statement cache. Identifiers are validated before they get here.
+@lru_cache(maxsize=256)
+def _where_sql(shape: Tuple[Tuple[str, str, int], ...]) -> str:
+    clauses = []
+    for column, op, size in shape:
+        if op == "IN":
+            clauses.append(f'"{column}" IN ({", ".join(["?"] * size)})')
+        else:
+            clauses.append(f'"{column}" {op} ?')
+    return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+
+@lru_cache(maxsize=256)
+def _insert_sql(
+    table: str,
+    columns: Tuple[str, ...],
+    row_count: int,
+    returning: bool,
+    on_conflict: Optional[Tuple[str, ...]] = None,
+) -> str:
+    row_placeholders = f"({', '.join(['?'] * len(columns))})"
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    sql = f'INSERT INTO "{table}" ({column_list}) VALUES {", ".join([row_placeholders] * row_count)}'
+    if on_conflict:
+        # Upsert: refresh every supplied column except the conflict target and the row id.
+        target = ", ".join(f'"{column}"' for column in on_conflict)
+        updates = [f'"{column}" = excluded."{column}"' for column in columns if column not in on_conflict and column != "id"]
+        action = f"DO UPDATE SET {', '.join(updates)}" if updates else "DO NOTHING"
+        sql += f" ON CONFLICT ({target}) {action}"
+    return f"{sql} RETURNING *" if returning else sql
+
+
+@lru_cache(maxsize=256)
+def _update_sql(table: str, columns: Tuple[str, ...], where: Tuple[Tuple[str, str, int], ...]) -> str:
+    set_clause = ", ".join(f'"{column}" = ?' for column in columns)
+    return f'UPDATE "{table}" SET {set_clause}{_where_sql(where)}'
+
+
+@lru_cache(maxsize=256)
+def _delete_sql(table: str, where: Tuple[Tuple[str, str, int], ...]) -> str:
+    return f'DELETE FROM "{table}"{_where_sql(where)}'
+
+
+@lru_cache(maxsize=256)
+def _select_sql(
+    table: str,
+    columns: str,
+    where: Tuple[Tuple[str, str, int], ...],
+    order: Optional[Tuple[str, bool]],
+    limit: Optional[int],
+) -> str:
+    sql = f'SELECT {columns} FROM "{table}"{_where_sql(where)}'
+    if order:
+        sql += f' ORDER BY "{order[0]}" {"DESC" if order[1] else "ASC"}'
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    return sql
+
+
 class SQLiteTable:
     """
     Table interface that mimics Supabase client API.
@@ -243,6 +440,7 @@ class SQLiteTable:
         self._order = None
         self._limit = None
         self._single = False
+        self._head = False
 
     def _validate_table_name(self) -> str:
         if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", self.table_name or ""):
@@ -251,9 +449,7 @@ class SQLiteTable:
 
     def _get_allowed_columns(self) -> set[str]:
         table_name = self._validate_table_name()
-        with self.db._get_conn() as conn:
-            rows = conn.execute(f'PRAGMA table_info("{table_name}")').fetchall()
-        columns = {str(row["name"]) for row in rows}
+        columns = self.db.columns_for(table_name)
         if not columns:
             raise ValueError(f"Unknown SQLite table: {table_name}")
         return columns
@@ -263,15 +459,22 @@ class SQLiteTable:
             raise ValueError(f"Invalid column name for {self.table_name}: {column}")
         return f'"{column}"'
     
-    def select(self, columns: str = "*", count: str = None) -> "SQLiteTable":
-        """Select columns."""
+    def select(self, columns: str = "*", count: str = None, head: bool = False) -> "SQLiteTable":
+        """Select columns; with ``head=True`` only the matching-row count is returned."""
         self._select_cols = columns
+        self._head = bool(head)
         return self
     
-    def insert(self, data: Dict) -> "SQLiteTable":
-        """Insert data."""
+    def insert(self, data: Dict | List[Dict]) -> "SQLiteTable":
+        """Insert one row, or a list of rows in a single call (like supabase-py)."""
         self._insert_data = data
         return self
+
+    def upsert(self, data: Dict | List[Dict], on_conflict: str = "id") -> "SQLiteTable":
+        """Insert rows, updating the existing row when ``on_conflict`` columns clash."""
+        self._insert_data = data
+        self._on_conflict = tuple(column.strip() for column in on_conflict.split(","))
+        return self
     
     def update(self, data: Dict) -> "SQLiteTable":
         """Update data."""
@@ -336,114 +539,169 @@ class SQLiteTable:
     
     def execute(self) -> "SQLiteResult":
         """Execute the query and return result."""
-        with self.db._get_conn() as conn:
+        write = hasattr(self, '_insert_data') or hasattr(self, '_update_data') or getattr(self, '_delete', False)
+        with self.db._get_conn(write=write) as conn:
             cursor = conn.cursor()
+            # Plain tuples: _fetch_dicts zips them with the column names once per query.
+            cursor.row_factory = None
             
             # Handle INSERT
             if hasattr(self, '_insert_data'):
-                data = self._insert_data
-                # Handle arrays (hashtags, keywords)
-                for key, value in data.items():
-                    if isinstance(value, list):
-                        data[key] = json.dumps(value)
-                
-                # Generate ID if not provided
-                if 'id' not in data:
-                    import uuid
-                    data['id'] = str(uuid.uuid4())
-                
-                columns = ', '.join(self._validate_column_name(key) for key in data.keys())
-                placeholders = ', '.join(['?' for _ in data])
-                sql = f'INSERT INTO "{self._validate_table_name()}" ({columns}) VALUES ({placeholders})'
-                cursor.execute(sql, tuple(data.values()))
-                
-                # Return inserted row
-                cursor.execute(f'SELECT * FROM "{self._validate_table_name()}" WHERE "id" = ?', (data['id'],))
-                rows = [self._row_to_dict(row) for row in cursor.fetchall()]
+                records = self._insert_data if isinstance(self._insert_data, list) else [self._insert_data]
+                if not records:
+                    return SQLiteResult([])
+                on_conflict = getattr(self, "_on_conflict", None)
+                if on_conflict:
+                    for column in on_conflict:
+                        self._validate_column_name(column)
+                # Keyed tables such as system_status have no id column to fill in.
+                has_id = "id" in self._get_allowed_columns()
+                inserted_ids = []
+                # Rows sharing a column layout are written together.
+                batches: Dict[tuple, List[tuple]] = {}
+                for data in records:
+                    _encode_json_columns(data)
+
+                    # Generate ID if not provided
+                    if has_id and 'id' not in data:
+                        data["id"] = str(uuid4())
+
+                    batches.setdefault(tuple(data.keys()), []).append(tuple(data.values()))
+                    inserted_ids.append(data.get('id'))
+
+                table_name = self._validate_table_name()
+                rows = []
+                for keys, values in batches.items():
+                    for key in keys:
+                        self._validate_column_name(key)
+                    if not _SQLITE_HAS_RETURNING:
+                        cursor.executemany(_insert_sql(table_name, keys, 1, False, on_conflict), values)
+                        continue
+                    # One multi-row INSERT ... RETURNING per chunk hands back the stored
+                    # rows (defaults included) without a second SELECT.
+                    step = max(1, _SQLITE_MAX_VARIABLES // len(keys))
+                    for start in range(0, len(values), step):
+                        chunk = values[start : start + step]
+                        cursor.execute(
+                            _insert_sql(table_name, keys, len(chunk), True, on_conflict),
+                            tuple(value for row in chunk for value in row),
+                        )
+                        rows.extend(self._fetch_dicts(cursor))
+
+                if not _SQLITE_HAS_RETURNING and has_id:
+                    cursor.execute(
+                        _select_sql(table_name, "*", (("id", "IN", len(inserted_ids)),), None, None),
+                        tuple(inserted_ids),
+                    )
+                    rows = self._fetch_dicts(cursor)
+                # RETURNING (like IN) does not guarantee order; restore insertion order.
+                position = {row_id: index for index, row_id in enumerate(inserted_ids)}
+                rows.sort(key=lambda row: position.get(row.get("id"), len(position)))
                 return SQLiteResult(rows)
             
             # Handle UPDATE
             if hasattr(self, '_update_data'):
                 data = self._update_data
-                for key, value in data.items():
-                    if isinstance(value, list):
-                        data[key] = json.dumps(value)
-                
-                set_clause = ', '.join([f"{self._validate_column_name(k)} = ?" for k in data.keys()])
-                where_clause, where_params = self._build_where()
-                sql = f'UPDATE "{self._validate_table_name()}" SET {set_clause}'
-                if where_clause:
-                    sql += f" WHERE {where_clause}"
+                _encode_json_columns(data)
                 
-                cursor.execute(sql, tuple(data.values()) + where_params)
+                keys = tuple(data.keys())
+                for key in keys:
+                    self._validate_column_name(key)
+                where_shape, where_params = self._build_where()
+                table_name = self._validate_table_name()
+                cursor.execute(_update_sql(table_name, keys, where_shape), tuple(data.values()) + where_params)
                 
                 # Return updated rows
-                select_sql = f'SELECT * FROM "{self._validate_table_name()}"'
-                if where_clause:
-                    select_sql += f" WHERE {where_clause}"
-                cursor.execute(select_sql, where_params)
-                rows = [self._row_to_dict(row) for row in cursor.fetchall()]
+                cursor.execute(_select_sql(table_name, "*", where_shape, None, None), where_params)
+                rows = self._fetch_dicts(cursor)
                 return SQLiteResult(rows)
             
             # Handle DELETE
             if hasattr(self, '_delete') and self._delete:
-                where_clause, where_params = self._build_where()
-                sql = f'DELETE FROM "{self._validate_table_name()}"'
-                if where_clause:
-                    sql += f" WHERE {where_clause}"
-                cursor.execute(sql, where_params)
+                where_shape, where_params = self._build_where()
+                cursor.execute(_delete_sql(self._validate_table_name(), where_shape), where_params)
                 return SQLiteResult([])
             
             # Handle SELECT
-            sql = f'SELECT {self._select_cols} FROM "{self._validate_table_name()}"'
-            where_clause, where_params = self._build_where()
-            if where_clause:
-                sql += f" WHERE {where_clause}"
-            
+            where_shape, where_params = self._build_where()
+            if self._head:
+                cursor.execute(_select_sql(self._validate_table_name(), "COUNT(*)", where_shape, None, None), where_params)
+                return SQLiteResult([], count=cursor.fetchone()[0])
+            order = None
             if self._order:
                 col, desc = self._order
-                sql += f" ORDER BY {self._validate_column_name(col)} {'DESC' if desc else 'ASC'}"
-            
-            if self._limit:
-                sql += f" LIMIT {self._limit}"
+                self._validate_column_name(col)
+                order = (col, bool(desc))
+            sql = _select_sql(self._validate_table_name(), self._select_cols, where_shape, order, self._limit)
             
             cursor.execute(sql, where_params)
-            rows = [self._row_to_dict(row) for row in cursor.fetchall()]
+            rows = self._fetch_dicts(cursor)
             
             if self._single:
                 return SQLiteResult(rows[0] if rows else None, single=True)
             return SQLiteResult(rows)
     
     def _build_where(self) -> tuple:
-        """Build WHERE clause and parameters."""
-        if not self._where:
-            return "", ()
-        
-        clauses = []
-        params = []
-        
-        for col, op, val in self._where:
-            if op == "IN":
-                placeholders = ', '.join(['?' for _ in val])
-                clauses.append(f"{self._validate_column_name(col)} IN ({placeholders})")
-                params.extend(val)
-            else:
-                clauses.append(f"{self._validate_column_name(col)} {op} ?")
-                params.append(val)
-        
-        return " AND ".join(clauses), tuple(params)
-    
-    def _row_to_dict(self, row: sqlite3.Row) -> Dict:
-        """Convert SQLite row to dict, parsing JSON fields."""
-        d = dict(row)
-        # Parse JSON arrays
-        for key in ['hashtags', 'keywords']:
-            if key in d and d[key]:
-                try:
-                    d[key] = json.loads(d[key])
-                except (TypeError, json.JSONDecodeError) as exc:
-                    logger.warning("Could not decode SQLite JSON field %s: %s", key, exc)
-        return d
+        """Validate filters and return their (shape, parameters) for the SQL cache."""
+        where = self._where
+        if not where:
+            return (), ()
+        allowed = self._get_allowed_columns()
+        for col, _op, _val in where:
+            if col not in allowed:
+                raise ValueError(f"Invalid column name for {self.table_name}: {col}")
+        if len(where) == 1 and where[0][1] != "IN":
+            # Common case: a single comparison filter.
+            col, op, val = where[0]
+            return ((col, op, 1),), (val,)
+        shape = tuple((col, op, len(val) if op == "IN" else 1) for col, op, val in where)
+        params = tuple(chain.from_iterable(val if op == "IN" else (val,) for _col, op, val in where))
+        return shape, params
+    
+    def _fetch_dicts(self, cursor: sqlite3.Cursor) -> List[Dict]:
+        """Materialize the cursor's rows as dicts, decoding JSON array columns."""
+        names = [column[0] for column in cursor.description]
+        rows = [dict(zip(names, row, strict=True)) for row in cursor.fetchall()]
+        # Only the JSON columns actually selected are checked, once per query.
+        for key in _JSON_ARRAY_COLUMNS.intersection(names):
+            for d in rows:
+                if d[key]:
+                    try:
+                        d[key] = config.json_loads(d[key])
+                    except (TypeError, ValueError) as exc:
+                        logger.warning("Could not decode SQLite JSON field %s: %s", key, exc)
+        return rows
+
+
+def _rpc_processed_content_status_counts(db: SQLiteDB, params: Dict) -> List[Dict]:
+    """Local twin of migrations/004: one GROUP BY instead of a count per status."""
+    statuses = list(params.get("p_statuses") or [])
+    if not statuses:
+        return []
+    placeholders = ", ".join(["?"] * len(statuses))
+    return db.execute(
+        'SELECT "status", COUNT(*) AS "count" FROM "processed_content" '
+        f'WHERE "user_id" = ? AND "status" IN ({placeholders}) GROUP BY "status"',
+        (params.get("p_user_id"), *statuses),
+    )
+
+
+# Postgres functions called through db.rpc(), answered by SQL shims in SQLite mode.
+_SQLITE_RPCS = {
+    "processed_content_status_counts": _rpc_processed_content_status_counts,
+}
+
+
+class SQLiteRPC:
+    """Deferred RPC call that mimics the Supabase ``rpc(...).execute()`` chain."""
+
+    def __init__(self, db: SQLiteDB, name: str, params: Dict):
+        self.db = db
+        self.name = name
+        self.params = params
+
+    def execute(self) -> "SQLiteResult":
+        return SQLiteResult(_SQLITE_RPCS[self.name](self.db, self.params))
 
 
 class SQLiteResult:
@@ -451,12 +709,14 @@ class SQLiteResult:
     Result wrapper that mimics Supabase response.
     """
     
-    def __init__(self, data: Any, single: bool = False):
+    def __init__(self, data: Any, single: bool = False, count: Optional[int] = None):
         if single:
             self.data = data
         else:
             self.data = data if data else []
-        self.count = len(self.data) if isinstance(self.data, list) else (1 if self.data else 0)
+        if count is None:
+            count = len(self.data) if isinstance(self.data, list) else (1 if self.data else 0)
+        self.count = count
 
 
 class SupabaseWrapper:
@@ -465,30 +725,25 @@ class SupabaseWrapper:
     """
     
     def __init__(self):
-        from supabase import create_client
-        from supabase.lib.client_options import SyncClientOptions
-        url = config.require_env("SUPABASE_URL")
-        key = config.require_env("SUPABASE_KEY")
-        self._client = create_client(
-            url,
-            key,
-            options=SyncClientOptions(
-                postgrest_client_timeout=config.HTTP_TIMEOUT_SECONDS,
-                storage_client_timeout=int(config.HTTP_TIMEOUT_SECONDS),
-                function_client_timeout=int(min(max(config.HTTP_TIMEOUT_SECONDS, 1), 30)),
-            ),
-        )
+        # Reuse the process-wide service client so the adapter and raw SDK
+        # callers share one HTTP connection pool instead of two.
+        self._client = config.get_supabase_service_client()
         logger.info("✅ Supabase database connected")
     
     def table(self, name: str):
         """Get table interface."""
         return self._client.table(name)
 
+    def rpc(self, name: str, params: Optional[Dict] = None):
+        """Call a Postgres function through PostgREST."""
+        return self._client.rpc(name, params or {})
+
 
 # Global database instance cache keyed by the active env signature so tests and
 # runtime config changes do not keep a stale backend alive forever.
 _db_instance = None
 _db_signature = None
+_db_lock = threading.Lock()
 
 
 def get_db():
@@ -511,28 +766,33 @@ def get_db():
 
     if _db_instance is not None and _db_signature == signature:
         return _db_instance
-    
-    # Check if Supabase is configured and desired
-    use_supabase = (
-        db_mode == "supabase" and
-        supabase_url and
-        supabase_key
-    )
-    
-    if use_supabase:
-        try:
-            _db_instance = SupabaseWrapper()
-            _db_signature = signature
-            logger.info("📡 Using Supabase (cloud)")
-        except Exception as e:
-            logger.warning(f"Supabase failed, falling back to SQLite: {e}")
+
+    with _db_lock:
+        # Another thread may have built the adapter while we waited.
+        if _db_instance is not None and _db_signature == signature:
+            return _db_instance
+
+        # Check if Supabase is configured and desired
+        use_supabase = (
+            db_mode == "supabase" and
+            supabase_url and
+            supabase_key
+        )
+
+        if use_supabase:
+            try:
+                _db_instance = SupabaseWrapper()
+                _db_signature = signature
+                logger.info("📡 Using Supabase (cloud)")
+            except Exception as e:
+                logger.warning(f"Supabase failed, falling back to SQLite: {e}")
+                _db_instance = SQLiteDB()
+                _db_signature = (db_mode, "", "")
+        else:
             _db_instance = SQLiteDB()
-            _db_signature = (db_mode, "", "")
-    else:
-        _db_instance = SQLiteDB()
-        _db_signature = signature
-        logger.info("💾 Using SQLite (local)")
-    
+            _db_signature = signature
+            logger.info("💾 Using SQLite (local)")
+
     return _db_instance
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import time
 from datetime import datetime, timezone
 from types import SimpleNamespace
@@ -14,6 +15,10 @@ from ai_provider import AIProviderError, generate as run_ai_generation
 
 logger = config.get_logger("ai_generator")
 
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_UNESCAPED_QUOTE_RE = re.compile(r'(?<!\\)"')
+_FLAT_OBJECT_RE = re.compile(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}")
+
 
 # Batch prompt template - generates content for multiple articles in one call.
 # The prompt was originally adapted from an internal local writing reference and
@@ -295,13 +300,13 @@ def build_regeneration_prompt(
     format_name = normalize_content_format(content_format)
     hook = existing_content.get("hook", "")
     body = existing_content.get("generated_text", "")
+    content_prefix = f"Current content:\n{body}\n\nExisting metadata:\n"
+    # The summary is cut at _PROMPT_SUMMARY_LIMIT, so skip serialising metadata that would be dropped.
+    metadata = "" if len(content_prefix) >= _PROMPT_SUMMARY_LIMIT else json.dumps(existing_content, ensure_ascii=False)
     prompt = build_generation_prompt(
         {
             "title": hook or existing_content.get("title", "") or "Existing draft",
-            "content": (
-                f"Current content:\n{body}\n\n"
-                f"Existing metadata:\n{json.dumps(existing_content, ensure_ascii=False)}"
-            ),
+            "content": content_prefix + metadata,
         },
         format_name,
         language,
@@ -312,11 +317,13 @@ def build_regeneration_prompt(
     return prompt
 
 
-def _build_single_prompt(article: dict, content_format: str, language: str, tone: str) -> str:
-    title = article.get("title", "")
-    summary = (article.get("content") or "")[:1200]
-    if content_format == "carousel":
-        return f"""You create publishable Facebook carousel content.
+# Article content beyond this many characters is not sent to the model.
+_PROMPT_SUMMARY_LIMIT = 1200
+_PROMPT_TITLE_LIMIT = 200
+
+# Per-format prompt templates, filled with str.format() so the literals are built once at import.
+_FORMAT_PROMPT_TEMPLATES: Dict[str, str] = {
+    "carousel": """You create publishable Facebook carousel content.
 
 Target language: {language}
 Target tone: {tone}
@@ -344,9 +351,8 @@ Rules:
 - Each headline must be maximum 8 words.
 - Each body must be maximum 20 words.
 - Keep slides concise, clear, and publishable.
-"""
-    if content_format == "story_sequence":
-        return f"""You create Instagram and Facebook story sequences.
+""",
+    "story_sequence": """You create Instagram and Facebook story sequences.
 
 Target language: {language}
 Target tone: {tone}
@@ -369,9 +375,8 @@ Return JSON only:
 Rules:
 - Return exactly 3 frames.
 - Keep each frame short and visual.
-"""
-    if content_format == "reel_script":
-        return f"""You create short-form reel scripts.
+""",
+    "reel_script": """You create short-form reel scripts.
 
 Target language: {language}
 Target tone: {tone}
@@ -390,8 +395,8 @@ Return JSON only:
 Rules:
 - Give exactly 3 points.
 - Make it clear enough for a creator to record manually.
-"""
-    return f"""You create concise social media posts for Facebook and Instagram.
+""",
+    "post": """You create concise social media posts for Facebook and Instagram.
 
 Target language: {language}
 Target tone: {tone}
@@ -407,7 +412,18 @@ Return JSON only:
   "cta": "Call to action",
   "hashtags": ["tag1", "tag2"]
 }}
-"""
+""",
+}
+
+
+def _build_single_prompt(article: dict, content_format: str, language: str, tone: str) -> str:
+    template = _FORMAT_PROMPT_TEMPLATES.get(content_format, _FORMAT_PROMPT_TEMPLATES["post"])
+    return template.format(
+        language=language,
+        tone=tone,
+        title=str(article.get("title") or "")[:_PROMPT_TITLE_LIMIT],
+        summary=(article.get("content") or "")[:_PROMPT_SUMMARY_LIMIT],
+    )
 
 
 class ProviderTextClient:
@@ -487,10 +503,8 @@ def _generate_text(client, prompt: str, max_tokens: int, temperature: float) ->
 
 def fix_json_string(text: str) -> str:
     """Attempt to fix common JSON issues from LLM output."""
-    import re
-
     # Remove trailing commas before } or ]
-    text = re.sub(r",\s*([}\]])", r"\1", text)
+    text = _TRAILING_COMMA_RE.sub(r"\1", text)
 
     # Fix unescaped newlines in strings
     # This is a simplified fix - handles common cases
@@ -499,7 +513,7 @@ def fix_json_string(text: str) -> str:
     in_string = False
     for line in lines:
         # Count unescaped quotes to track if we're in a string
-        quote_count = len(re.findall(r'(?<!\\)"', line))
+        quote_count = len(_UNESCAPED_QUOTE_RE.findall(line))
         if in_string:
             # If we're continuing a string from previous line, escape this line
             fixed_lines.append(line.replace("\n", "\\n"))
@@ -512,6 +526,36 @@ def fix_json_string(text: str) -> str:
     return "\n".join(fixed_lines)
 
 
+def _extract_balanced_json(text: str, start: int) -> Optional[str]:
+    """Return the JSON value opening at ``start`` up to its matching bracket.
+
+    Single linear scan that skips brackets inside string literals, so trailing
+    prose or a second JSON fragment after the payload is not swallowed.
+    Returns None when the value is never closed (e.g. a truncated response).
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+            if depth == 0:
+                return text[start : index + 1]
+    return None
+
+
 def parse_json_response(text: str) -> any:
     """Extract and parse JSON from model response with error recovery."""
     stripped = text.strip()
@@ -536,28 +580,32 @@ def parse_json_response(text: str) -> any:
 
     if start_array != -1 and (start_obj == -1 or start_array < start_obj):
         # It's an array
-        end = stripped.rfind("]")
-        if end != -1:
-            json_text = stripped[start_array : end + 1]
+        json_text = _extract_balanced_json(stripped, start_array)
+        if json_text is None:
+            end = stripped.rfind("]")
+            if end != -1:
+                json_text = stripped[start_array : end + 1]
     elif start_obj != -1:
         # It's an object
-        end = stripped.rfind("}")
-        if end != -1:
-            json_text = stripped[start_obj : end + 1]
+        json_text = _extract_balanced_json(stripped, start_obj)
+        if json_text is None:
+            end = stripped.rfind("}")
+            if end != -1:
+                json_text = stripped[start_obj : end + 1]
 
     if json_text is None:
         raise ValueError(f"No valid JSON found in response: {stripped[:200]}...")
 
     # Try parsing directly first
     try:
-        return json.loads(json_text)
+        return config.json_loads(json_text)
     except json.JSONDecodeError:
         pass
 
     # Try fixing common issues
     try:
         fixed = fix_json_string(json_text)
-        return json.loads(fixed)
+        return config.json_loads(fixed)
     except json.JSONDecodeError:
         pass
 
@@ -565,14 +613,12 @@ def parse_json_response(text: str) -> any:
     if json_text.startswith("["):
         try:
             # Try to find complete objects
-            import re
-
-            objects = re.findall(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", json_text)
+            objects = _FLAT_OBJECT_RE.findall(json_text)
             if objects:
                 results = []
                 for obj in objects:
                     try:
-                        results.append(json.loads(obj))
+                        results.append(config.json_loads(obj))
                     except json.JSONDecodeError:
                         continue
                 if results:
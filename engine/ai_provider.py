@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from time import perf_counter, sleep
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import requests
 
 import config
+from retry_utils import RetryConfig, calculate_delay
 
 logger = config.get_logger("ai_provider")
 
@@ -318,6 +320,70 @@ def _log_validation_latency(provider_name: str, model: str, started_at: float) -
     )
 
 
+def _iter_sse_events(response: requests.Response) -> Iterator[Dict[str, Any]]:
+    """Yield the JSON payload of each ``data:`` line of a server-sent event stream."""
+    for raw_line in response.iter_lines():
+        line = raw_line.decode("utf-8") if isinstance(raw_line, bytes) else raw_line
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            break
+        try:
+            yield config.json_loads(data)
+        except ValueError:
+            logger.debug("Skipping undecodable stream event: %s", data[:200])
+
+
+def _read_until_json_closes(chunks: Iterable[str]) -> str:
+    """Accumulate streamed text and stop once the answer's JSON value is complete.
+
+    Reading stops early only when the closed value is an object, or when it
+    opened at the first non-whitespace character (a bare top-level array).
+    Prose brackets such as ``[note]`` or ``[1]`` are skipped, even when they
+    happen to parse, and brackets inside string literals are ignored.
+    Otherwise everything streamed is returned for the caller to parse.
+    """
+    text = ""
+    start = -1
+    depth = 0
+    in_string = False
+    escaped = False
+    for chunk in chunks:
+        if not chunk:
+            continue
+        scanned = len(text)
+        text += chunk
+        for index in range(scanned, len(text)):
+            char = text[index]
+            if start == -1:
+                if char in "[{":
+                    start, depth = index, 1
+            elif in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in "[{":
+                depth += 1
+            elif char in "]}":
+                depth -= 1
+                if depth == 0:
+                    try:
+                        config.json_loads(text[start : index + 1])
+                    except ValueError:
+                        start = -1
+                        continue
+                    if text[start] == "{" or not text[:start].strip():
+                        return text[: index + 1]
+                    start = -1
+    return text
+
+
 @dataclass
 class BaseAIProvider:
     """Base provider contract."""
@@ -334,6 +400,15 @@ class BaseAIProvider:
     ) -> str:
         raise NotImplementedError
 
+    def generate_json(
+        self,
+        prompt: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.7,
+    ) -> str:
+        """Generate a JSON answer; streaming providers return once the value closes."""
+        return self.generate(prompt, max_tokens=max_tokens, temperature=temperature)
+
     def test_connection(self) -> Dict:
         raise NotImplementedError
 
@@ -364,7 +439,11 @@ class BaseAIProvider:
 
 
 class GeminiProvider(BaseAIProvider):
-    """Wrapper around the internal Gemini implementation."""
+    """Wrapper around the internal Gemini implementation.
+
+    JSON answers use the base ``generate_json`` so they also go through
+    GeminiClient's pooled session, split timeouts and reply cache.
+    """
 
     def generate(
         self,
@@ -521,14 +600,26 @@ class OpenRouterProvider(BaseAIProvider):
             "X-Title": OPENROUTER_TITLE,
         }
 
-    def _post(self, payload: Dict[str, Any]) -> requests.Response:
+    def _post(self, payload: Dict[str, Any], stream: bool = False) -> requests.Response:
+        kwargs: Dict[str, Any] = {"stream": True} if stream else {}
         return requests.post(
             self.BASE_URL,
             headers=self._headers(),
             json=payload,
             timeout=config.HTTP_TIMEOUT_SECONDS,
+            **kwargs,
         )
 
+    @staticmethod
+    def _stream_deltas(response: requests.Response) -> Iterator[str]:
+        for event in _iter_sse_events(response):
+            if event.get("error"):
+                error = event["error"]
+                raise RuntimeError(str(error.get("message") if isinstance(error, dict) else error))
+            choices = event.get("choices") or []
+            if choices:
+                yield _extract_openai_like_content((choices[0].get("delta") or {}).get("content") or "")
+
     def generate(
         self,
         prompt: str,
@@ -559,6 +650,31 @@ class OpenRouterProvider(BaseAIProvider):
             raise RuntimeError("OpenRouter returned empty content.")
         return content
 
+    def generate_json(
+        self,
+        prompt: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.7,
+    ) -> str:
+        self._require_api_key()
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+        }
+        try:
+            # Leaving the block closes the stream, so trailing tokens after the JSON are never read.
+            with self._post(payload, stream=True) as response:
+                response.raise_for_status()
+                content = _read_until_json_closes(self._stream_deltas(response))
+        except requests.RequestException as exc:
+            raise RuntimeError(_friendly_error_message(self.provider_name, self.model, raw_message=str(exc))) from exc
+        if not content:
+            raise RuntimeError("OpenRouter returned empty content.")
+        return content
+
     def test_connection(self) -> Dict:
         self._require_api_key()
         started_at = perf_counter()
@@ -595,8 +711,13 @@ PROVIDER_CLASS_MAP = {
 }
 
 
+@lru_cache(maxsize=1)
 def list_providers() -> List[Dict]:
-    """Return the provider catalog for settings UIs."""
+    """Return the provider catalog for settings UIs.
+
+    PROVIDER_CATALOG is static, so the listing is built once per process.
+    Callers share the returned list and must treat it as read-only.
+    """
     return [
         {
             "id": provider_id,
@@ -646,6 +767,41 @@ def test_ai_key(provider: str, api_key: str, model: str = "") -> Dict:
     return client.test_connection()
 
 
+_AI_RETRY_CONFIG = RetryConfig(base_delay=1.0, max_delay=30.0)
+_NON_RETRYABLE_STATUS_CODES = {400, 401, 403, 404}
+_NON_RETRYABLE_MARKERS = (
+    "invalid api key",
+    "incorrect api key",
+    "no api key configured",
+    # Google reports a bad or restricted key as INVALID_ARGUMENT / PERMISSION_DENIED.
+    "api key not valid",
+    "api_key_invalid",
+    "permission_denied",
+)
+
+
+def _is_retryable_generation_error(exc: Exception) -> bool:
+    """Return False for errors that another attempt cannot fix (bad key, unknown model).
+
+    Providers wrap HTTP failures in plain ``RuntimeError``s, so the status code
+    and message are looked up along the whole ``__cause__``/``__context__`` chain.
+    """
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        status_code = getattr(current, "status_code", None) or getattr(
+            getattr(current, "response", None), "status_code", None
+        )
+        if status_code in _NON_RETRYABLE_STATUS_CODES:
+            return False
+        message = str(current).lower()
+        if any(marker in message for marker in _NON_RETRYABLE_MARKERS):
+            return False
+        current = current.__cause__ or current.__context__
+    return True
+
+
 def _generate_with_retry(
     provider_name: str,
     api_key: str,
@@ -654,12 +810,14 @@ def _generate_with_retry(
     max_tokens: int,
     temperature: float,
     retries: int = 3,
+    json_response: bool = False,
 ) -> str:
     provider = get_provider(name=provider_name, api_key=api_key, model=model)
+    run = provider.generate_json if json_response else provider.generate
     last_error = ""
     for attempt in range(1, retries + 1):
         try:
-            return provider.generate(
+            return run(
                 prompt,
                 max_tokens=max_tokens,
                 temperature=temperature,
@@ -674,8 +832,11 @@ def _generate_with_retry(
                 retries,
                 last_error,
             )
+            if not _is_retryable_generation_error(exc):
+                break
             if attempt < retries:
-                sleep(min(attempt, 2))
+                # Exponential backoff with jitter so concurrent 429s do not retry in lockstep.
+                sleep(calculate_delay(attempt - 1, _AI_RETRY_CONFIG))
     raise AIProviderError(provider_name, model, last_error)
 
 
@@ -684,12 +845,14 @@ def generate(
     user_config: Any,
     max_tokens: int = 2048,
     temperature: float = 0.7,
+    json_response: bool = False,
 ) -> str:
     """
     Unified provider entry point used by the engine.
 
     Applies retries and optional provider fallback before surfacing a user-safe
-    error back to the caller.
+    error back to the caller. With ``json_response`` the answer is streamed
+    where the provider supports it and returned as soon as the JSON closes.
     """
     provider_name = _resolve_provider_name(user_config)
     model = _resolve_model(user_config, provider_name)
@@ -704,6 +867,7 @@ def generate(
             prompt=prompt,
             max_tokens=max_tokens,
             temperature=temperature,
+            json_response=json_response,
         )
     except AIProviderError as exc:
         primary_error = exc
@@ -725,6 +889,7 @@ def generate(
                 prompt=prompt,
                 max_tokens=max_tokens,
                 temperature=temperature,
+                json_response=json_response,
             )
         except AIProviderError as fallback_exc:
             message = (
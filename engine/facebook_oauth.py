@@ -34,19 +34,58 @@ Usage:
 from __future__ import annotations
 
 import os
+import re
 import json
 import base64
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import config
 
+try:
+    from cryptography.fernet import Fernet
+except ImportError:  # pragma: no cover - tokens fall back to base64 without cryptography
+    Fernet = None
+
 logger = config.get_logger("facebook_oauth")
 
+# Serialises read-modify-write cycles on .env between concurrent OAuth callbacks.
+_env_file_lock = threading.Lock()
+
+# One pooled session for every Graph call in this module: the OAuth callback
+# makes several sequential requests, and keep-alive skips a TCP+TLS handshake
+# on each one after the first. Transient GET failures are retried with backoff.
+# Read timeouts are not retried and status retries are capped at two, so one
+# stalled Graph call spends at most three 30s read windows — well inside the
+# gunicorn worker timeout that would otherwise kill the OAuth callback.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            read=0,
+            status=2,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+
 # Facebook OAuth config
 FB_APP_ID = os.getenv("FB_APP_ID", "")
 FB_APP_SECRET = os.getenv("FB_APP_SECRET", "")
@@ -71,43 +110,74 @@ FB_PERMISSIONS = [
 # Token storage
 TOKEN_FILE = Path(__file__).parent / ".fb_tokens.json"
 
+# Decrypted tokens keyed by the token file's (mtime_ns, size); load_tokens()
+# re-reads and re-decrypts only after the file changes.
+_token_cache: Optional[Tuple[Tuple[int, int], Dict]] = None
+_token_cache_lock = threading.Lock()
+
+# /me/accounts responses keyed by a truncated SHA-256 of the user token (the
+# raw token never becomes a dict key), each stamped with time.monotonic().
+PAGES_CACHE_TTL_SECONDS = 300
+_pages_cache: Dict[str, Tuple[float, List[Dict]]] = {}
+_pages_cache_lock = threading.Lock()
+
 # Simple encryption key (in production, use proper key management)
+@lru_cache(maxsize=1)
 def _get_encryption_key() -> bytes:
     """Get or create encryption key for token storage."""
     key_file = Path(__file__).parent / ".fb_key"
     if key_file.exists():
         return key_file.read_bytes()
     else:
-        try:
-            from cryptography.fernet import Fernet
-            key = Fernet.generate_key()
-            key_file.write_bytes(key)
-            return key
-        except ImportError:
+        if Fernet is None:
             # Fallback: use base64 encoding (less secure but works without cryptography)
             return base64.b64encode(b"content-factory-v2-key-123456")
+        key = Fernet.generate_key()
+        key_file.write_bytes(key)
+        return key
+
+
+@lru_cache(maxsize=1)
+def _get_fernet():
+    """Return the Fernet instance for token storage, or None without cryptography."""
+    return Fernet(_get_encryption_key()) if Fernet is not None else None
 
 
 def _encrypt_token(token: str) -> str:
     """Encrypt token for storage."""
-    try:
-        from cryptography.fernet import Fernet
-        f = Fernet(_get_encryption_key())
-        return f.encrypt(token.encode()).decode()
-    except ImportError:
+    fernet = _get_fernet()
+    if fernet is None:
         # Fallback: simple base64
         return base64.b64encode(token.encode()).decode()
+    return fernet.encrypt(token.encode()).decode()
 
 
 def _decrypt_token(encrypted: str) -> str:
     """Decrypt stored token."""
-    try:
-        from cryptography.fernet import Fernet
-        f = Fernet(_get_encryption_key())
-        return f.decrypt(encrypted.encode()).decode()
-    except ImportError:
+    fernet = _get_fernet()
+    if fernet is None:
         # Fallback: simple base64
         return base64.b64decode(encrypted.encode()).decode()
+    return fernet.decrypt(encrypted.encode()).decode()
+
+
+def _graph_get(url: str, params: Dict, timeout: int = 30) -> Dict:
+    """GET a Graph API URL on the pooled session and decode the JSON body.
+
+    ``timeout`` bounds the read; connecting is capped separately so an
+    unreachable Graph endpoint fails fast.
+    Raises ``requests.RequestException`` for transport and HTTP errors, and
+    ``requests.exceptions.InvalidJSONError`` (also a ``RequestException``, as
+    with ``response.json()``) when the body is not JSON, e.g. a proxy error page.
+    """
+    response = _SESSION.get(url, params=params, timeout=(config.HTTP_CONNECT_TIMEOUT_SECONDS, timeout))
+    response.raise_for_status()
+    try:
+        return config.json_loads(response.content)
+    except ValueError as exc:
+        raise requests.exceptions.InvalidJSONError(
+            f"Graph API returned a non-JSON body: {exc}", response=response
+        ) from exc
 
 
 def get_oauth_url(state: str = "content_factory") -> str:
@@ -123,17 +193,21 @@ def get_oauth_url(state: str = "content_factory") -> str:
     if not FB_APP_ID:
         raise ValueError("FB_APP_ID not configured in .env")
     
+    url = _oauth_url_prefix(FB_APP_ID, FB_REDIRECT_URI) + quote_plus(state)
+    logger.info("Generated OAuth URL for Facebook login")
+    return url
+
+
+@lru_cache(maxsize=4)
+def _oauth_url_prefix(app_id: str, redirect_uri: str) -> str:
+    """Encode the static part of the OAuth dialog URL once; only ``state`` varies per call."""
     params = {
-        "client_id": FB_APP_ID,
-        "redirect_uri": FB_REDIRECT_URI,
+        "client_id": app_id,
+        "redirect_uri": redirect_uri,
         "scope": ",".join(FB_PERMISSIONS),
         "response_type": "code",
-        "state": state,
     }
-    
-    url = f"https://www.facebook.com/v19.0/dialog/oauth?{urlencode(params)}"
-    logger.info("Generated OAuth URL for Facebook login")
-    return url
+    return f"https://www.facebook.com/v19.0/dialog/oauth?{urlencode(params)}&state="
 
 
 def exchange_code_for_token(code: str) -> Dict:
@@ -158,9 +232,7 @@ def exchange_code_for_token(code: str) -> Dict:
     }
     
     try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        data = _graph_get(url, params)
         
         if "error" in data:
             raise ValueError(f"Facebook error: {data['error']['message']}")
@@ -195,9 +267,7 @@ def get_long_lived_token(short_token: str) -> Dict:
     }
     
     try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        data = _graph_get(url, params)
         
         if "error" in data:
             raise ValueError(f"Facebook error: {data['error']['message']}")
@@ -220,6 +290,12 @@ def get_user_pages(access_token: str) -> List[Dict]:
     Returns:
         List of page dicts with id, name, access_token
     """
+    cache_key = hashlib.sha256(access_token.encode()).hexdigest()[:16]
+    with _pages_cache_lock:
+        cached = _pages_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < PAGES_CACHE_TTL_SECONDS:
+            return [dict(page) for page in cached[1]]
+
     url = "https://graph.facebook.com/v19.0/me/accounts"
     params = {
         "access_token": access_token,
@@ -227,12 +303,12 @@ def get_user_pages(access_token: str) -> List[Dict]:
     }
     
     try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        data = _graph_get(url, params)
         
         pages = data.get("data", [])
         logger.info(f"✅ Found {len(pages)} managed pages")
+        with _pages_cache_lock:
+            _pages_cache[cache_key] = (time.monotonic(), [dict(page) for page in pages])
         return pages
         
     except requests.RequestException as e:
@@ -240,6 +316,12 @@ def get_user_pages(access_token: str) -> List[Dict]:
         raise
 
 
+def invalidate_pages_cache() -> None:
+    """Drop cached /me/accounts responses so the next get_user_pages() hits the Graph API."""
+    with _pages_cache_lock:
+        _pages_cache.clear()
+
+
 def get_page_token(user_token: str, page_id: str) -> str:
     """
     Get page access token for a specific page.
@@ -258,9 +340,7 @@ def get_page_token(user_token: str, page_id: str) -> str:
     }
     
     try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        data = _graph_get(url, params)
         
         page_token = data.get("access_token")
         if not page_token:
@@ -353,8 +433,12 @@ def save_tokens(
         "instagram_username": instagram_username,
     }
 
-    with open(TOKEN_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    global _token_cache
+    with _token_cache_lock:
+        with open(TOKEN_FILE, "w") as f:
+            json.dump(data, f, indent=2)
+        _token_cache = None
+    invalidate_pages_cache()
 
     # Also update .env for backward compatibility
     env_file = Path(__file__).parent / ".env"
@@ -379,18 +463,26 @@ def load_tokens() -> Optional[Dict]:
     Returns:
         Dict with decrypted tokens, or None if not found
     """
-    if not TOKEN_FILE.exists():
+    global _token_cache
+    try:
+        stat = TOKEN_FILE.stat()
+    except OSError:
         return None
     
     try:
-        with open(TOKEN_FILE, "r") as f:
-            data = json.load(f)
-        
-        # Decrypt tokens
-        data["page_token"] = _decrypt_token(data["page_token"])
-        data["user_token"] = _decrypt_token(data["user_token"])
-        
-        return data
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with _token_cache_lock:
+            if _token_cache is not None and _token_cache[0] == signature:
+                return dict(_token_cache[1])
+
+            data = config.json_loads(TOKEN_FILE.read_bytes())
+            
+            # Decrypt tokens
+            data["page_token"] = _decrypt_token(data["page_token"])
+            data["user_token"] = _decrypt_token(data["user_token"])
+            
+            _token_cache = (signature, data)
+            return dict(data)
         
     except Exception as e:
         logger.error(f"Failed to load tokens: {e}")
@@ -437,23 +529,41 @@ def get_token_status() -> Dict:
     }
 
 
+def _set_env_key(text: str, key: str, value: str) -> str:
+    """Return ``text`` with ``key`` set to ``value``.
+
+    The first ``KEY=``/``export KEY=`` line is rewritten in place (keeping its
+    prefix) and later duplicates are dropped, since dotenv lets the last one
+    win. Missing keys are appended.
+    """
+    pattern = re.compile(rf"^([ \t]*(?:export[ \t]+)?){re.escape(key)}[ \t]*=.*(?:\n|\Z)", re.MULTILINE)
+    matches = list(pattern.finditer(text))
+    if not matches:
+        if text and not text.endswith("\n"):
+            text += "\n"
+        return f"{text}{key}={value}\n"
+
+    first = matches[0]
+    newline = "\n" if first.group(0).endswith("\n") else ""
+    pieces = [text[: first.start()], f"{first.group(1)}{key}={value}{newline}"]
+    position = first.end()
+    for duplicate in matches[1:]:
+        pieces.append(text[position : duplicate.start()])
+        position = duplicate.end()
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
 def _update_env_file(env_path: Path, updates: Dict[str, str]) -> None:
-    """Update .env file with new values."""
-    existing = {}
-    
-    if env_path.exists():
-        with open(env_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if "=" in line and not line.startswith("#"):
-                    key, value = line.split("=", 1)
-                    existing[key.strip()] = value.strip()
-    
-    existing.update(updates)
-    
-    with open(env_path, "w") as f:
-        for key, value in existing.items():
-            f.write(f"{key}={value}\n")
+    """Set keys in the .env file in place (comments and order kept), replacing it atomically."""
+    with _env_file_lock:
+        text = env_path.read_text() if env_path.exists() else ""
+
+        for key, value in updates.items():
+            text = _set_env_key(text, key, value)
+
+        # Atomic swap that keeps the file's mode (.env holds secrets, often 0600).
+        config.write_text_atomic(env_path, text)
 
 
 def test_connection() -> Dict:
@@ -476,9 +586,7 @@ def test_connection() -> Dict:
             "fields": "name,followers_count",
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = _graph_get(url, params, timeout=10)
         
         return {
             "success": True,
@@ -507,9 +615,7 @@ def get_instagram_account_for_page(page_id: str, page_access_token: str) -> Opti
         "access_token": page_access_token,
     }
     try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        data = _graph_get(url, params)
         ig_account = data.get("instagram_business_account")
         if ig_account and ig_account.get("id"):
             logger.info("Found Instagram Business Account: %s", ig_account.get("id"))
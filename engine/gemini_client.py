@@ -15,16 +15,50 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
 import time
+from collections import OrderedDict
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 import config
 
 logger = config.get_logger("gemini_client")
 
+# Clients are built per user and per provider call, so the keep-alive pool lives
+# at module level: repeated generate() calls reuse one TLS connection.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=8))
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Near-deterministic replies (temperature <= 0.2) are remembered so repeated
+# extraction prompts do not pay twice. Keys are 16-byte BLAKE2b digests of the
+# API key, model, settings and prompt, so a reply is only ever served back to
+# the credential that paid for it; oldest entries go first.
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.2
+_response_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(api_key: str, model: str, prompt: str, max_tokens: int, temperature: float) -> bytes:
+    """Return a fixed-size cache key for one generation request under one API key."""
+    return hashlib.blake2b(
+        f"{api_key}|{model}|{max_tokens}|{temperature}|{prompt}".encode(), digest_size=16
+    ).digest()
+
+
+class GeminiAPIError(RuntimeError):
+    """Non-200 reply from the Gemini API; ``status_code`` carries the HTTP status."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
 
 class GeminiClient:
     """
@@ -102,11 +136,29 @@ class GeminiClient:
         Raises:
             RuntimeError: If all providers fail
         """
+        cache_key = None
+        if self.gemini_key and temperature <= RESPONSE_CACHE_MAX_TEMPERATURE:
+            cache_key = _response_cache_key(self.gemini_key, self.model, prompt, max_tokens, temperature)
+            with _response_cache_lock:
+                cached = _response_cache.get(cache_key)
+                if cached is not None:
+                    _response_cache.move_to_end(cache_key)
+                    return cached
+
+        gemini_error: Optional[Exception] = None
+
         # Try Gemini first
         if self.gemini_key:
             try:
-                return self._call_gemini(prompt, max_tokens, temperature)
+                text = self._call_gemini(prompt, max_tokens, temperature)
+                if cache_key is not None:
+                    with _response_cache_lock:
+                        _response_cache[cache_key] = text
+                        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+                            _response_cache.popitem(last=False)
+                return text
             except Exception as e:
+                gemini_error = e
                 logger.warning("Gemini failed, trying fallback: %s", e)
         
         # Fallback to OpenRouter
@@ -118,7 +170,8 @@ class GeminiClient:
             except Exception as e:
                 logger.error("OpenRouter fallback failed: %s", e)
         
-        raise RuntimeError("All AI providers failed - check your API keys")
+        # Chain the Gemini failure so callers can still see its status code.
+        raise RuntimeError("All AI providers failed - check your API keys") from gemini_error
     
     def _call_gemini(
         self,
@@ -129,11 +182,9 @@ class GeminiClient:
         """Call Gemini API directly."""
         url = f"{self.GEMINI_BASE_URL}/models/{self.model}:generateContent"
         
-        headers = {
-            "Content-Type": "application/json",
-        }
-        
-        payload = {
+        # Serialized up front (orjson when available) and sent as raw bytes,
+        # which skips requests' own json.dumps pass.
+        body = config.json_dumps({
             "contents": [{
                 "parts": [{"text": prompt}]
             }],
@@ -141,29 +192,34 @@ class GeminiClient:
                 "temperature": temperature,
                 "maxOutputTokens": max_tokens,
             }
-        }
+        })
         
         params = {"key": self.gemini_key}
         
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 url,
-                headers=headers,
+                headers=_JSON_HEADERS,
                 params=params,
-                json=payload,
-                timeout=config.HTTP_TIMEOUT_SECONDS + 10,  # Gemini can be slow
+                data=body,
+                # Fail fast on connect so the OpenRouter fallback kicks in;
+                # generation itself can be slow, so the read limit stays long.
+                timeout=(config.HTTP_CONNECT_TIMEOUT_SECONDS, config.HTTP_TIMEOUT_SECONDS + 10),
             )
             
             if response.status_code == 429:
                 logger.warning("Gemini rate limit hit")
-                raise RuntimeError("Gemini rate limit exceeded")
+                raise GeminiAPIError("Gemini rate limit exceeded", status_code=429)
             
             if response.status_code != 200:
                 error_msg = response.text[:200]
                 logger.error("Gemini API error %d: %s", response.status_code, error_msg)
-                raise RuntimeError(f"Gemini API error: {response.status_code}")
+                raise GeminiAPIError(
+                    f"Gemini API error: {response.status_code} {error_msg}",
+                    status_code=response.status_code,
+                )
             
-            data = response.json()
+            data = config.json_loads(response.content)
             
             # Extract text from response
             candidates = data.get("candidates", [])
@@ -186,6 +242,13 @@ class GeminiClient:
             logger.error("Gemini request failed: %s", e)
             raise RuntimeError(f"Gemini request failed: {e}")
     
+    def warmup(self) -> None:
+        """Open the pooled TLS connection ahead of the first real request."""
+        try:
+            _SESSION.get(self.GEMINI_BASE_URL, timeout=(config.HTTP_CONNECT_TIMEOUT_SECONDS, 5))
+        except requests.RequestException as exc:
+            logger.debug("Gemini warmup skipped: %s", exc)
+
     def test_connection(self) -> dict:
         """
         Test AI connection and return status.
@@ -245,6 +308,8 @@ def get_ai_client(user_id: Optional[str] = None) -> GeminiClient:
     global _client
     if _client is None:
         _client = GeminiClient()
+        if _client.gemini_key:
+            threading.Thread(target=_client.warmup, name="gemini-warmup", daemon=True).start()
     return _client
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Tuple
+import string
 import uuid
 
 from PIL import Image, ImageDraw
@@ -19,14 +20,22 @@ DEFAULT_SURFACE_COLOR = "#1B1713"
 DEFAULT_TEXT_COLOR = "#F7F3EE"
 
 
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+
 def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     value = (hex_color or DEFAULT_BRAND_COLOR).strip().lstrip("#")
-    if len(value) != 6:
-        value = DEFAULT_BRAND_COLOR.lstrip("#")
-    try:
-        return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))  # type: ignore[return-value]
-    except Exception:
+    if len(value) != 6 or not _HEX_DIGITS.issuperset(value):
         return (249, 199, 79)
+    # One parse of the packed 0xRRGGBB value, then shift/mask out each channel.
+    packed = int(value, 16)
+    return ((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+
+
+# The fixed palette is the same for every slide; convert it once at import.
+_BACKGROUND_RGB = _hex_to_rgb(DEFAULT_BACKGROUND_COLOR)
+_SURFACE_RGB = _hex_to_rgb(DEFAULT_SURFACE_COLOR)
+_TEXT_RGB = _hex_to_rgb(DEFAULT_TEXT_COLOR)
 
 
 def _build_output_path(prefix: str) -> str:
@@ -58,9 +67,9 @@ def generate_carousel_slide(
     width = 1080
     height = 1080
     accent = _hex_to_rgb(brand_color)
-    background = _hex_to_rgb(DEFAULT_BACKGROUND_COLOR)
-    surface = _hex_to_rgb(DEFAULT_SURFACE_COLOR)
-    text_color = _hex_to_rgb(DEFAULT_TEXT_COLOR)
+    background = _BACKGROUND_RGB
+    surface = _SURFACE_RGB
+    text_color = _TEXT_RGB
 
     image = Image.new("RGB", (width, height), background)
     draw = ImageDraw.Draw(image, "RGBA")
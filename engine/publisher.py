@@ -681,7 +681,12 @@ def publish_due_posts(limit: int = 5, user_id: Optional[str] = None) -> int:
                     )
 
                 mark_published(content["id"], fb_post_id, user_id=row_user_id)
-                record_publication(content["id"], fb_post_id, user_id=row_user_id)
+                record_publication(
+                    content["id"],
+                    fb_post_id,
+                    user_id=row_user_id,
+                    content_text=content.get("generated_text"),
+                )
                 fb_ok = True
                 logger.info("✅ Published %s -> FB: %s", content_id[:8], fb_post_id)
             except Exception as fb_exc:
@@ -832,7 +837,7 @@ def publish_with_duplicate_check(content_id: str, user_id: Optional[str] = None)
 
         # Record publication
         mark_published(content_id, post_id, user_id=user_id)
-        record_publication(content_id, post_id, user_id=user_id)
+        record_publication(content_id, post_id, user_id=user_id, content_text=content.get("generated_text"))
 
         logger.info("✅ Published %s -> FB: %s", content_id[:8], post_id)
         return post_id
@@ -943,7 +948,7 @@ def publish_content_by_id(content_id: str, user_id: Optional[str] = None) -> Dic
 
         if post_id:
             mark_published(content_id, post_id, user_id=user_id)
-            record_publication(content_id, post_id, user_id=user_id)
+            record_publication(content_id, post_id, user_id=user_id, content_text=content.get("generated_text"))
             error_handler.update_success_status(content_id)
             logger.info("✅ Published content %s -> FB: %s", content_id[:8], post_id)
             return {"success": True, "post_id": post_id, "facebook_url": f"https://facebook.com/{post_id}"}
@@ -113,13 +113,13 @@ class AdaptiveRateLimiter:
             result = (
                 self._scope_query(
                     self.client.table("published_posts")
-                    .select("id")
+                    .select("id", count="exact", head=True)
                     .gte("published_at", today_start.isoformat())
                 )
                 .execute()
             )
             
-            count = len(result.data or [])
+            count = result.count if getattr(result, "count", None) is not None else len(result.data or [])
             logger.debug(f"📊 Posts today: {count}")
             return count
         
@@ -32,6 +32,8 @@ CONTENT_MIX = {
     "carousel": 0.3,
 }
 AUTO_SCHEDULE_TYPES = {"post", "carousel", "text"}
+# Rows per bulk insert / IN-filtered update when persisting a schedule run.
+MERGE_BATCH_LIMIT = 100
 
 
 def get_adaptive_interval(base_min: int = 2, base_max: int = 4) -> Tuple[int, int]:
@@ -216,33 +218,29 @@ def process_retries() -> int:
     try:
         result = (
             client.table("processed_content")
-            .select("id, status")
+            .select("id, status, fb_post_id")
             .eq("status", "retry_scheduled")
             .lte("next_retry_at", now)
             .execute()
         )
 
-        items = [item for item in (result.data or []) if not item.get("fb_post_id")]
-        count = 0
+        due_ids = [item["id"] for item in (result.data or []) if not item.get("fb_post_id")]
+        if not due_ids:
+            return 0
 
-        for item in items:
-            client.table("processed_content").update(
-                {
-                    "status": "scheduled",
-                    "last_error": None,
-                }
-            ).eq("id", item["id"]).execute()
-
-            client.table("scheduled_posts").update({"status": "scheduled"}).eq(
-                "content_id", item["id"]
-            ).execute()
-
-            count += 1
-
-        if count > 0:
-            logger.info("Processed %d retries -> scheduled", count)
+        # One IN-filtered update per table instead of two round-trips per item.
+        client.table("processed_content").update(
+            {
+                "status": "scheduled",
+                "last_error": None,
+            }
+        ).in_("id", due_ids).execute()
+        client.table("scheduled_posts").update({"status": "scheduled"}).in_(
+            "content_id", due_ids
+        ).execute()
 
-        return count
+        logger.info("Processed %d retries -> scheduled", len(due_ids))
+        return len(due_ids)
 
     except Exception as e:
         logger.error("Error processing retries: %s", e)
@@ -264,6 +262,27 @@ def fetch_content_pool(limit: int = 100, user_id: Optional[str] = None):
     return response.data or []
 
 
+def _persist_schedule(
+    client,
+    schedule_rows: List[Dict],
+    content_ids_by_user: Dict[Optional[str], List[str]],
+) -> None:
+    """Write a schedule run as bulk inserts plus one status update per tenant chunk."""
+    for start in range(0, len(schedule_rows), MERGE_BATCH_LIMIT):
+        client.table("scheduled_posts").insert(schedule_rows[start : start + MERGE_BATCH_LIMIT]).execute()
+
+    for row_user_id, content_ids in content_ids_by_user.items():
+        for start in range(0, len(content_ids), MERGE_BATCH_LIMIT):
+            status_query = (
+                client.table("processed_content")
+                .update({"status": "scheduled"})
+                .in_("id", content_ids[start : start + MERGE_BATCH_LIMIT])
+            )
+            if row_user_id:
+                status_query = status_query.eq("user_id", row_user_id)
+            status_query.execute()
+
+
 def schedule_posts(
     days: int = 7,
     max_per_day: int = 5,
@@ -300,7 +319,8 @@ def schedule_posts(
     ]
 
     client = config.get_database_client()
-    scheduled = 0
+    schedule_rows: List[Dict] = []
+    content_ids_by_user: Dict[Optional[str], List[str]] = {}
     start_day = date.today()
     schedule_preset = get_schedule_preset(
         country_code=country_code,
@@ -342,16 +362,11 @@ def schedule_posts(
             }
             if row_user_id:
                 payload["user_id"] = row_user_id
-            client.table("scheduled_posts").insert(payload).execute()
-            status_query = (
-                client.table("processed_content")
-                .update({"status": "scheduled"})
-                .eq("id", content["id"])
-            )
-            if row_user_id:
-                status_query = status_query.eq("user_id", row_user_id)
-            status_query.execute()
-            scheduled += 1
+            schedule_rows.append(payload)
+            content_ids_by_user.setdefault(row_user_id, []).append(content["id"])
+
+    _persist_schedule(client, schedule_rows, content_ids_by_user)
+    scheduled = len(schedule_rows)
 
     logger.info(
         "Scheduled %s posts over %s days (max %s/day, platforms=%s, user_id=%s)",
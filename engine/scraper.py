@@ -266,6 +266,25 @@ def dedupe_by_url(items: Iterable[dict]) -> List[dict]:
     return unique
 
 
+URL_LOOKUP_BATCH_SIZE = 50
+
+
+def _existing_article_urls(client, urls: List[str], user_id: Optional[str] = None) -> set:
+    """Return which of ``urls`` are already stored, with one IN query per batch."""
+    existing: set = set()
+    unique_urls = list(dict.fromkeys(urls))
+    for start in range(0, len(unique_urls), URL_LOOKUP_BATCH_SIZE):
+        batch = unique_urls[start : start + URL_LOOKUP_BATCH_SIZE]
+        try:
+            query = client.table("raw_articles").select("url").in_("url", batch)
+            if user_id:
+                query = query.eq("user_id", user_id)
+            existing.update(row.get("url") for row in query.execute().data or [])
+        except Exception as exc:
+            logger.warning("Supabase check failed for %d urls: %s", len(batch), exc)
+    return existing
+
+
 def save_articles(
     items: Iterable[dict],
     user_id: Optional[str] = None,
@@ -274,20 +293,13 @@ def save_articles(
     """Save scraped articles to raw_articles."""
     client = config.get_database_client()
     kw_list = keywords or config.DEFAULT_KEYWORDS
+    candidates = [item for item in items if item.get("url")]
+    existing_urls = _existing_article_urls(client, [item["url"] for item in candidates], user_id)
     saved = 0
-    for item in items:
-        url = item.get("url")
-        if not url:
+    for item in candidates:
+        url = item["url"]
+        if url in existing_urls:
             continue
-        try:
-            query = client.table("raw_articles").select("id").eq("url", url)
-            if user_id:
-                query = query.eq("user_id", user_id)
-            existing = query.execute()
-            if existing.data:
-                continue
-        except Exception as exc:
-            logger.warning("Supabase check failed for %s: %s", url, exc)
 
         payload = {
             "source_name": item.get("source_name"),
@@ -304,6 +316,7 @@ def save_articles(
         try:
             client.table("raw_articles").insert(payload).execute()
             saved += 1
+            existing_urls.add(url)
         except Exception as exc:
             logger.error("Supabase insert failed for %s: %s", url, exc)
     return saved
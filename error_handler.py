@@ -12,10 +12,11 @@ from __future__ import annotations
 import re
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import config
 import database
+from database import SQLiteDB
 
 logger = config.get_logger("error_handler")
 
@@ -52,6 +53,28 @@ AUTH_ERROR_PATTERNS = [
     r"permission",
 ]
 
+_REGEX_METACHARS = frozenset("\\^$.|?*+()[]{}")
+
+
+def _compile_patterns(patterns: list[str]) -> Tuple[Tuple[str, ...], Optional[re.Pattern]]:
+    """Split a pattern list into lowercased plain substrings and one regex alternation."""
+    literals = tuple(p.lower() for p in patterns if not _REGEX_METACHARS.intersection(p))
+    regexes = [p for p in patterns if _REGEX_METACHARS.intersection(p)]
+    return literals, re.compile("|".join(regexes), re.IGNORECASE) if regexes else None
+
+
+def _matches(error_str: str, compiled: Tuple[Tuple[str, ...], Optional[re.Pattern]]) -> bool:
+    """Return True when the lowercased ``error_str`` hits any literal or the regex."""
+    literals, regex = compiled
+    return any(literal in error_str for literal in literals) or bool(regex and regex.search(error_str))
+
+
+# Most patterns are plain substrings: test those with ``in`` and keep the regex
+# engine for the few real patterns, compiled once per category.
+_RATE_LIMIT_MATCHER = _compile_patterns(RATE_LIMIT_PATTERNS)
+_AUTH_ERROR_MATCHER = _compile_patterns(AUTH_ERROR_PATTERNS)
+_SERVER_ERROR_MATCHER = _compile_patterns(SERVER_ERROR_PATTERNS)
+
 
 class ErrorAction:
     """Enum-like class for error actions."""
@@ -74,22 +97,19 @@ def classify_error(error: Exception) -> Tuple[str, str]:
     error_str = str(error).lower()
     
     # Check rate limit first (most critical)
-    for pattern in RATE_LIMIT_PATTERNS:
-        if re.search(pattern, error_str, re.IGNORECASE):
-            logger.warning("🚨 Rate limit detected: %s", error)
-            return (ErrorAction.COOLDOWN, "RATE_LIMIT")
+    if _matches(error_str, _RATE_LIMIT_MATCHER):
+        logger.warning("🚨 Rate limit detected: %s", error)
+        return (ErrorAction.COOLDOWN, "RATE_LIMIT")
     
     # Check auth errors (needs human intervention)
-    for pattern in AUTH_ERROR_PATTERNS:
-        if re.search(pattern, error_str, re.IGNORECASE):
-            logger.error("🔐 Auth/Permission error: %s", error)
-            return (ErrorAction.NEEDS_ACTION, "AUTH_ERROR")
+    if _matches(error_str, _AUTH_ERROR_MATCHER):
+        logger.error("🔐 Auth/Permission error: %s", error)
+        return (ErrorAction.NEEDS_ACTION, "AUTH_ERROR")
     
     # Check server errors (can retry)
-    for pattern in SERVER_ERROR_PATTERNS:
-        if re.search(pattern, error_str, re.IGNORECASE):
-            logger.warning("🌐 Server error, will retry: %s", error)
-            return (ErrorAction.RETRY, "SERVER_ERROR")
+    if _matches(error_str, _SERVER_ERROR_MATCHER):
+        logger.warning("🌐 Server error, will retry: %s", error)
+        return (ErrorAction.RETRY, "SERVER_ERROR")
     
     # Unknown error - retry once then give up
     logger.warning("❓ Unknown error: %s", error)
@@ -115,16 +135,20 @@ def execute_action(
         True if the post should be retried, False otherwise.
     """
     db = database.get_db()
-    now = datetime.now(timezone.utc).isoformat()
+    # One clock read per action: every timestamp below derives from it.
+    now_dt = datetime.now(timezone.utc)
+    now = now_dt.isoformat()
     
     if action == ErrorAction.COOLDOWN:
         # Set global cooldown and reschedule post for 24h later
-        cooldown_until = (datetime.now(timezone.utc) + timedelta(hours=24)).isoformat()
+        cooldown_until = (now_dt + timedelta(hours=24)).isoformat()
         
         # Update system status
-        _update_system_status(db, "cooldown_until", cooldown_until)
-        _update_system_status(db, "last_error_code", error_code)
-        _update_system_status(db, "last_error_action", "cooldown_24h")
+        _update_system_status(db, {
+            "cooldown_until": cooldown_until,
+            "last_error_code": error_code,
+            "last_error_action": "cooldown_24h",
+        }, now)
         
         # Reschedule the content
         db.table("processed_content").update({
@@ -147,15 +171,17 @@ def execute_action(
                 "last_error_at": now
             }).eq("id", content_id).execute()
             
-            _update_system_status(db, "last_error_code", error_code)
-            _update_system_status(db, "last_error_action", "failed_max_retries")
+            _update_system_status(db, {
+                "last_error_code": error_code,
+                "last_error_action": "failed_max_retries",
+            }, now)
             
             logger.error("❌ Max retries reached for %s", content_id)
             return False
         
         # Calculate exponential backoff delay
-        delay_minutes = 2 ** retry_count * 5  # 5, 10, 20 minutes
-        next_retry_dt = datetime.now(timezone.utc) + timedelta(minutes=delay_minutes)
+        delay_minutes = 5 << retry_count  # 5, 10, 20 minutes
+        next_retry_dt = now_dt + timedelta(minutes=delay_minutes)
         next_retry_at = next_retry_dt.isoformat()
         
         db.table("processed_content").update({
@@ -178,8 +204,10 @@ def execute_action(
             "last_error_at": now
         }).eq("id", content_id).execute()
         
-        _update_system_status(db, "last_error_code", error_code)
-        _update_system_status(db, "last_error_action", "needs_action")
+        _update_system_status(db, {
+            "last_error_code": error_code,
+            "last_error_action": "needs_action",
+        }, now)
         
         logger.error("🚨 NEEDS MANUAL ACTION: %s for content %s", error_code, content_id)
         # TODO: Send notification (Discord/Telegram) here
@@ -193,17 +221,16 @@ def is_in_cooldown() -> bool:
     db = database.get_db()
     
     try:
-        result = db.table("system_status").select("value").eq("key", "cooldown_until").single().execute()
-        if result.data and result.data.get("value"):
-            cooldown_until = datetime.fromisoformat(result.data["value"])
+        # limit(1) rather than single(): a missing row is the normal case and
+        # should not cost an error response plus exception handling.
+        result = db.table("system_status").select("value").eq("key", "cooldown_until").limit(1).execute()
+        row = result.data[0] if result.data else None
+        if row and row.get("value"):
+            cooldown_until = datetime.fromisoformat(row["value"])
             if datetime.now(timezone.utc) < cooldown_until:
                 logger.warning("🛑 System in cooldown until %s", cooldown_until)
                 return True
     except PostgrestAPIError as exc:
-        payload = exc.args[0] if exc.args else {}
-        code = payload.get("code") if isinstance(payload, dict) else ""
-        if code == "PGRST116":
-            return False
         logger.warning("Could not evaluate cooldown status: %s", exc)
     except (TypeError, ValueError, AttributeError) as exc:
         logger.warning("Could not evaluate cooldown status: %s", exc)
@@ -224,49 +251,52 @@ def get_recent_error_rate(hours: int = 24) -> float:
     cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat()
     
     try:
-        # Count failed posts (excluding 'rejected' which is user-initiated)
-        failed = db.table("processed_content").select("id", count="exact").eq(
-            "status", "failed"
-        ).gte("last_error_at", cutoff).execute()
-        
-        # Count successful posts
-        success = db.table("processed_content").select("id", count="exact").eq(
-            "status", "published"
-        ).gte("generated_at", cutoff).execute()
+        if isinstance(db, SQLiteDB):
+            # Both counters in one pass over the status index.
+            row = db.execute(
+                "SELECT"
+                " COALESCE(SUM(status = 'failed' AND last_error_at >= ?), 0) AS failed,"
+                " COALESCE(SUM(status = 'published' AND generated_at >= ?), 0) AS success"
+                " FROM processed_content WHERE status IN ('failed', 'published')",
+                (cutoff, cutoff),
+            )[0]
+            failed_count, success_count = row["failed"], row["success"]
+        else:
+            # Count failed posts (excluding 'rejected' which is user-initiated)
+            failed = db.table("processed_content").select("id", count="exact", head=True).eq(
+                "status", "failed"
+            ).gte("last_error_at", cutoff).execute()
+
+            # Count successful posts
+            success = db.table("processed_content").select("id", count="exact", head=True).eq(
+                "status", "published"
+            ).gte("generated_at", cutoff).execute()
+            failed_count, success_count = failed.count or 0, success.count or 0
         
         # v2.1.1: Don't count rejected as failures (they are user-initiated)
-        total = (failed.count or 0) + (success.count or 0)
+        total = failed_count + success_count
         if total == 0:
             return 0.0
         
-        error_rate = (failed.count or 0) / total
+        error_rate = failed_count / total
         logger.debug("Error rate: %.2f%% (failed=%d, success=%d)", 
-                    error_rate * 100, failed.count or 0, success.count or 0)
+                    error_rate * 100, failed_count, success_count)
         return error_rate
     except Exception as e:
         logger.warning("Could not calculate error rate: %s", e)
         return 0.0
 
 
-def _update_system_status(db, key: str, value: str) -> None:
-    """Update a system status value."""
-    now = datetime.now(timezone.utc).isoformat()
+def _update_system_status(db, values: Dict[str, Optional[str]], now: Optional[str] = None) -> None:
+    """Write several system status values in one upsert, stamped ``now`` (default: current time)."""
+    now = now or datetime.now(timezone.utc).isoformat()
     try:
-        # Try update first
-        result = db.table("system_status").update({
-            "value": value,
-            "updated_at": now
-        }).eq("key", key).execute()
-        
-        # If no rows updated, insert
-        if not result.data:
-            db.table("system_status").insert({
-                "key": key,
-                "value": value,
-                "updated_at": now
-            }).execute()
+        db.table("system_status").upsert(
+            [{"key": key, "value": value, "updated_at": now} for key, value in values.items()],
+            on_conflict="key",
+        ).execute()
     except Exception as e:
-        logger.warning("Could not update system status %s: %s", key, e)
+        logger.warning("Could not update system status %s: %s", ", ".join(values), e)
 
 
 def update_success_status(content_id: str) -> None:
@@ -275,9 +305,11 @@ def update_success_status(content_id: str) -> None:
     now = datetime.now(timezone.utc).isoformat()
 
     try:
-        _update_system_status(db, "last_success_publish_at", now)
-        _update_system_status(db, "last_error_code", None)
-        _update_system_status(db, "last_error_action", None)
+        _update_system_status(db, {
+            "last_success_publish_at": now,
+            "last_error_code": None,
+            "last_error_action": None,
+        }, now)
 
         # Update content status
         db.table("processed_content").update({
@@ -0,0 +1,18 @@
+"""
+Gunicorn settings, picked up automatically by ``gunicorn wsgi:app`` and
+``gunicorn dashboard_app:app`` when started from the project root.
+
+Web requests spend most of their time waiting on Supabase, the Graph API and
+LLM providers. Threaded workers let one process overlap those waits instead of
+queueing every request behind a single blocking regeneration or status probe.
+All values can be overridden from the environment or the command line.
+"""
+
+import os
+
+worker_class = "gthread"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+# LLM regenerations routinely take longer than gunicorn's 30s default.
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
@@ -21,6 +23,12 @@ except ImportError:
 
 logger = config.get_logger("image_generator")
 
+# Mixed Arabic/English detection and segmentation in prepare_arabic_text().
+_ARABIC_CHAR_RE = re.compile(r"[\u0600-\u06FF]")
+_LATIN_CHAR_RE = re.compile(r"[A-Za-z]")
+_LATIN_SEGMENT_SPLIT_RE = re.compile(r"([A-Za-z0-9:]+(?:\s+[A-Za-z0-9:]+)*)")
+_LATIN_SEGMENT_RE = re.compile(r"^[A-Za-z0-9:\s]+$")
+
 # Paths
 BASE_DIR = Path(__file__).resolve().parent
 TEMPLATE_PATH = BASE_DIR / "Publication Instagram - Transforming the  Future of Business (1).png"
@@ -54,16 +62,25 @@ DEFAULT_CONFIG = {
 }
 
 
+# (mtime_ns, parsed overrides) for image_config.json; re-read only when the file changes.
+_config_overrides_cache: Optional[Tuple[int, dict]] = None
+
+
 def load_config() -> dict:
     """Load configuration, allowing manual overrides from config file."""
+    global _config_overrides_cache
+
     config_path = BASE_DIR / "image_config.json"
-    if config_path.exists():
-        import json
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return DEFAULT_CONFIG.copy()
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            user_config = json.load(f)
-            return {**DEFAULT_CONFIG, **user_config}
-    return DEFAULT_CONFIG.copy()
+    cached = _config_overrides_cache
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, config.json_loads(config_path.read_bytes()))
+        _config_overrides_cache = cached
+    return {**DEFAULT_CONFIG, **cached[1]}
 
 
 def save_config(config_dict: dict) -> None:
@@ -76,24 +93,46 @@ def save_config(config_dict: dict) -> None:
     logger.info("Configuration saved to %s", config_path)
 
 
+# Decoded RGBA templates keyed by path, with the mtime_ns they were read at.
+_template_cache: Dict[str, Tuple[int, Image.Image]] = {}
+
+
+def _load_template(path: Path) -> Image.Image:
+    """Return a fresh RGBA copy of ``path``, decoding the PNG only when the file changes."""
+    key = str(path)
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _template_cache.get(key)
+    if cached is None or cached[0] != mtime_ns:
+        with Image.open(path) as img:
+            cached = (mtime_ns, img.convert("RGBA"))
+        _template_cache[key] = cached
+    return cached[1].copy()
+
+
+# Priority: Fonts that support Arabic AND Latin (for mixed text like "Facebook")
+FONT_CANDIDATES = (
+    # Windows fonts that support Arabic + Latin (BEST for mixed content)
+    "C:/Windows/Fonts/arialbd.ttf",  # Arial Bold - supports Arabic + Latin
+    "C:/Windows/Fonts/tahomabd.ttf",  # Tahoma Bold - supports Arabic + Latin
+    "C:/Windows/Fonts/seguibl.ttf",  # Segoe UI Black - supports Arabic + Latin
+    # Custom fonts (Arabic only - fallback)
+    str(FONTS_DIR / "NotoSansArabic-Bold.ttf"),
+    str(FONTS_DIR / "arabic_bold.ttf"),
+    # Regular fonts (fallback)
+    "C:/Windows/Fonts/arial.ttf",
+    "C:/Windows/Fonts/tahoma.ttf",
+    "C:/Windows/Fonts/calibrib.ttf",
+)
+
+
+@lru_cache(maxsize=32)
 def get_arabic_font(size: int = 32) -> ImageFont.FreeTypeFont:
-    """Get a font that supports BOTH Arabic and Latin characters."""
-    # Priority: Fonts that support Arabic AND Latin (for mixed text like "Facebook")
-    font_candidates = [
-        # Windows fonts that support Arabic + Latin (BEST for mixed content)
-        "C:/Windows/Fonts/arialbd.ttf",  # Arial Bold - supports Arabic + Latin
-        "C:/Windows/Fonts/tahomabd.ttf",  # Tahoma Bold - supports Arabic + Latin
-        "C:/Windows/Fonts/seguibl.ttf",  # Segoe UI Black - supports Arabic + Latin
-        # Custom fonts (Arabic only - fallback)
-        str(FONTS_DIR / "NotoSansArabic-Bold.ttf"),
-        str(FONTS_DIR / "arabic_bold.ttf"),
-        # Regular fonts (fallback)
-        "C:/Windows/Fonts/arial.ttf",
-        "C:/Windows/Fonts/tahoma.ttf",
-        "C:/Windows/Fonts/calibrib.ttf",
-    ]
-
-    for font_path in font_candidates:
+    """Get a font that supports BOTH Arabic and Latin characters.
+
+    Cached per size: the candidate probe and FreeType face load run once,
+    and every later image reuses the same font object.
+    """
+    for font_path in FONT_CANDIDATES:
         if os.path.exists(font_path):
             try:
                 font = ImageFont.truetype(font_path, size)
@@ -118,18 +157,16 @@ def prepare_arabic_text(text: str) -> str:
         return text
 
     try:
-        import re
-
         # Detect if text contains both Arabic and English
-        has_arabic = bool(re.search(r"[\u0600-\u06FF]", text))
-        has_english = bool(re.search(r"[A-Za-z]", text))
+        has_arabic = bool(_ARABIC_CHAR_RE.search(text))
+        has_english = bool(_LATIN_CHAR_RE.search(text))
 
         if has_arabic and has_english:
             # Mixed text: special handling
             # Strategy: reshape Arabic parts, keep English as-is, then apply BiDi
 
             # Split text into Arabic and English segments
-            segments = re.split(r"([A-Za-z0-9:]+(?:\s+[A-Za-z0-9:]+)*)", text)
+            segments = _LATIN_SEGMENT_SPLIT_RE.split(text)
 
             processed_segments = []
             for segment in segments:
@@ -137,7 +174,7 @@ def prepare_arabic_text(text: str) -> str:
                     continue
 
                 # Check if this segment is English (brand name, etc.)
-                if re.match(r"^[A-Za-z0-9:\s]+$", segment.strip()):
+                if _LATIN_SEGMENT_RE.match(segment.strip()):
                     # English segment - keep as-is
                     processed_segments.append(segment.strip())
                 else:
@@ -169,22 +206,29 @@ def prepare_arabic_text(text: str) -> str:
 def wrap_text(
     text: str, font: ImageFont.FreeTypeFont, max_width: int, max_lines: int = 3
 ) -> list[str]:
-    """Wrap text to fit within max_width, limiting to max_lines."""
+    """Wrap text to fit within max_width, limiting to max_lines.
+
+    Each word is measured once and line widths are summed from word and
+    space advances, instead of re-shaping the whole candidate line per word.
+    """
     words = text.split()
     lines = []
     current_line = []
+    current_width = 0.0
+    space_width = font.getlength(" ")
 
     for word in words:
-        test_line = " ".join(current_line + [word])
-        bbox = font.getbbox(test_line)
-        width = bbox[2] - bbox[0]
+        word_width = font.getlength(word)
+        width = current_width + space_width + word_width if current_line else word_width
 
         if width <= max_width:
             current_line.append(word)
+            current_width = width
         else:
             if current_line:
                 lines.append(" ".join(current_line))
             current_line = [word]
+            current_width = word_width
 
             if len(lines) >= max_lines:
                 break
@@ -260,16 +304,14 @@ def generate_post_image(
     if not target_template.exists():
         raise FileNotFoundError(f"Default template not found: {TEMPLATE_PATH}")
 
-    template = Image.open(target_template).convert("RGBA")
-    canvas_width, canvas_height = template.size
+    # Create result image starting with (a copy of) the cached template
+    result = _load_template(target_template)
+    canvas_width, canvas_height = result.size
 
     # Update config with actual template size
     cfg["canvas_width"] = canvas_width
     cfg["canvas_height"] = canvas_height
 
-    # Create result image starting with template
-    result = template.copy()
-
     # Add article image if provided (placed ON TOP of template in designated area)
     if article_image_path and os.path.exists(article_image_path):
         try:
@@ -348,7 +390,7 @@ def preview_config() -> str:
     cfg = load_config()
 
     # Load template
-    template = Image.open(TEMPLATE_PATH).convert("RGBA")
+    template = _load_template(TEMPLATE_PATH)
     draw = ImageDraw.Draw(template)
 
     # Draw configuration overlay
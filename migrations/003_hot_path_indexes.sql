@@ -0,0 +1,10 @@
+-- Composite indexes for the hottest tenant filters.
+-- fetch_due_posts: status = 'scheduled' AND scheduled_time <= now ORDER BY scheduled_time.
+-- Health/setup counters: processed_content by (user_id, status), published_posts by (user_id, published_at).
+
+CREATE INDEX IF NOT EXISTS idx_scheduled_posts_status_time
+    ON public.scheduled_posts(status, scheduled_time);
+CREATE INDEX IF NOT EXISTS idx_processed_content_user_status
+    ON public.processed_content(user_id, status);
+CREATE INDEX IF NOT EXISTS idx_published_posts_user_published_at
+    ON public.published_posts(user_id, published_at);
@@ -0,0 +1,19 @@
+-- Per-status processed_content counters in one round-trip.
+-- The health endpoint used to send one exact count query per status bucket;
+-- this function answers all of them with a single GROUP BY on
+-- idx_processed_content_user_status (migrations/003). Safe to re-run.
+
+CREATE OR REPLACE FUNCTION public.processed_content_status_counts(
+    p_user_id UUID,
+    p_statuses TEXT[]
+)
+RETURNS TABLE (status TEXT, count BIGINT)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT pc.status, COUNT(*)::BIGINT
+    FROM public.processed_content AS pc
+    WHERE pc.user_id = p_user_id
+      AND pc.status = ANY(p_statuses)
+    GROUP BY pc.status;
+$$;
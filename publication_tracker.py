@@ -15,8 +15,12 @@ Version: 2.0.0
 from __future__ import annotations
 
 import hashlib
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import config
@@ -37,6 +41,59 @@ def _get_client():
     return config.get_supabase_client()
 
 
+# (stat key, table, required status) behind get_publication_stats().
+_STAT_COUNTERS = (
+    ("total_processed", "processed_content", None),
+    ("total_published", "published_posts", None),
+    ("total_scheduled", "scheduled_posts", "scheduled"),
+    ("articles_pending", "raw_articles", "pending"),
+)
+
+
+@lru_cache(maxsize=8192)
+def _word_hash(word: str) -> int:
+    """Return the 128-bit MD5 of a SimHash token; common words recur across posts."""
+    return int.from_bytes(hashlib.md5(word.encode()).digest(), "big")
+
+
+# Drafts are re-checked on every scheduler pass, so their fingerprints are
+# cached by text rather than re-tokenized each time.
+@lru_cache(maxsize=1024)
+def _simhash(text: str) -> int:
+    """Return the 64-bit SimHash of ``text`` (0 for empty text)."""
+    if not text:
+        return 0
+
+    # Tokenize; repeated words only need hashing and voting once
+    words = Counter(text.lower().split())
+
+    # Initialize vector
+    v = [0] * 64
+
+    for word, weight in words.items():
+        word_hash = _word_hash(word)
+
+        for i in range(64):
+            if (word_hash >> i) & 1:
+                v[i] += weight
+            else:
+                v[i] -= weight
+
+    # Convert to fingerprint
+    fingerprint = 0
+    for i in range(64):
+        if v[i] > 0:
+            fingerprint |= 1 << i
+
+    return fingerprint
+
+
+@lru_cache(maxsize=8)
+def _max_simhash_distance(threshold: float) -> int:
+    """Largest 64-bit Hamming distance whose similarity still meets ``threshold``."""
+    return max((d for d in range(65) if 1 - (d / 64) >= threshold), default=-1)
+
+
 @dataclass
 class PublicationRecord:
     """Record of a published post."""
@@ -192,49 +249,20 @@ class PublicationTracker:
 
         SimHash allows detecting similar (not just identical) content.
         """
-        if not text:
-            return 0
-
-        # Tokenize
-        words = text.lower().split()
-
-        # Initialize vector
-        v = [0] * 64
-
-        for word in words:
-            # Hash each word
-            word_hash = int(hashlib.md5(word.encode()).hexdigest(), 16)
-
-            for i in range(64):
-                bit = (word_hash >> i) & 1
-                if bit:
-                    v[i] += 1
-                else:
-                    v[i] -= 1
-
-        # Convert to fingerprint
-        fingerprint = 0
-        for i in range(64):
-            if v[i] > 0:
-                fingerprint |= 1 << i
-
-        return fingerprint
+        return _simhash(text)
 
     def _hamming_distance(self, hash1: int, hash2: int) -> int:
         """Compute Hamming distance between two hashes."""
-        xor = hash1 ^ hash2
-        distance = 0
-        while xor:
-            distance += xor & 1
-            xor >>= 1
-        return distance
-
-    def is_url_already_used(self, url: str) -> Tuple[bool, str]:
+        return (hash1 ^ hash2).bit_count()
+
+    def is_url_already_used(self, url: str, article: Optional[Dict[str, Any]] = None) -> Tuple[bool, str]:
         """
         Check if a source URL has already been used.
 
         Args:
             url: Source article URL
+            article: Already-fetched raw_articles row (id, status) for ``url``;
+                skips the lookup by URL when given
 
         Returns:
             Tuple of (is_used, reason)
@@ -252,17 +280,18 @@ class PublicationTracker:
         try:
             client = _get_client()
 
-            response = (
-                self._scope_query(
-                    client.table("raw_articles")
-                    .select("id, status, scraped_at")
-                    .eq("url", url)
+            if article is None:
+                response = (
+                    self._scope_query(
+                        client.table("raw_articles")
+                        .select("id, status, scraped_at")
+                        .eq("url", url)
+                    )
+                    .execute()
                 )
-                .execute()
-            )
+                article = response.data[0] if response.data else None
 
-            if response.data:
-                article = response.data[0]
+            if article:
                 status = article.get("status")
                 article_id = article.get("id")
 
@@ -284,13 +313,14 @@ class PublicationTracker:
                         pub_check
                         .execute()
                     )
-                    for content in pub_check.data or []:
-                        content_id = content.get("id")
+                    content_ids = [content.get("id") for content in pub_check.data or [] if content.get("id")]
+                    if content_ids:
                         pub_response = (
                             self._scope_query(
                                 client.table("published_posts")
                                 .select("id")
-                                .eq("content_id", content_id)
+                                .in_("content_id", content_ids)
+                                .limit(1)
                             )
                             .execute()
                         )
@@ -372,10 +402,11 @@ class PublicationTracker:
 
         try:
             new_simhash = self._compute_simhash(text)
+            max_distance = _max_simhash_distance(self.HASH_SIMILARITY_THRESHOLD)
             for existing_simhash in getattr(self, "_published_simhashes", []):
-                distance = self._hamming_distance(new_simhash, existing_simhash)
-                similarity = 1 - (distance / 64)
-                if similarity >= self.HASH_SIMILARITY_THRESHOLD:
+                distance = (new_simhash ^ existing_simhash).bit_count()
+                if distance <= max_distance:
+                    similarity = 1 - (distance / 64)
                     return True, similarity, f"Similar content found (similarity: {similarity:.1%})"
         except Exception as e:
             logger.warning("Similarity check failed: %s", e)
@@ -434,7 +465,7 @@ class PublicationTracker:
             if article_id:
                 article_response = (
                     client.table("raw_articles")
-                    .select("url")
+                    .select("id, url, status")
                     .eq("id", article_id)
                     .single()
                     .execute()
@@ -442,7 +473,7 @@ class PublicationTracker:
 
                 if article_response.data:
                     url = article_response.data.get("url", "")
-                    is_used, reason = self.is_url_already_used(url)
+                    is_used, reason = self.is_url_already_used(url, article=article_response.data)
                     if is_used:
                         logger.warning("❌ Cannot publish %s: %s", content_id[:8], reason)
                         return False, reason
@@ -459,6 +490,7 @@ class PublicationTracker:
         content_id: str,
         facebook_post_id: str,
         article_url: str = "",
+        content_text: Optional[str] = None,
     ) -> None:
         """
         Record a successful publication.
@@ -467,27 +499,32 @@ class PublicationTracker:
             content_id: Published content ID
             facebook_post_id: Facebook post ID
             article_url: Source article URL
+            content_text: Published generated_text, when the caller already has
+                it; skips re-reading the row just to hash it
         """
         # Update caches
         if article_url:
             self._published_urls.add(article_url.lower().strip())
 
         try:
-            client = _get_client()
+            text = content_text
+            if text is None:
+                client = _get_client()
 
-            # Get content text for hash
-            response = (
-                self._scope_query(
-                    client.table("processed_content")
-                    .select("generated_text")
-                    .eq("id", content_id)
+                # Get content text for hash
+                response = (
+                    self._scope_query(
+                        client.table("processed_content")
+                        .select("generated_text")
+                        .eq("id", content_id)
+                    )
+                    .single()
+                    .execute()
                 )
-                .single()
-                .execute()
-            )
+                if response.data:
+                    text = response.data.get("generated_text", "")
 
-            if response.data:
-                text = response.data.get("generated_text", "")
+            if text is not None:
                 content_hash = self._compute_content_hash(text)
                 self._published_hashes.add(content_hash)
                 simhash = self._compute_simhash(text)
@@ -600,6 +637,39 @@ class PublicationTracker:
 
         return unpublished
 
+    def _count_publication_stats(self, client) -> Dict[str, int]:
+        """Return the stat counters; one UNION ALL query on SQLite, concurrent head counts otherwise."""
+        from database import SQLiteDB
+
+        user_id = getattr(self, "user_id", None)
+        if isinstance(client, SQLiteDB):
+            parts: List[str] = []
+            params: List[str] = []
+            for key, table, status in _STAT_COUNTERS:
+                clauses = []
+                if status:
+                    clauses.append("status = ?")
+                    params.append(status)
+                if user_id:
+                    clauses.append("user_id = ?")
+                    params.append(user_id)
+                where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+                parts.append(f"SELECT '{key}' AS k, COUNT(*) AS v FROM {table}{where}")
+            rows = client.execute(" UNION ALL ".join(parts), tuple(params))
+            return {row["k"]: row["v"] for row in rows}
+
+        def count(table: str, status: Optional[str]) -> int:
+            query = client.table(table).select("id", count="exact", head=True)
+            if status:
+                query = query.eq("status", status)
+            result = self._scope_query(query).execute()
+            return result.count if hasattr(result, "count") else len(result.data or [])
+
+        # Independent HTTP round-trips: overlap them so the total is the slowest, not the sum.
+        with ThreadPoolExecutor(max_workers=len(_STAT_COUNTERS), thread_name_prefix="pub-stats") as executor:
+            futures = {key: executor.submit(count, table, status) for key, table, status in _STAT_COUNTERS}
+            return {key: future.result() for key, future in futures.items()}
+
     def get_publication_stats(self) -> Dict[str, Any]:
         """
         Get publication statistics.
@@ -608,46 +678,11 @@ class PublicationTracker:
             Dict with stats
         """
         try:
-            client = _get_client()
-
-            # Count total processed
-            processed = client.table("processed_content").select("id", count="exact").execute()
-            if getattr(self, "user_id", None):
-                processed = self._scope_query(client.table("processed_content").select("id", count="exact")).execute()
-
-            # Count published
-            published = self._scope_query(client.table("published_posts").select("id", count="exact")).execute()
-
-            # Count scheduled
-            scheduled = (
-                self._scope_query(
-                    client.table("scheduled_posts")
-                    .select("id", count="exact")
-                    .eq("status", "scheduled")
-                )
-                .execute()
-            )
-
-            # Count pending articles
-            pending = (
-                self._scope_query(
-                    client.table("raw_articles")
-                    .select("id", count="exact")
-                    .eq("status", "pending")
-                )
-                .execute()
-            )
-
-            processed_count = (
-                processed.count if hasattr(processed, "count") else len(processed.data or [])
-            )
-            published_count = (
-                published.count if hasattr(published, "count") else len(published.data or [])
-            )
-            scheduled_count = (
-                scheduled.count if hasattr(scheduled, "count") else len(scheduled.data or [])
-            )
-            pending_count = pending.count if hasattr(pending, "count") else len(pending.data or [])
+            counts = self._count_publication_stats(_get_client())
+            processed_count = counts["total_processed"]
+            published_count = counts["total_published"]
+            scheduled_count = counts["total_scheduled"]
+            pending_count = counts["articles_pending"]
 
             return {
                 "total_processed": processed_count,
@@ -691,15 +726,22 @@ class PublicationTracker:
             return 0
 
 
-# Global instance for easy access
+# Global instance for easy access. Each tracker's preloaded history (hashes,
+# SimHashes, URLs) is reused for back-to-back checks and rebuilt once it is
+# older than TRACKER_HISTORY_TTL_SECONDS, so publications made by other
+# workers and expired cooldowns are picked up.
+TRACKER_HISTORY_TTL_SECONDS = 300
 _tracker_instances: Dict[Optional[str], PublicationTracker] = {}
+_tracker_loaded_at: Dict[Optional[str], float] = {}
 
 
 def get_tracker(user_id: Optional[str] = None) -> PublicationTracker:
     """Get or create a publication tracker instance scoped to a tenant."""
     key = str(user_id).strip() if user_id else None
-    if key not in _tracker_instances:
+    now = time.monotonic()
+    if key not in _tracker_instances or now - _tracker_loaded_at.get(key, now) > TRACKER_HISTORY_TTL_SECONDS:
         _tracker_instances[key] = PublicationTracker(user_id=key)
+        _tracker_loaded_at[key] = now
     return _tracker_instances[key]
 
 
@@ -716,9 +758,12 @@ def record_publication(
     facebook_post_id: str,
     article_url: str = "",
     user_id: Optional[str] = None,
+    content_text: Optional[str] = None,
 ) -> None:
     """Record a successful publication."""
-    get_tracker(user_id=user_id).record_publication(content_id, facebook_post_id, article_url)
+    get_tracker(user_id=user_id).record_publication(
+        content_id, facebook_post_id, article_url, content_text=content_text
+    )
 
 
 def get_unpublished_content(limit: int = 50, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
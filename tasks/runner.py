@@ -19,8 +19,9 @@ from __future__ import annotations
 
 import logging
 import os
+import signal
 import sys
-import time
+import threading
 
 # Ensure the project root and engine/ are on sys.path so bare module imports
 # (scraper, publisher, scheduler, etc.) resolve correctly regardless of how
@@ -33,7 +34,7 @@ for _p in (_ROOT, _ENGINE):
         sys.path.insert(0, _p)
 
 from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
 import config
@@ -47,6 +48,7 @@ PIPELINE_TIMEOUT_SECONDS: int = int(os.getenv("PIPELINE_TIMEOUT", "300"))
 PIPELINE_REQUEST_POLL_SECONDS: int = int(
     os.getenv("PIPELINE_REQUEST_POLL_SECONDS", "30")
 )
+SQLITE_OPTIMIZE_INTERVAL_SECONDS: int = int(os.getenv("SQLITE_OPTIMIZE_INTERVAL_SECONDS", "900"))
 
 # Key prefix used in system_status for per-user pipeline locks
 _LOCK_KEY_PREFIX = "pipeline_lock:"
@@ -506,8 +508,22 @@ def run_requested_users(max_workers: int = MAX_WORKERS) -> Dict:
     return summary
 
 
+def _optimize_local_db() -> None:
+    """Refresh SQLite planner statistics; a no-op when running on Supabase."""
+    try:
+        from database import SQLiteDB, get_db
+
+        db = get_db()
+        if isinstance(db, SQLiteDB):
+            db.optimize()
+    except Exception as exc:
+        logger.warning("SQLite optimize failed: %s", exc)
+
+
 _scheduler_started: bool = False
 _scheduler_instance = None  # Exposed so telegram_bot can attach its own jobs
+_scheduler_lock = threading.Lock()
+_worker_stop = threading.Event()
 
 
 def start_scheduler() -> None:
@@ -521,63 +537,55 @@ def start_scheduler() -> None:
     Safe to call multiple times — only one scheduler instance is created.
     """
     global _scheduler_started
-    if _scheduler_started:
-        logger.debug("Scheduler already started — skipping duplicate start")
-        return
-
-    try:
-        from apscheduler.schedulers.background import BackgroundScheduler
-        from apscheduler.triggers.interval import IntervalTrigger
-
-        scheduler = BackgroundScheduler(daemon=True, timezone="UTC")
-        scheduler.add_job(
-            func=run_all_users,
-            trigger=IntervalTrigger(seconds=PIPELINE_INTERVAL_SECONDS),
-            id="pipeline_all_users",
-            name="Pipeline — all users",
-            replace_existing=True,
-            next_run_time=None,  # Will be set after startup delay below
-        )
-        scheduler.add_job(
-            func=run_requested_users,
-            trigger=IntervalTrigger(seconds=PIPELINE_REQUEST_POLL_SECONDS),
-            id="pipeline_requested_users",
-            name="Pipeline - requested users",
-            replace_existing=True,
-            next_run_time=datetime.now(timezone.utc),
-        )
-        scheduler.start()
-        global _scheduler_instance
-        _scheduler_instance = scheduler
-        _scheduler_started = True
-
-        # Reschedule first run after startup delay
-        import threading
-        import time
-
-        def _delayed_first_run() -> None:
-            time.sleep(PIPELINE_STARTUP_DELAY_SECONDS)
-            logger.info("Triggering first pipeline run after startup delay")
-            try:
-                scheduler.modify_job(
-                    "pipeline_all_users",
-                    next_run_time=datetime.now(timezone.utc),
-                )
-            except Exception:
-                pass
-
-        t = threading.Thread(target=_delayed_first_run, daemon=True, name="pipeline-delay")
-        t.start()
+    # Two app threads racing through the check-then-start would each spawn a scheduler.
+    with _scheduler_lock:
+        if _scheduler_started:
+            logger.debug("Scheduler already started — skipping duplicate start")
+            return
 
-        logger.info(
-            "APScheduler started: first run in %ds, recurring=%ds, request-poll=%ds",
-            PIPELINE_STARTUP_DELAY_SECONDS,
-            PIPELINE_INTERVAL_SECONDS,
-            PIPELINE_REQUEST_POLL_SECONDS,
-        )
+        try:
+            from apscheduler.schedulers.background import BackgroundScheduler
+            from apscheduler.triggers.interval import IntervalTrigger
+
+            scheduler = BackgroundScheduler(daemon=True, timezone="UTC")
+            scheduler.add_job(
+                func=run_all_users,
+                trigger=IntervalTrigger(seconds=PIPELINE_INTERVAL_SECONDS),
+                id="pipeline_all_users",
+                name="Pipeline — all users",
+                replace_existing=True,
+                # Let the scheduler own the startup delay instead of parking a thread in sleep().
+                next_run_time=datetime.now(timezone.utc) + timedelta(seconds=PIPELINE_STARTUP_DELAY_SECONDS),
+            )
+            scheduler.add_job(
+                func=run_requested_users,
+                trigger=IntervalTrigger(seconds=PIPELINE_REQUEST_POLL_SECONDS),
+                id="pipeline_requested_users",
+                name="Pipeline - requested users",
+                replace_existing=True,
+                next_run_time=datetime.now(timezone.utc),
+            )
+            scheduler.add_job(
+                func=_optimize_local_db,
+                trigger=IntervalTrigger(seconds=SQLITE_OPTIMIZE_INTERVAL_SECONDS),
+                id="sqlite_optimize",
+                name="SQLite planner statistics",
+                replace_existing=True,
+            )
+            scheduler.start()
+            global _scheduler_instance
+            _scheduler_instance = scheduler
+            _scheduler_started = True
+
+            logger.info(
+                "APScheduler started: first run in %ds, recurring=%ds, request-poll=%ds",
+                PIPELINE_STARTUP_DELAY_SECONDS,
+                PIPELINE_INTERVAL_SECONDS,
+                PIPELINE_REQUEST_POLL_SECONDS,
+            )
 
-    except Exception as exc:
-        logger.error("Failed to start APScheduler: %s", exc, exc_info=True)
+        except Exception as exc:
+            logger.error("Failed to start APScheduler: %s", exc, exc_info=True)
 
 
 def run_scheduler_worker() -> None:
@@ -591,18 +599,27 @@ def run_scheduler_worker() -> None:
     if not _scheduler_started or _scheduler_instance is None:
         raise RuntimeError("Scheduler worker failed to start")
 
+    # SIGTERM (systemd, docker stop) sets the stop event so shutdown is immediate.
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda _signum, _frame: stop_scheduler_worker())
+
     logger.info("Scheduler worker running")
     try:
-        while True:
-            time.sleep(3600)
+        _worker_stop.wait()
     except KeyboardInterrupt:
-        logger.info("Scheduler worker stopping")
+        pass
     finally:
+        logger.info("Scheduler worker stopping")
         try:
             _scheduler_instance.shutdown(wait=False)
         except Exception:
             pass
 
 
+def stop_scheduler_worker() -> None:
+    """Ask ``run_scheduler_worker`` to shut the scheduler down and return."""
+    _worker_stop.set()
+
+
 if __name__ == "__main__":
     run_scheduler_worker()
@@ -402,14 +402,14 @@ def _send_daily_summary_for_user(user_id: str) -> None:
         # Posts scheduled for today only (bounded range)
         sched_res = (
             sb.table("scheduled_posts")
-            .select("id")
+            .select("id", count="exact", head=True)
             .eq("user_id", user_id)
             .eq("status", "scheduled")
             .gte("scheduled_time", today_utc_iso)
             .lt("scheduled_time", tomorrow_utc_iso)
             .execute()
         )
-        scheduled_today = len(sched_res.data or [])
+        scheduled_today = sched_res.count if getattr(sched_res, "count", None) is not None else len(sched_res.data or [])
 
         # Yesterday's best performer (by reach + engagement)
         pub_res = (
@@ -160,3 +160,15 @@ def mock_requests_post(monkeypatch) -> MagicMock:
     mock.return_value.raise_for_status = MagicMock()
     monkeypatch.setattr("requests.post", mock)
     return mock
+
+
+@pytest.fixture(autouse=True)
+def reset_api_response_caches():
+    """Drop cross-request API caches so each test sees its own fake data."""
+    routes = sys.modules.get("app.api.routes")
+    if routes is not None:
+        routes._health_cache.clear()
+    yield
+    routes = sys.modules.get("app.api.routes")
+    if routes is not None:
+        routes._health_cache.clear()
@@ -70,6 +70,15 @@ class TestParseJsonResponse:
 
         assert result["hook"] == "Test"
 
+    def test_parse_json_ignores_trailing_fragments_and_braces_in_strings(self):
+        """The payload ends at its matching brace, not the last brace in the text."""
+        from ai_generator import parse_json_response
+
+        response = 'Result: {"hook": "Use {braces} \\"wisely\\"", "tags": ["a]"]} Note: {"ignored": true}'
+        result = parse_json_response(response)
+
+        assert result == {"hook": 'Use {braces} "wisely"', "tags": ["a]"]}
+
     def test_parse_json_with_surrounding_text(self):
         """Test parsing JSON with surrounding text."""
         from ai_generator import parse_json_response
@@ -240,6 +249,54 @@ class TestGenerateSingle:
         assert len(result["slides"][0]["body"].split()) <= 20
 
 
+class TestBuildRegenerationPrompt:
+    """Tests for build_regeneration_prompt function."""
+
+    def test_regeneration_prompt_includes_metadata_for_short_drafts(self):
+        from ai_generator import build_regeneration_prompt
+
+        prompt = build_regeneration_prompt(
+            {"hook": "Hook", "generated_text": "Short body", "post_type": "post"},
+            "post",
+            "en",
+            "friendly",
+            instruction="Make it punchier",
+        )
+
+        assert "Current content:\nShort body" in prompt
+        assert '"post_type": "post"' in prompt
+        assert prompt.endswith("Additional instruction: Make it punchier\n")
+
+    def test_regeneration_prompt_caps_long_hooks_used_as_title(self):
+        from ai_generator import build_regeneration_prompt
+
+        prompt = build_regeneration_prompt(
+            {"hook": "h" * 500, "generated_text": "Body"},
+            "post",
+            "en",
+            "friendly",
+        )
+
+        assert f"Article title: {'h' * 200}\n" in prompt
+
+    def test_regeneration_prompt_matches_full_dump_for_long_drafts(self):
+        from ai_generator import build_generation_prompt, build_regeneration_prompt
+
+        row = {"hook": "Hook", "generated_text": "x" * 2000, "post_type": "post"}
+        expected = build_generation_prompt(
+            {
+                "title": "Hook",
+                "content": f"Current content:\n{row['generated_text']}\n\nExisting metadata:\n"
+                + json.dumps(row, ensure_ascii=False),
+            },
+            "post",
+            "en",
+            "friendly",
+        )
+
+        assert build_regeneration_prompt(row, "post", "en", "friendly") == expected
+
+
 class TestSaveProcessedContent:
     """Tests for save_processed_content function."""
 
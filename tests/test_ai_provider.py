@@ -267,7 +267,7 @@ def test_generate_uses_fallback_provider_after_primary_failure(monkeypatch):
 
     calls = []
 
-    def fake_generate_with_retry(provider_name, api_key, model, prompt, max_tokens, temperature, retries=3):
+    def fake_generate_with_retry(provider_name, api_key, model, prompt, max_tokens, temperature, retries=3, json_response=False):
         calls.append((provider_name, model, api_key))
         if provider_name == "claude":
             raise ai_provider.AIProviderError("claude", model, "Anthropic Claude could not complete the request.")
@@ -288,3 +288,254 @@ def test_generate_uses_fallback_provider_after_primary_failure(monkeypatch):
     assert result == "fallback-ok"
     assert calls[0][0] == "claude"
     assert calls[1][0] == "openrouter"
+
+
+def test_generate_with_retry_backs_off_on_rate_limits_and_stops_on_bad_key(monkeypatch):
+    import ai_provider
+
+    import pytest
+
+    delays = []
+
+    class FakeProvider:
+        def __init__(self, script):
+            self.script = script
+            self.calls = 0
+
+        def generate(self, prompt, max_tokens, temperature):
+            outcome = self.script[self.calls]
+            self.calls += 1
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+    rate_limited = FakeProvider([RuntimeError("429 Too Many Requests"), RuntimeError("429 Too Many Requests"), "ok"])
+    monkeypatch.setattr(ai_provider, "sleep", delays.append)
+    monkeypatch.setattr(ai_provider, "get_provider", lambda **_kwargs: rate_limited)
+
+    assert ai_provider._generate_with_retry("gemini", "key", "model", "hi", 10, 0.5) == "ok"
+    assert len(delays) == 2
+    assert 0.75 <= delays[0] <= 1.25
+    assert 1.5 <= delays[1] <= 2.5
+
+    bad_key = FakeProvider([RuntimeError("Invalid API key provided"), "unreachable"])
+    monkeypatch.setattr(ai_provider, "get_provider", lambda **_kwargs: bad_key)
+    delays.clear()
+
+    with pytest.raises(ai_provider.AIProviderError):
+        ai_provider._generate_with_retry("gemini", "key", "model", "hi", 10, 0.5)
+    assert bad_key.calls == 1
+    assert delays == []
+
+
+def _http_response(status_code, payload):
+    import json
+
+    import requests
+
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode()
+    response.url = "https://example.invalid/api"
+    return response
+
+
+def test_generate_with_retry_stops_on_invalid_openrouter_key(monkeypatch):
+    import ai_provider
+
+    import pytest
+
+    posts = []
+    delays = []
+
+    def fake_post(url, headers=None, json=None, timeout=None, **_kwargs):
+        posts.append(url)
+        return _http_response(401, {"error": {"message": "No auth credentials found", "code": 401}})
+
+    monkeypatch.setattr(ai_provider.requests, "post", fake_post)
+    monkeypatch.setattr(ai_provider, "sleep", delays.append)
+
+    with pytest.raises(ai_provider.AIProviderError):
+        ai_provider._generate_with_retry("openrouter", "or-key", "openai/gpt-4o-mini", "hi", 10, 0.5)
+    assert len(posts) == 1
+    assert delays == []
+
+
+def test_generate_with_retry_stops_on_invalid_gemini_key(monkeypatch):
+    import ai_provider
+    import engine.gemini_client as gemini_client
+
+    import pytest
+
+    posts = []
+    delays = []
+
+    def fake_post(url, headers=None, params=None, data=None, timeout=None):
+        posts.append(url)
+        return _http_response(400, {
+            "error": {
+                "code": 400,
+                "message": "API key not valid. Please pass a valid API key.",
+                "status": "INVALID_ARGUMENT",
+            }
+        })
+
+    monkeypatch.setattr(gemini_client._SESSION, "post", fake_post)
+    monkeypatch.setattr(ai_provider, "sleep", delays.append)
+
+    with pytest.raises(ai_provider.AIProviderError):
+        ai_provider._generate_with_retry("gemini", "bad-key", "gemini-2.5-flash", "hi", 10, 0.5)
+    assert len(posts) == 1
+    assert delays == []
+
+
+def test_list_providers_is_built_once_per_process():
+    import ai_provider
+
+    assert ai_provider.list_providers() is ai_provider.list_providers()
+
+
+def test_read_until_json_closes_stops_at_first_complete_value():
+    import ai_provider
+
+    consumed = []
+
+    def chunks():
+        for piece in ['Sure! [draft] ```json\n{"hook": "a } in', ' text", "tags": ["x"]', "}\n```", " trailing tokens"]:
+            consumed.append(piece)
+            yield piece
+
+    result = ai_provider._read_until_json_closes(chunks())
+
+    assert result.endswith('{"hook": "a } in text", "tags": ["x"]}')
+    assert consumed[-1] == "}\n```"
+    assert ai_provider._read_until_json_closes(iter(['{"cut": "off'])) == '{"cut": "off'
+
+
+def test_read_until_json_closes_skips_prose_values_that_parse():
+    import ai_provider
+
+    streamed = ['Here is note [1] and the JSON: ', '{"hook": "hi"}', " trailing"]
+    assert ai_provider._read_until_json_closes(iter(streamed)) == 'Here is note [1] and the JSON: {"hook": "hi"}'
+
+    prose_only = ["See [1] and [2] for details."]
+    assert ai_provider._read_until_json_closes(iter(prose_only)) == "See [1] and [2] for details."
+
+    top_level_array = ['  ["a", "b"]', " trailing"]
+    assert ai_provider._read_until_json_closes(iter(top_level_array)) == '  ["a", "b"]'
+
+
+def test_gemini_generate_json_goes_through_gemini_client(monkeypatch):
+    import ai_provider
+    import engine.gemini_client as gemini_client
+
+    calls = []
+
+    def fake_call(self, prompt, max_tokens, temperature):
+        calls.append((self.gemini_key, self.model, prompt, max_tokens, temperature))
+        return '{"hook": "hi"}'
+
+    monkeypatch.setattr(gemini_client.GeminiClient, "_call_gemini", fake_call)
+
+    provider = ai_provider.get_provider(name="gemini", api_key="gem-key", model="gemini-2.5-flash")
+    assert provider.generate_json("json please", max_tokens=64, temperature=0.5) == '{"hook": "hi"}'
+    assert calls == [("gem-key", "gemini-2.5-flash", "json please", 64, 0.5)]
+
+
+def test_openrouter_generate_json_streams_and_closes_early(monkeypatch):
+    import ai_provider
+
+    captured = {}
+
+    class FakeStreamResponse:
+        status_code = 200
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc):
+            captured["closed"] = True
+
+        def raise_for_status(self):
+            return None
+
+        def iter_lines(self):
+            yield b": OPENROUTER PROCESSING"
+            yield b'data: {"choices": [{"delta": {"content": "{\\"hook\\": "}}]}'
+            yield b'data: {"choices": [{"delta": {"content": "\\"hi\\"}"}}]}'
+            captured["read_past_json"] = True
+            yield b'data: {"choices": [{"delta": {"content": " extra"}}]}'
+            yield b"data: [DONE]"
+
+    def fake_post(url, headers=None, json=None, timeout=None, stream=False):
+        captured["json"] = json
+        captured["stream"] = stream
+        return FakeStreamResponse()
+
+    monkeypatch.setattr(ai_provider.requests, "post", fake_post)
+
+    provider = ai_provider.get_provider(name="openrouter", api_key="or-key", model="deepseek/deepseek-r1")
+    result = provider.generate_json("hello router", max_tokens=13, temperature=0.5)
+
+    assert result == '{"hook": "hi"}'
+    assert captured["stream"] is True
+    assert captured["json"]["stream"] is True
+    assert captured["closed"] is True
+    assert "read_past_json" not in captured
+
+
+def test_gemini_client_caches_low_temperature_replies(monkeypatch):
+    import engine.gemini_client as gemini_client
+
+    calls = []
+    monkeypatch.setattr(gemini_client, "_response_cache", gemini_client.OrderedDict())
+    monkeypatch.setattr(gemini_client, "RESPONSE_CACHE_SIZE", 2)
+    monkeypatch.setattr(
+        gemini_client.GeminiClient,
+        "_call_gemini",
+        lambda self, prompt, max_tokens, temperature: calls.append(prompt) or f"reply:{prompt}",
+    )
+    client = gemini_client.GeminiClient(api_key="gem-key", allow_fallback=False)
+
+    assert client.generate("a", temperature=0.1) == "reply:a"
+    assert client.generate("a", temperature=0.1) == "reply:a"
+    assert client.generate("a", temperature=0.7) == "reply:a"
+    assert calls == ["a", "a"]
+
+    client.generate("b", temperature=0.1)
+    client.generate("c", temperature=0.1)
+    client.generate("a", temperature=0.1)
+    assert calls == ["a", "a", "b", "c", "a"]
+
+    other_tenant = gemini_client.GeminiClient(api_key="other-key", allow_fallback=False)
+    other_tenant.generate("a", temperature=0.1)
+    assert calls == ["a", "a", "b", "c", "a", "a"]
+
+
+def test_gemini_client_posts_pre_serialized_payload(monkeypatch):
+    import json
+
+    import engine.gemini_client as gemini_client
+
+    captured = {}
+
+    def fake_post(url, headers=None, params=None, data=None, timeout=None):
+        captured.update(url=url, headers=headers, params=params, data=data, timeout=timeout)
+        body = json.dumps({"candidates": [{"content": {"parts": [{"text": "مرحبا"}]}}]}).encode()
+        return SimpleNamespace(status_code=200, content=body, text=body.decode())
+
+    monkeypatch.setattr(gemini_client._SESSION, "post", fake_post)
+    client = gemini_client.GeminiClient(api_key="gem-key", allow_fallback=False)
+
+    assert client._call_gemini("قل مرحبا", 64, 0.5) == "مرحبا"
+    assert captured["headers"] == {"Content-Type": "application/json"}
+    assert captured["params"] == {"key": "gem-key"}
+    assert captured["timeout"] == (
+        gemini_client.config.HTTP_CONNECT_TIMEOUT_SECONDS,
+        gemini_client.config.HTTP_TIMEOUT_SECONDS + 10,
+    )
+    assert isinstance(captured["data"], bytes)
+    assert json.loads(captured["data"]) == {
+        "contents": [{"parts": [{"text": "قل مرحبا"}]}],
+        "generationConfig": {"temperature": 0.5, "maxOutputTokens": 64},
+    }
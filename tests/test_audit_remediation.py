@@ -6,7 +6,7 @@ from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
-from flask import Flask, render_template, session
+from flask import Flask, g, render_template, request, session
 from werkzeug.exceptions import HTTPException
 
 from app import create_app
@@ -267,6 +267,51 @@ def test_bootstrap_route_degrades_gracefully_when_section_fails(monkeypatch):
     assert payload["_bootstrap"]["errors"]
 
 
+def test_bootstrap_sections_run_concurrently_in_request_context():
+    import threading
+
+    app = Flask(__name__)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _section(name):
+        barrier.wait()
+        return {"name": name, "page": request.args.get("page"), "marker": g.bootstrap_marker}
+
+    errors = []
+    with app.test_request_context("/api/bootstrap?page=dashboard", method="GET"):
+        g.bootstrap_marker = "shared"
+        results = api_routes._run_bootstrap_sections(
+            {
+                "first": (lambda: _section("first"), {}),
+                "second": (lambda: _section("second"), {}),
+            },
+            errors,
+        )
+
+    assert errors == []
+    assert results["first"] == {"name": "first", "page": "dashboard", "marker": "shared"}
+    assert results["second"]["name"] == "second"
+
+
+def test_app_json_provider_matches_default_output(monkeypatch):
+    from datetime import datetime, timezone
+
+    import config
+    from flask.json.provider import DefaultJSONProvider
+
+    app = create_app()
+    payload = {"b": [1, 2], "a": "مرحبا", "when": datetime(2026, 1, 2, 3, 4, tzinfo=timezone.utc)}
+
+    with app.test_request_context("/"):
+        body = app.json.response(payload).get_data(as_text=True)
+        stdlib = DefaultJSONProvider(app)
+        assert json.loads(body) == json.loads(stdlib.response(payload).get_data(as_text=True))
+        assert app.json.loads(b'{"ok": true}') == {"ok": True}
+
+        monkeypatch.setattr(config, "orjson", None)
+        assert json.loads(app.json.dumps(payload)) == json.loads(body)
+
+
 def test_server_templates_render_csrf_tokens():
     app = create_app()
 
@@ -492,6 +537,566 @@ def test_sqlite_query_builder_rejects_unknown_column(tmp_path):
         db.table("raw_articles").select("*").eq("bad_column;drop", "value").execute()
 
 
+def test_sqlite_query_builder_inserts_row_batches_in_order(tmp_path):
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "batch.db"))
+
+    result = db.table("scheduled_posts").insert(
+        [
+            {"content_id": "content-2", "scheduled_time": "2026-01-22T10:00:00"},
+            {"content_id": "content-1", "scheduled_time": "2026-01-22T12:00:00"},
+        ]
+    ).execute()
+
+    assert [row["content_id"] for row in result.data] == ["content-2", "content-1"]
+    assert all(row["id"] for row in result.data)
+
+
+def test_sqlite_batch_insert_groups_mixed_row_shapes(tmp_path):
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "shapes.db"))
+    rows = [
+        {"content_id": "a", "scheduled_time": "2026-01-22T10:00:00"},
+        {"content_id": "b", "scheduled_time": "2026-01-22T11:00:00", "timezone": "Europe/Paris"},
+        {"content_id": "c", "scheduled_time": "2026-01-22T12:00:00"},
+    ]
+
+    result = db.table("scheduled_posts").insert(rows).execute()
+
+    assert [row["content_id"] for row in result.data] == ["a", "b", "c"]
+    assert result.data[1]["timezone"] == "Europe/Paris"
+    assert len({row["id"] for row in result.data}) == 3
+
+
+def test_sqlite_status_counts_rpc_groups_in_one_statement(tmp_path):
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "status_rpc.db"))
+    db.table("processed_content").insert([
+        {"user_id": "u1", "post_type": "text", "generated_text": "a", "status": "failed"},
+        {"user_id": "u1", "post_type": "text", "generated_text": "b", "status": "failed"},
+        {"user_id": "u1", "post_type": "text", "generated_text": "c", "status": "drafted"},
+        {"user_id": "u1", "post_type": "text", "generated_text": "d", "status": "published"},
+        {"user_id": "u2", "post_type": "text", "generated_text": "e", "status": "failed"},
+    ]).execute()
+    statements = []
+    with db._get_conn() as conn:
+        conn.set_trace_callback(statements.append)
+
+    result = db.rpc(
+        "processed_content_status_counts",
+        {"p_user_id": "u1", "p_statuses": ["failed", "drafted", "retry_scheduled"]},
+    ).execute()
+
+    assert {row["status"]: row["count"] for row in result.data} == {"failed": 2, "drafted": 1}
+    assert len([sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]) == 1
+
+
+def test_sqlite_insert_returns_defaults_without_rereading(tmp_path):
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "returning.db"))
+    statements = []
+    with db._get_conn() as conn:
+        conn.set_trace_callback(statements.append)
+
+    result = db.table("raw_articles").insert({"source_name": "s", "title": "t", "url": "https://example.com/a", "keywords": ["x"]}).execute()
+
+    (row,) = result.data
+    assert row["status"] == "pending"
+    assert row["scraped_at"]
+    assert row["keywords"] == ["x"]
+    assert not any(sql.lstrip().upper().startswith("SELECT") for sql in statements)
+
+
+def test_sqlite_reuses_cached_sql_for_repeated_query_shapes(tmp_path):
+    from database import database as database_module
+
+    db = database_module.SQLiteDB(str(tmp_path / "shapes_cache.db"))
+    db.table("scheduled_posts").insert({"content_id": "a", "scheduled_time": "2026-01-22T10:00:00"}).execute()
+    database_module._select_sql.cache_clear()
+
+    for content_id in ("a", "b", "a"):
+        db.table("scheduled_posts").select("*").eq("content_id", content_id).limit(1).execute()
+
+    info = database_module._select_sql.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+    with pytest.raises(ValueError, match="Invalid column name"):
+        db.table("scheduled_posts").update({"status": "failed"}).eq("missing", "a").execute()
+
+
+def test_sqlite_rows_decode_json_array_columns_only_when_selected(tmp_path):
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "rows.db"))
+    db.table("raw_articles").insert({"source_name": "s", "title": "t", "url": "https://example.com/b", "keywords": ["ai", "news"]}).execute()
+
+    (full,) = db.table("raw_articles").select("*").execute().data
+    (narrow,) = db.table("raw_articles").select("title").execute().data
+
+    assert full["keywords"] == ["ai", "news"]
+    assert narrow == {"title": "t"}
+
+
+def test_sqlite_head_count_returns_only_the_row_count(tmp_path):
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "count.db"))
+    db.table("scheduled_posts").insert(
+        [
+            {"content_id": "a", "scheduled_time": "2026-01-22T10:00:00", "status": "scheduled"},
+            {"content_id": "b", "scheduled_time": "2026-01-22T11:00:00", "status": "scheduled"},
+            {"content_id": "c", "scheduled_time": "2026-01-22T12:00:00", "status": "published"},
+        ]
+    ).execute()
+
+    result = db.table("scheduled_posts").select("id", count="exact", head=True).eq("status", "scheduled").execute()
+
+    assert result.count == 2
+    assert result.data == []
+
+
+def test_sqlite_where_builder_flattens_in_filters_in_order(tmp_path):
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "where.db"))
+    query = db.table("scheduled_posts").select("*").eq("user_id", "u1").in_("status", ["scheduled", "failed"]).lte("scheduled_time", "2026")
+
+    assert query._build_where() == (
+        (("user_id", "=", 1), ("status", "IN", 2), ("scheduled_time", "<=", 1)),
+        ("u1", "scheduled", "failed", "2026"),
+    )
+    assert db.table("scheduled_posts").eq("status", "scheduled")._build_where() == ((("status", "=", 1),), ("scheduled",))
+
+
+def test_sqlite_writes_json_array_columns_compactly(tmp_path):
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "json_cols.db"))
+    (row,) = db.table("raw_articles").insert({"source_name": "s", "title": "t", "url": "https://example.com/c", "keywords": ["a", "b"]}).execute().data
+    db.table("raw_articles").update({"keywords": ["c"]}).eq("id", row["id"]).execute()
+
+    assert db.execute("SELECT keywords FROM raw_articles") == [{"keywords": '["c"]'}]
+    assert db.table("raw_articles").select("keywords").execute().data == [{"keywords": ["c"]}]
+
+
+def test_sqlite_write_queries_take_the_write_lock_up_front(tmp_path):
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "immediate.db"))
+    statements = []
+    with db._get_conn() as conn:
+        conn.set_trace_callback(statements.append)
+
+    db.table("scheduled_posts").select("*").execute()
+    assert "BEGIN IMMEDIATE" not in statements
+
+    db.table("scheduled_posts").insert({"content_id": "a", "scheduled_time": "2026-01-22T10:00:00"}).execute()
+    assert statements.count("BEGIN IMMEDIATE") == 1
+    assert not conn.in_transaction
+
+
+def test_sqlite_schema_bootstrap_runs_once_per_database_file(tmp_path, monkeypatch):
+    from database.database import SQLiteDB
+
+    db_path = tmp_path / "once.db"
+    created = []
+    real_create = SQLiteDB._create_tables
+    monkeypatch.setattr(SQLiteDB, "_create_tables", lambda self: created.append(self.db_path) or real_create(self))
+
+    SQLiteDB(str(db_path))
+    SQLiteDB(str(db_path))
+    assert len(created) == 1
+
+    db_path.unlink()
+    db = SQLiteDB(str(db_path))
+    assert len(created) == 2
+    assert db.table("raw_articles").select("*").execute().data == []
+
+
+def test_sqlite_schema_version_skips_ddl_in_later_processes(tmp_path, monkeypatch):
+    from database import database as db_module
+
+    db_path = tmp_path / "versioned.db"
+    db = db_module.SQLiteDB(str(db_path))
+    with db._get_conn() as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == db_module._SCHEMA_VERSION
+        conn.execute("DROP INDEX idx_articles_status")
+    db.close()
+
+    # A fresh process has no in-memory record of the file, only its header.
+    monkeypatch.setattr(db_module, "_ensured_db_paths", set())
+    db = db_module.SQLiteDB(str(db_path))
+    assert db.execute("SELECT name FROM sqlite_master WHERE name = 'idx_articles_status'") == []
+
+    monkeypatch.setattr(db_module, "_SCHEMA_VERSION", db_module._SCHEMA_VERSION + 1)
+    monkeypatch.setattr(db_module, "_ensured_db_paths", set())
+    db = db_module.SQLiteDB(str(db_path))
+    assert db.execute("SELECT name FROM sqlite_master WHERE name = 'idx_articles_status'") != []
+
+
+def test_sqlite_upsert_inserts_then_updates_keyed_rows(tmp_path):
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "upsert.db"))
+    table = lambda: db.table("system_status")
+
+    table().upsert([{"key": "a", "value": "1"}, {"key": "b", "value": "2"}], on_conflict="key").execute()
+    result = table().upsert([{"key": "a", "value": "3"}], on_conflict="key").execute()
+
+    assert [(row["key"], row["value"]) for row in result.data] == [("a", "3")]
+    rows = table().select("key, value").order("key").execute().data
+    assert rows == [{"key": "a", "value": "3"}, {"key": "b", "value": "2"}]
+
+
+def test_error_rate_counts_sqlite_outcomes_in_one_query(tmp_path, monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    import error_handler
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "errors.db"))
+    now = datetime.now(timezone.utc).isoformat()
+    old = (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
+    db.table("processed_content").insert([
+        {"post_type": "post", "generated_text": "a", "status": "failed", "last_error_at": now},
+        {"post_type": "post", "generated_text": "b", "status": "failed", "last_error_at": old},
+        {"post_type": "post", "generated_text": "c", "status": "published", "generated_at": now},
+        {"post_type": "post", "generated_text": "d", "status": "published", "generated_at": now},
+        {"post_type": "post", "generated_text": "e", "status": "published", "generated_at": now},
+        {"post_type": "post", "generated_text": "f", "status": "rejected", "generated_at": now},
+    ]).execute()
+    monkeypatch.setattr(error_handler.database, "get_db", lambda: db)
+    queries = []
+    real_execute = db.execute
+    monkeypatch.setattr(db, "execute", lambda sql, params=(): queries.append(sql) or real_execute(sql, params))
+
+    assert error_handler.get_recent_error_rate(hours=24) == 0.25
+    assert len(queries) == 1
+
+
+def test_facebook_tokens_are_decrypted_once_per_file_version(tmp_path, monkeypatch):
+    import engine.facebook_oauth as facebook_oauth
+
+    token_file = tmp_path / ".fb_tokens.json"
+    token_file.write_text(json.dumps({"page_id": "p1", "page_token": "enc-page", "user_token": "enc-user"}))
+    decrypted = []
+    monkeypatch.setattr(facebook_oauth, "TOKEN_FILE", token_file)
+    monkeypatch.setattr(facebook_oauth, "_token_cache", None)
+    monkeypatch.setattr(facebook_oauth, "_decrypt_token", lambda value: decrypted.append(value) or value[4:])
+
+    first = facebook_oauth.load_tokens()
+    first["page_token"] = "mutated"
+    assert facebook_oauth.load_tokens()["page_token"] == "page"
+    assert len(decrypted) == 2
+
+    token_file.write_text(json.dumps({"page_id": "p2", "page_token": "enc-page2", "user_token": "enc-user2"}))
+    assert facebook_oauth.load_tokens()["page_id"] == "p2"
+    assert len(decrypted) == 4
+
+
+def test_facebook_graph_non_json_body_is_a_request_exception(monkeypatch):
+    import requests
+
+    import engine.facebook_oauth as facebook_oauth
+
+    class ProxyErrorPage:
+        content = b"<html><body>502 Bad Gateway</body></html>"
+
+        def raise_for_status(self):
+            return None
+
+    monkeypatch.setattr(facebook_oauth._SESSION, "get", lambda url, params=None, timeout=None: ProxyErrorPage())
+
+    with pytest.raises(requests.RequestException):
+        facebook_oauth.get_page_token("user-token", "page-1")
+
+
+def test_facebook_token_encryption_reuses_one_fernet(monkeypatch):
+    from cryptography.fernet import Fernet
+
+    import engine.facebook_oauth as facebook_oauth
+
+    key = Fernet.generate_key()
+    monkeypatch.setattr(facebook_oauth, "_get_encryption_key", lambda: key)
+    facebook_oauth._get_fernet.cache_clear()
+    try:
+        encrypted = facebook_oauth._encrypt_token("secret")
+        assert Fernet(key).decrypt(encrypted.encode()) == b"secret"
+        assert facebook_oauth._decrypt_token(encrypted) == "secret"
+        assert facebook_oauth._get_fernet.cache_info().misses == 1
+    finally:
+        facebook_oauth._get_fernet.cache_clear()
+
+
+def test_facebook_user_pages_are_cached_per_token_until_invalidated(monkeypatch):
+    import engine.facebook_oauth as facebook_oauth
+
+    calls = []
+
+    class FakeResponse:
+        content = json.dumps({"data": [{"id": "p1", "name": "Page", "access_token": "page-token"}]}).encode()
+
+        def raise_for_status(self):
+            return None
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(params["access_token"])
+        return FakeResponse()
+
+    monkeypatch.setattr(facebook_oauth._SESSION, "get", fake_get)
+    monkeypatch.setattr(facebook_oauth, "_pages_cache", {})
+
+    first = facebook_oauth.get_user_pages("user-token")
+    first[0]["name"] = "mutated"
+    assert facebook_oauth.get_user_pages("user-token")[0]["name"] == "Page"
+    assert calls == ["user-token"]
+    assert all("user-token" not in key for key in facebook_oauth._pages_cache)
+
+    facebook_oauth.get_user_pages("other-token")
+    facebook_oauth.invalidate_pages_cache()
+    facebook_oauth.get_user_pages("user-token")
+    assert calls == ["user-token", "other-token", "user-token"]
+
+
+def test_facebook_graph_retries_fit_inside_the_worker_timeout():
+    import engine.facebook_oauth as facebook_oauth
+
+    retries = facebook_oauth._SESSION.get_adapter("https://graph.facebook.com").max_retries
+
+    assert retries.read == 0
+    read_windows = 1 + min(retries.total, retries.status)
+    assert read_windows * 30 + retries.backoff_factor * 2 ** read_windows < 120
+
+
+def test_sqlite_connections_use_wal_and_relaxed_sync(tmp_path):
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "wal.db"))
+
+    with db._get_conn() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+
+
+def test_sqlite_reuses_one_connection_per_thread_and_commits_outermost(tmp_path):
+    import sqlite3
+    import threading
+
+    from database.database import SQLiteDB
+
+    db = SQLiteDB(str(tmp_path / "pool.db"))
+    with db._get_conn() as first, db._get_conn() as second:
+        assert first is second
+        first.execute("INSERT INTO system_status (key, value) VALUES ('k', 'v')")
+    assert db.execute("SELECT value FROM system_status WHERE key = 'k'") == [{"value": "v"}]
+
+    other = []
+    worker = threading.Thread(target=lambda: other.append(db._thread_connection().conn))
+    worker.start()
+    worker.join()
+    assert other[0] is not first
+
+    with pytest.raises(RuntimeError):
+        with db._get_conn() as conn:
+            conn.execute("INSERT INTO system_status (key, value) VALUES ('gone', 'v')")
+            raise RuntimeError("boom")
+    assert db.execute("SELECT key FROM system_status WHERE key = 'gone'") == []
+
+    db.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.execute("SELECT 1")
+
+
+def test_facebook_oauth_url_matches_full_urlencode(monkeypatch):
+    from urllib.parse import urlencode
+
+    import engine.facebook_oauth as fb_oauth
+
+    monkeypatch.setattr(fb_oauth, "FB_APP_ID", "app-id")
+    monkeypatch.setattr(fb_oauth, "FB_REDIRECT_URI", "http://localhost:5000/oauth/facebook/callback")
+    params = {
+        "client_id": "app-id",
+        "redirect_uri": "http://localhost:5000/oauth/facebook/callback",
+        "scope": ",".join(fb_oauth.FB_PERMISSIONS),
+        "response_type": "code",
+        "state": "a b/&c",
+    }
+
+    assert fb_oauth.get_oauth_url("a b/&c") == f"https://www.facebook.com/v19.0/dialog/oauth?{urlencode(params)}"
+
+    monkeypatch.setattr(fb_oauth, "FB_APP_ID", "")
+    with pytest.raises(ValueError):
+        fb_oauth.get_oauth_url()
+
+
+def test_facebook_env_update_merges_and_replaces_atomically(tmp_path):
+    from engine.facebook_oauth import _update_env_file
+
+    env_path = tmp_path / ".env"
+    env_path.write_text("# comment\nFB_APP_ID=app\n\nFACEBOOK_PAGE_ID=old\nFACEBOOK_PAGE_ID_EXTRA=keep")
+
+    _update_env_file(env_path, {"FACEBOOK_PAGE_ID": "new", "FACEBOOK_ACCESS_TOKEN": "to\\ken"})
+
+    assert env_path.read_text().splitlines() == [
+        "# comment",
+        "FB_APP_ID=app",
+        "",
+        "FACEBOOK_PAGE_ID=new",
+        "FACEBOOK_PAGE_ID_EXTRA=keep",
+        "FACEBOOK_ACCESS_TOKEN=to\\ken",
+    ]
+    assert [path.name for path in tmp_path.iterdir()] == [".env"]
+
+
+def test_facebook_env_update_handles_export_and_duplicate_keys(tmp_path):
+    from engine.facebook_oauth import _update_env_file
+
+    env_path = tmp_path / ".env"
+    env_path.write_text(
+        "export FACEBOOK_PAGE_ID=old\n"
+        "FB_APP_ID=app\n"
+        "FACEBOOK_ACCESS_TOKEN=first\n"
+        "# later override\n"
+        "FACEBOOK_ACCESS_TOKEN=stale"
+    )
+
+    _update_env_file(env_path, {"FACEBOOK_PAGE_ID": "new", "FACEBOOK_ACCESS_TOKEN": "token"})
+
+    assert env_path.read_text() == (
+        "export FACEBOOK_PAGE_ID=new\n"
+        "FB_APP_ID=app\n"
+        "FACEBOOK_ACCESS_TOKEN=token\n"
+        "# later override\n"
+    )
+
+
+def test_env_writers_keep_the_file_mode(tmp_path):
+    import os
+    import stat
+
+    from app.utils import _write_env_file
+    from engine.facebook_oauth import _update_env_file
+
+    env_path = tmp_path / ".env"
+    env_path.write_text("FB_APP_SECRET=secret\n")
+    os.chmod(env_path, 0o600)
+
+    _update_env_file(env_path, {"FACEBOOK_ACCESS_TOKEN": "token"})
+    assert stat.S_IMODE(env_path.stat().st_mode) == 0o600
+
+    _write_env_file(env_path, {"FB_APP_SECRET": "rotated"})
+    assert stat.S_IMODE(env_path.stat().st_mode) == 0o600
+    assert env_path.read_text() == "FB_APP_SECRET=rotated\n"
+    assert [path.name for path in tmp_path.iterdir()] == [".env"]
+
+
+def test_image_config_overrides_reload_only_when_file_changes(tmp_path, monkeypatch):
+    import os
+
+    import image_generator
+
+    config_path = tmp_path / "image_config.json"
+    config_path.write_text('{"text_font_size": 40}')
+    monkeypatch.setattr(image_generator, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(image_generator, "_config_overrides_cache", None)
+    reads = []
+    real_loads = image_generator.config.json_loads
+    monkeypatch.setattr(image_generator.config, "json_loads", lambda raw: reads.append(raw) or real_loads(raw))
+
+    assert image_generator.load_config()["text_font_size"] == 40
+    assert image_generator.load_config()["text_font_size"] == 40
+    assert len(reads) == 1
+
+    config_path.write_text('{"text_font_size": 28}')
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert image_generator.load_config()["text_font_size"] == 28
+    assert len(reads) == 2
+
+
+def test_carousel_hex_colors_unpack_channels_and_fall_back_to_brand():
+    from engine.image_generator import _hex_to_rgb
+
+    assert _hex_to_rgb("#12100E") == (18, 16, 14)
+    assert _hex_to_rgb(" f7f3ee ") == (247, 243, 238)
+    assert _hex_to_rgb("") == (249, 199, 79)
+    assert _hex_to_rgb("#abc") == (249, 199, 79)
+    assert _hex_to_rgb("12_345") == (249, 199, 79)
+
+
+def test_arabic_font_is_loaded_once_per_size(monkeypatch):
+    import image_generator
+
+    loads = []
+    real_truetype = image_generator.ImageFont.truetype
+    monkeypatch.setattr(
+        image_generator.ImageFont,
+        "truetype",
+        lambda path, size: loads.append((path, size)) or real_truetype(path, size),
+    )
+    image_generator.get_arabic_font.cache_clear()
+    try:
+        assert image_generator.get_arabic_font(40) is image_generator.get_arabic_font(40)
+        image_generator.get_arabic_font(20)
+        assert [size for _, size in loads] == [40, 20]
+    finally:
+        image_generator.get_arabic_font.cache_clear()
+
+
+def test_post_template_is_decoded_once_per_file_version(tmp_path, monkeypatch):
+    import os
+
+    import image_generator
+    from PIL import Image
+
+    template_path = tmp_path / "template.png"
+    Image.new("RGB", (64, 80), (10, 20, 30)).save(template_path)
+    opened = []
+    real_open = image_generator.Image.open
+    monkeypatch.setattr(image_generator.Image, "open", lambda path: opened.append(path) or real_open(path))
+    monkeypatch.setattr(image_generator, "_template_cache", {})
+
+    for index in range(2):
+        output = image_generator.generate_post_image(
+            output_path=str(tmp_path / f"out{index}.png"), template_path=str(template_path)
+        )
+        with real_open(output) as img:
+            assert img.size == (64, 80)
+    assert opened == [template_path]
+
+    first = image_generator._load_template(template_path)
+    first.putpixel((0, 0), (255, 255, 255, 255))
+    assert image_generator._load_template(template_path).getpixel((0, 0)) == (10, 20, 30, 255)
+
+    Image.new("RGB", (32, 40)).save(template_path)
+    os.utime(template_path, ns=(1, 1))
+    assert image_generator._load_template(template_path).size == (32, 40)
+
+
+def test_wrap_text_measures_each_word_once():
+    import image_generator
+
+    measured = []
+
+    class FakeFont:
+        def getlength(self, text):
+            measured.append(text)
+            return 10.0 * len(text)
+
+        def getbbox(self, text):
+            raise AssertionError("wrap_text should not re-measure whole lines")
+
+    lines = image_generator.wrap_text("aa bbb c dddd eeeee ffffff", FakeFont(), max_width=70, max_lines=3)
+
+    assert lines == ["aa bbb", "c dddd", "eeeee"]
+    assert measured == [" ", "aa", "bbb", "c", "dddd", "eeeee", "ffffff"]
+
+
 def test_get_unpublished_content_does_not_call_can_publish_per_item(monkeypatch):
     from publication_tracker import PublicationTracker
 
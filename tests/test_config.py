@@ -92,6 +92,38 @@ class TestDatabaseClientContract:
         assert args == ("https://test.supabase.co", "test-key")
         assert isinstance(kwargs.get("options"), SyncClientOptions)
 
+    @patch("supabase.create_client")
+    def test_get_supabase_service_client_uses_keep_alive_pool(self, mock_create, monkeypatch):
+        import httpx
+        from config import get_supabase_service_client
+
+        monkeypatch.setenv("SUPABASE_URL", "https://pool.supabase.co")
+        monkeypatch.setenv("SUPABASE_KEY", "pool-key")
+        mock_create.return_value = MagicMock()
+
+        get_supabase_service_client()
+
+        http_client = mock_create.call_args.kwargs["options"].httpx_client
+        assert isinstance(http_client, httpx.Client)
+        pool = http_client._transport._pool
+        assert pool._max_keepalive_connections == 15
+        assert pool._max_connections == 30
+        assert pool._keepalive_expiry == 30.0
+
+    @patch("supabase.create_client")
+    def test_supabase_wrapper_shares_service_client(self, mock_create, monkeypatch):
+        from config import get_supabase_service_client
+        from database import SupabaseWrapper
+
+        monkeypatch.setenv("SUPABASE_URL", "https://shared.supabase.co")
+        monkeypatch.setenv("SUPABASE_KEY", "shared-key")
+        mock_create.return_value = MagicMock()
+
+        wrapper = SupabaseWrapper()
+
+        assert wrapper._client is get_supabase_service_client()
+        mock_create.assert_called_once()
+
     def test_get_supabase_service_client_missing_url(self, monkeypatch):
         from config import get_supabase_service_client
 
@@ -179,6 +211,28 @@ class TestLoadEnv:
         mock_load_dotenv.assert_called_once_with(override=True)
 
 
+class TestJsonLoads:
+    """Tests for the json_loads helper."""
+
+    def test_json_loads_accepts_str_and_bytes(self):
+        from config import json_loads
+
+        assert json_loads('{"lang": "ar"}') == {"lang": "ar"}
+        assert json_loads('{"text": "مرحبا"}'.encode("utf-8")) == {"text": "مرحبا"}
+
+    def test_json_loads_falls_back_to_stdlib(self, monkeypatch):
+        import config
+
+        monkeypatch.setattr(config, "orjson", None)
+        assert config.json_loads("[1, 2]") == [1, 2]
+
+    def test_json_loads_raises_value_error_on_malformed_input(self):
+        from config import json_loads
+
+        with pytest.raises(ValueError):
+            json_loads("{not json")
+
+
 class TestDefaultKeywords:
     """Tests for DEFAULT_KEYWORDS constant."""
 
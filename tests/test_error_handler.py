@@ -83,6 +83,17 @@ class TestClassifyError:
         action, code = classify_error(Exception("Service Unavailable"))
         assert action == ErrorAction.RETRY
 
+    def test_server_error_status_code_regex(self):
+        """Bare 5xx status codes still go through the regex pattern."""
+        from error_handler import classify_error, ErrorAction
+
+        action, code = classify_error(Exception("Upstream returned 502"))
+        assert action == ErrorAction.RETRY
+        assert code == "SERVER_ERROR"
+
+        _, code = classify_error(Exception("order 5021 failed"))
+        assert code == "UNKNOWN"
+
     def test_unknown_error_fallback(self):
         """Test that unknown errors fall back to RETRY with UNKNOWN code."""
         from error_handler import classify_error, ErrorAction
@@ -172,6 +183,39 @@ class TestExecuteAction:
         result = execute_action(ErrorAction.NEEDS_ACTION, "test-id", "AUTH_ERROR")
         assert result is False
 
+    @patch("error_handler.database")
+    def test_cooldown_writes_system_status_in_one_upsert(self, mock_db_module):
+        """All status keys for an action go out in a single upsert."""
+        from error_handler import execute_action, ErrorAction
+
+        mock_db = MagicMock()
+        mock_db_module.get_db.return_value = mock_db
+        mock_table = MagicMock()
+        mock_db.table.return_value = mock_table
+
+        execute_action(ErrorAction.COOLDOWN, "test-id", "RATE_LIMIT")
+
+        mock_table.upsert.assert_called_once()
+        rows = mock_table.upsert.call_args.args[0]
+        assert [row["key"] for row in rows] == ["cooldown_until", "last_error_code", "last_error_action"]
+        assert mock_table.upsert.call_args.kwargs == {"on_conflict": "key"}
+
+    @patch("error_handler.database")
+    def test_retry_backoff_derives_from_one_timestamp(self, mock_db_module):
+        """next_retry_at is exactly the backoff after last_error_at."""
+        from error_handler import execute_action, ErrorAction
+
+        mock_db = MagicMock()
+        mock_db_module.get_db.return_value = mock_db
+        mock_table = MagicMock()
+        mock_db.table.return_value = mock_table
+
+        execute_action(ErrorAction.RETRY, "test-id", "SERVER_ERROR", retry_count=2)
+
+        payload = mock_table.update.call_args.args[0]
+        delay = datetime.fromisoformat(payload["next_retry_at"]) - datetime.fromisoformat(payload["last_error_at"])
+        assert delay == timedelta(minutes=20)
+
 
 class TestIsInCooldown:
     """Tests for is_in_cooldown — system cooldown check."""
@@ -186,8 +230,8 @@ class TestIsInCooldown:
         mock_db = MagicMock()
         mock_db_module.get_db.return_value = mock_db
         mock_table = MagicMock()
-        mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            MagicMock(data={"value": future})
+        mock_table.select.return_value.eq.return_value.limit.return_value.execute.return_value = (
+            MagicMock(data=[{"value": future}])
         )
         mock_db.table.return_value = mock_table
 
@@ -203,8 +247,8 @@ class TestIsInCooldown:
         mock_db = MagicMock()
         mock_db_module.get_db.return_value = mock_db
         mock_table = MagicMock()
-        mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            MagicMock(data={"value": past})
+        mock_table.select.return_value.eq.return_value.limit.return_value.execute.return_value = (
+            MagicMock(data=[{"value": past}])
         )
         mock_db.table.return_value = mock_table
 
@@ -218,8 +262,8 @@ class TestIsInCooldown:
         mock_db = MagicMock()
         mock_db_module.get_db.return_value = mock_db
         mock_table = MagicMock()
-        mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-            MagicMock(data=None)
+        mock_table.select.return_value.eq.return_value.limit.return_value.execute.return_value = (
+            MagicMock(data=[])
         )
         mock_db.table.return_value = mock_table
 
@@ -64,6 +64,9 @@ class FakeDBClient:
     def table(self, name: str):
         return FakeQuery(self.responses.setdefault(name, []))
 
+    def rpc(self, name: str, _params=None):
+        return FakeQuery(self.responses.setdefault(f"rpc:{name}", []))
+
 
 def _patch_authenticated_user(monkeypatch):
     fake_user = FakeUser()
@@ -82,10 +85,13 @@ def test_load_health_status_payload_uses_real_tenant_data(monkeypatch):
                 "retry_count": 2,
                 "next_retry_at": "2099-01-01T09:00:00+00:00",
             }]},
-            {"count": 2},
-            {"count": 1},
-            {"count": 3},
-            {"count": 0},
+        ],
+        "rpc:processed_content_status_counts": [
+            {"data": [
+                {"status": "retry_scheduled", "count": 2},
+                {"status": "failed", "count": 1},
+                {"status": "waiting_approval", "count": 3},
+            ]},
         ],
         "scheduled_posts": [
             {"data": [{"scheduled_time": "2026-03-22T12:00:00+00:00"}]},
@@ -129,6 +135,62 @@ def test_load_health_status_payload_uses_real_tenant_data(monkeypatch):
     assert payload["last_error"]["message"] == "SERVER_ERROR — retry queued"
 
 
+def test_health_status_counts_fall_back_to_per_bucket_counts_without_rpc(monkeypatch):
+    class NoRpcDB(FakeDBClient):
+        def rpc(self, name: str, _params=None):
+            raise RuntimeError("function processed_content_status_counts does not exist")
+
+    fake_db = NoRpcDB({
+        "processed_content": [{"count": 2}, {"count": 1}, {"count": 3}, {"count": 4}],
+    })
+
+    counts = api_routes._load_status_counts(fake_db, "user-123")
+
+    assert counts == {"retry_scheduled": 2, "failed": 1, "waiting_approval": 3, "drafted": 4}
+
+
+def test_load_health_status_payload_reuses_recent_result_across_requests(monkeypatch):
+    calls = {"tables": 0}
+
+    class CountingDB(FakeDBClient):
+        def table(self, name: str):
+            calls["tables"] += 1
+            return super().table(name)
+
+    monkeypatch.setattr(api_routes.config, "get_database_client", lambda: CountingDB({}))
+    monkeypatch.setattr(app_utils, "get_user_settings", lambda _uid: {})
+    monkeypatch.setattr(app_utils, "get_active_page_health", lambda _uid: {})
+
+    first = api_routes._load_health_status_payload("user-123")
+    queries_after_first = calls["tables"]
+    first["pipeline"]["queue_size"] = 99
+    second = api_routes._load_health_status_payload("user-123")
+
+    assert queries_after_first > 0
+    assert calls["tables"] == queries_after_first
+    assert second["pipeline"]["queue_size"] == 0
+
+
+def test_health_cache_is_bounded_and_drops_expired_entries(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(api_routes.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(api_routes, "_HEALTH_CACHE_MAX_ENTRIES", 2)
+
+    api_routes._health_cache_set("a", {"n": 1})
+    api_routes._health_cache_set("b", {"n": 2})
+    assert api_routes._health_cache_get("a") == {"n": 1}
+    api_routes._health_cache_set("c", {"n": 3})
+
+    assert list(api_routes._health_cache) == ["a", "c"]
+
+    clock["now"] += api_routes._HEALTH_CACHE_TTL_SECONDS + 1
+    assert api_routes._health_cache_get("a") is None
+    assert "a" not in api_routes._health_cache
+
+    api_routes.invalidate_health_cache("c")
+    assert not api_routes._health_cache
+
+
 def test_build_health_events_sorts_real_activity_and_adds_token_warning():
     events = api_routes._build_health_events(
         page_health={
@@ -224,10 +286,6 @@ def test_health_status_does_not_use_env_ai_key_without_explicit_fallback(monkeyp
     fake_db = FakeDBClient({
         "processed_content": [
             {"data": []},
-            {"count": 0},
-            {"count": 0},
-            {"count": 0},
-            {"count": 0},
         ],
         "scheduled_posts": [
             {"data": []},
@@ -254,10 +312,6 @@ def test_health_status_can_use_env_ai_key_when_explicitly_allowed(monkeypatch):
     fake_db = FakeDBClient({
         "processed_content": [
             {"data": []},
-            {"count": 0},
-            {"count": 0},
-            {"count": 0},
-            {"count": 0},
         ],
         "scheduled_posts": [
             {"data": []},
@@ -299,6 +353,15 @@ def test_run_pexels_service_test_reports_success(monkeypatch):
     assert payload["details"]["source"] == "user_settings"
 
 
+def test_run_health_service_test_dispatches_by_registry(monkeypatch):
+    monkeypatch.setitem(api_routes._SERVICE_TESTS, "ai", lambda uid: {"success": True, "service": "ai", "user": uid})
+
+    assert api_routes._run_health_service_test(" AI ", "user-123") == {"success": True, "service": "ai", "user": "user-123"}
+    unknown = api_routes._run_health_service_test("smtp", "user-123")
+    assert unknown["success"] is False
+    assert unknown["service"] == "smtp"
+
+
 def test_health_route_and_service_test_route_return_real_payloads(monkeypatch):
     app = Flask(__name__)
     _patch_authenticated_user(monkeypatch)
@@ -127,6 +127,56 @@ class TestSimHash:
         # Very different texts should have lower similarity
         assert similarity < 0.8
 
+    def test_simhash_matches_per_word_voting(self):
+        """Counting repeated words once per distinct token keeps the fingerprint unchanged."""
+        import hashlib
+
+        from publication_tracker import PublicationTracker
+
+        tracker = PublicationTracker.__new__(PublicationTracker)
+        text = "breaking news breaking AI news today AI AI"
+
+        v = [0] * 64
+        for word in text.lower().split():
+            word_hash = int(hashlib.md5(word.encode()).hexdigest(), 16)
+            for i in range(64):
+                v[i] += 1 if (word_hash >> i) & 1 else -1
+        expected = sum(1 << i for i in range(64) if v[i] > 0)
+
+        assert tracker._compute_simhash(text) == expected
+
+    def test_similarity_threshold_maps_to_integer_distance(self):
+        """The scan's distance cut-off matches the float similarity threshold exactly."""
+        from publication_tracker import PublicationTracker, _max_simhash_distance
+
+        assert _max_simhash_distance(0.8) == 12
+        assert _max_simhash_distance(0.75) == 16
+        assert _max_simhash_distance(1.5) == -1
+
+        tracker = PublicationTracker.__new__(PublicationTracker)
+        tracker._published_hashes = set()
+        base = tracker._compute_simhash("OpenAI releases new GPT-5 model")
+        tracker._published_simhashes = [base ^ 0xFFF]
+
+        is_similar, similarity, _ = tracker.is_similar_content_recent("OpenAI releases new GPT-5 model")
+        assert is_similar is True
+        assert similarity == 1 - 12 / 64
+
+        tracker._published_simhashes = [base ^ 0x1FFF]
+        assert tracker.is_similar_content_recent("OpenAI releases new GPT-5 model")[0] is False
+
+    def test_simhash_is_cached_per_text(self):
+        """Re-checking the same draft reuses its fingerprint instead of re-tokenizing."""
+        from publication_tracker import PublicationTracker, _simhash
+
+        tracker = PublicationTracker.__new__(PublicationTracker)
+        text = "A draft that the scheduler checks on every pass"
+        first = tracker._compute_simhash(text)
+        hits = _simhash.cache_info().hits
+
+        assert tracker._compute_simhash(text) == first
+        assert _simhash.cache_info().hits == hits + 1
+
 
 class TestHammingDistance:
     """Tests for Hamming distance calculation."""
@@ -197,6 +247,28 @@ class TestIsUrlAlreadyUsed:
 
         assert is_used is False
 
+    @patch("config.get_supabase_client")
+    def test_prefetched_article_skips_url_lookup(self, mock_client_fn):
+        """A caller that already holds the article row does not re-read it by URL."""
+        from publication_tracker import PublicationTracker
+
+        mock_client = MagicMock()
+        mock_client_fn.return_value = mock_client
+
+        tracker = PublicationTracker.__new__(PublicationTracker)
+        tracker._published_urls = set()
+        tracker._published_hashes = set()
+        tracker._cache = {}
+
+        is_used, reason = tracker.is_url_already_used(
+            "https://example.com/rejected",
+            article={"id": "article-1", "status": "rejected"},
+        )
+
+        assert is_used is True
+        assert "rejected" in reason.lower()
+        mock_client.table.assert_not_called()
+
 
 class TestIsContentAlreadyPublished:
     """Tests for is_content_already_published method."""
@@ -326,6 +398,22 @@ class TestRecordPublication:
         assert "https://example.com/article" in tracker._published_urls
 
 
+    @patch("config.get_supabase_client")
+    def test_record_publication_uses_supplied_text_without_refetch(self, mock_client_fn):
+        """Callers that already hold the published text skip the row read."""
+        from publication_tracker import PublicationTracker
+
+        tracker = PublicationTracker.__new__(PublicationTracker)
+        tracker._published_urls = set()
+        tracker._published_hashes = set()
+        tracker._cache = {}
+
+        tracker.record_publication("content-1", "fb-post-123", content_text="Test content")
+
+        mock_client_fn.assert_not_called()
+        assert tracker._compute_content_hash("Test content") in tracker._published_hashes
+
+
 class TestGetPublicationStats:
     """Tests for get_publication_stats method."""
 
@@ -361,6 +449,34 @@ class TestGetPublicationStats:
         assert stats["cached_hashes"] == 1
 
 
+    def test_get_stats_uses_one_query_on_sqlite(self, tmp_path, monkeypatch):
+        """Test SQLite stats come from a single tenant-scoped UNION ALL query."""
+        from database.database import SQLiteDB
+        from publication_tracker import PublicationTracker
+
+        db = SQLiteDB(str(tmp_path / "stats.db"))
+        db.table("scheduled_posts").insert(
+            [
+                {"content_id": "a", "scheduled_time": "2026-01-22T10:00:00", "user_id": "u1"},
+                {"content_id": "b", "scheduled_time": "2026-01-22T11:00:00", "user_id": "u2"},
+            ]
+        ).execute()
+        statements = []
+        with db._get_conn() as conn:
+            conn.set_trace_callback(statements.append)
+        monkeypatch.setattr("config.get_supabase_client", lambda: db)
+
+        tracker = PublicationTracker.__new__(PublicationTracker)
+        tracker.user_id = "u1"
+        tracker._published_urls = set()
+        tracker._published_hashes = set()
+        stats = tracker.get_publication_stats()
+
+        assert stats["total_scheduled"] == 1
+        assert stats["total_processed"] == 0
+        assert len(statements) == 1
+
+
 class TestConvenienceFunctions:
     """Tests for module-level convenience functions."""
 
@@ -377,3 +493,22 @@ class TestConvenienceFunctions:
 
         assert can_pub is True
         mock_tracker.can_publish.assert_called_once_with("content-1")
+
+
+def test_get_tracker_reuses_history_until_ttl_expires(monkeypatch):
+    import publication_tracker
+
+    loads = []
+    monkeypatch.setattr(publication_tracker.PublicationTracker, "_load_recent_publications", lambda self: loads.append(self))
+    monkeypatch.setattr(publication_tracker, "_tracker_instances", {})
+    monkeypatch.setattr(publication_tracker, "_tracker_loaded_at", {})
+    clock = [1000.0]
+    monkeypatch.setattr(publication_tracker.time, "monotonic", lambda: clock[0])
+
+    first = publication_tracker.get_tracker("user-1")
+    clock[0] += publication_tracker.TRACKER_HISTORY_TTL_SECONDS
+    assert publication_tracker.get_tracker("user-1") is first
+
+    clock[0] += 1
+    assert publication_tracker.get_tracker("user-1") is not first
+    assert len(loads) == 2
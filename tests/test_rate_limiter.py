@@ -186,3 +186,18 @@ class TestStatusSummaryAndWait:
         limiter.can_post_now = MagicMock(return_value=(False, "Low engagement detected"))
 
         assert limiter.wait_until_can_post().total_seconds() == 24 * 3600
+
+
+class TestGetTodayPostCount:
+    @patch("config.get_database_client")
+    def test_counts_with_head_query(self, mock_client_fn):
+        from rate_limiter import AdaptiveRateLimiter
+
+        table = _table_chain()
+        table.execute.return_value = MagicMock(data=[], count=4)
+        client = MagicMock()
+        client.table.return_value = table
+        mock_client_fn.return_value = client
+
+        assert AdaptiveRateLimiter(user_id="user-1").get_today_post_count() == 4
+        table.select.assert_called_once_with("id", count="exact", head=True)
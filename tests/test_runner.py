@@ -100,3 +100,65 @@ def test_run_all_users_resolves_config_once_per_user(monkeypatch):
     assert summary["users"] == 2
     assert summary["published_total"] == 2
     assert sorted(resolved) == ["user-1", "user-2"]
+
+
+def test_start_scheduler_delays_first_pipeline_run_without_helper_thread(monkeypatch):
+    import threading
+    from datetime import datetime, timedelta, timezone
+
+    monkeypatch.setattr(runner, "_scheduler_started", False)
+    monkeypatch.setattr(runner, "_scheduler_instance", None)
+    monkeypatch.setattr(runner, "PIPELINE_STARTUP_DELAY_SECONDS", 120)
+    monkeypatch.setattr(runner, "run_all_users", lambda: None)
+    monkeypatch.setattr(runner, "run_requested_users", lambda: None)
+    before = datetime.now(timezone.utc)
+
+    runner.start_scheduler()
+    scheduler = runner._scheduler_instance
+    try:
+        job = scheduler.get_job("pipeline_all_users")
+        assert job.next_run_time >= before + timedelta(seconds=120)
+        assert not any(t.name == "pipeline-delay" for t in threading.enumerate())
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+def test_optimize_local_db_only_touches_sqlite(monkeypatch):
+    import database
+
+    calls = []
+
+    class FakeSQLite(database.SQLiteDB):
+        def __init__(self):
+            pass
+
+        def optimize(self):
+            calls.append("optimize")
+
+    monkeypatch.setattr(database, "get_db", lambda: FakeSQLite())
+    runner._optimize_local_db()
+    monkeypatch.setattr(database, "get_db", lambda: MagicMock())
+    runner._optimize_local_db()
+
+    assert calls == ["optimize"]
+
+
+def test_run_scheduler_worker_returns_promptly_when_stopped(monkeypatch):
+    import threading
+
+    scheduler = MagicMock()
+
+    def fake_start():
+        monkeypatch.setattr(runner, "_scheduler_started", True)
+        monkeypatch.setattr(runner, "_scheduler_instance", scheduler)
+
+    monkeypatch.setattr(runner, "start_scheduler", fake_start)
+    monkeypatch.setattr(runner, "_worker_stop", threading.Event())
+
+    worker = threading.Thread(target=runner.run_scheduler_worker)
+    worker.start()
+    runner.stop_scheduler_worker()
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    scheduler.shutdown.assert_called_once_with(wait=False)
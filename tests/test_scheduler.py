@@ -11,6 +11,7 @@ def _table_chain(data=None):
     table.insert.return_value = table
     table.update.return_value = table
     table.eq.return_value = table
+    table.in_.return_value = table
     table.lte.return_value = table
     table.limit.return_value = table
     table.order.return_value = table
@@ -188,8 +189,11 @@ class TestSchedulePosts:
         result = schedule_posts(days=1, max_per_day=2, user_id="user-1")
 
         assert result == 2
-        assert scheduled_table.insert.call_count == 2
-        assert content_table.update.call_count == 2
+        scheduled_table.insert.assert_called_once()
+        assert [row["content_id"] for row in scheduled_table.insert.call_args.args[0]] == ["c1", "c2"]
+        content_table.update.assert_called_once_with({"status": "scheduled"})
+        content_table.in_.assert_called_once_with("id", ["c1", "c2"])
+        content_table.eq.assert_any_call("user_id", "user-1")
 
     @patch("config.get_database_client")
     @patch("scheduler.build_slots_for_day")
@@ -269,7 +273,7 @@ class TestSchedulePosts:
 
         schedule_posts(days=1, user_id="request-user")
 
-        payload = scheduled_table.insert.call_args[0][0]
+        (payload,) = scheduled_table.insert.call_args[0][0]
         assert payload["user_id"] == "row-user"
 
 
@@ -291,6 +295,31 @@ class TestProcessRetries:
         assert content_table.update.call_count >= 1
         assert schedule_table.update.call_count >= 1
 
+    @patch("config.get_database_client")
+    def test_process_retries_batches_updates_and_skips_published(self, mock_client_fn):
+        from scheduler import process_retries
+
+        content_table = _table_chain(
+            [
+                {"id": "c1", "status": "retry_scheduled", "fb_post_id": None},
+                {"id": "c2", "status": "retry_scheduled", "fb_post_id": "fb_1"},
+                {"id": "c3", "status": "retry_scheduled", "fb_post_id": None},
+            ]
+        )
+        schedule_table = _table_chain([{}])
+        client = MagicMock()
+        client.table.side_effect = lambda name: {
+            "processed_content": content_table,
+            "scheduled_posts": schedule_table,
+        }[name]
+        mock_client_fn.return_value = client
+
+        assert process_retries() == 2
+        content_table.update.assert_called_once()
+        content_table.in_.assert_called_once_with("id", ["c1", "c3"])
+        schedule_table.update.assert_called_once_with({"status": "scheduled"})
+        schedule_table.in_.assert_called_once_with("content_id", ["c1", "c3"])
+
 
 class TestScheduleForUser:
     @patch("scheduler.schedule_posts", return_value=3)
@@ -285,7 +285,7 @@ class TestSaveArticles:
         mock_table = MagicMock()
 
         # No existing articles
-        mock_table.select.return_value.eq.return_value.execute.return_value = MagicMock(data=[])
+        mock_table.select.return_value.in_.return_value.execute.return_value = MagicMock(data=[])
         mock_table.insert.return_value.execute.return_value = MagicMock(data=[{}])
 
         mock_client.table.return_value = mock_table
@@ -304,8 +304,8 @@ class TestSaveArticles:
         mock_table = MagicMock()
 
         # All articles exist
-        mock_table.select.return_value.eq.return_value.execute.return_value = MagicMock(
-            data=[{"id": "existing"}]
+        mock_table.select.return_value.in_.return_value.execute.return_value = MagicMock(
+            data=[{"url": article["url"]} for article in sample_articles]
         )
 
         mock_client.table.return_value = mock_table
@@ -322,7 +322,7 @@ class TestSaveArticles:
 
         mock_client = MagicMock()
         mock_table = MagicMock()
-        mock_table.select.return_value.eq.return_value.eq.return_value.execute.return_value = MagicMock(data=[])
+        mock_table.select.return_value.in_.return_value.eq.return_value.execute.return_value = MagicMock(data=[])
         mock_table.insert.return_value.execute.return_value = MagicMock(data=[{}])
         mock_client.table.return_value = mock_table
         mock_client_fn.return_value = mock_client
@@ -330,7 +330,28 @@ class TestSaveArticles:
         saved = scraper.save_articles(sample_articles[:1], user_id="user-1")
 
         assert saved == 1
-        mock_table.select.return_value.eq.return_value.eq.assert_called_with("user_id", "user-1")
+        mock_table.select.return_value.in_.return_value.eq.assert_called_with("user_id", "user-1")
+
+    @patch("config.get_database_client")
+    def test_save_articles_checks_existing_urls_in_one_query(self, mock_client_fn, sample_articles):
+        """Test the duplicate check is one IN lookup, and repeated URLs are saved once."""
+        import scraper
+
+        mock_client = MagicMock()
+        mock_table = MagicMock()
+        mock_table.select.return_value.in_.return_value.execute.return_value = MagicMock(
+            data=[{"url": sample_articles[0]["url"]}]
+        )
+        mock_table.insert.return_value.execute.return_value = MagicMock(data=[{}])
+        mock_client.table.return_value = mock_table
+        mock_client_fn.return_value = mock_client
+
+        saved = scraper.save_articles(sample_articles + [dict(sample_articles[-1])])
+
+        assert saved == len(sample_articles) - 1
+        mock_table.select.return_value.in_.assert_called_once_with(
+            "url", [article["url"] for article in sample_articles]
+        )
 
 
 class TestRunPipeline:
@@ -551,6 +551,24 @@ def test_studio_approve_moves_draft_to_scheduled(monkeypatch):
     assert payload["new_status"] == "scheduled"
 
 
+def test_pipeline_mutations_invalidate_cached_health_counters(monkeypatch):
+    import app.api.routes as api_routes
+
+    app = Flask(__name__)
+    app.register_blueprint(studio_routes.studio_bp)
+    fake_user = FakeUser()
+    _patch_user(monkeypatch, fake_user)
+    monkeypatch.setattr(studio_routes.content_impl, "schedule_content", lambda _content_id: {"success": True})
+    monkeypatch.setattr(studio_routes.content_impl, "get_scheduled_content", lambda limit=50: {"success": True})
+
+    api_routes._health_cache_set(fake_user.id, {"pipeline": {"queue_size": 0}})
+    app.test_client().get("/api/content/scheduled")
+    assert fake_user.id in api_routes._health_cache
+
+    app.test_client().post("/api/content/pc-1/schedule")
+    assert fake_user.id not in api_routes._health_cache
+
+
 def test_studio_approve_rejects_draft_only_formats(monkeypatch):
     app = Flask(__name__)
     fake_user = FakeUser()
@@ -652,3 +670,68 @@ def test_schedule_content_rejects_draft_only_formats(monkeypatch):
     assert payload["success"] is False
     assert payload["error"] == "This format cannot be auto-published. Use Save Draft instead."
     assert store["scheduled_posts"] == []
+
+
+def test_content_regenerate_prefetches_user_config_alongside_row(monkeypatch):
+    import user_config
+
+    app = Flask(__name__)
+    fake_user = FakeUser()
+    loaded_configs = []
+    captured = {}
+    store = {
+        "processed_content": [
+            {"id": "pc-9", "user_id": fake_user.id, "post_type": "post", "generated_text": "Body", "hook": "Hook"}
+        ]
+    }
+
+    _patch_user(monkeypatch, fake_user)
+    monkeypatch.setattr(studio_routes, "_client", lambda: FakeClient(store))
+    monkeypatch.setattr(
+        user_config,
+        "get_user_config",
+        lambda user_id: loaded_configs.append(user_id) or SimpleNamespace(user_id=user_id),
+    )
+    monkeypatch.setattr(
+        studio_routes,
+        "_regenerate_existing_content",
+        lambda row, instruction="", tone=None: captured.update({"row": dict(row)}) or {"format": "post"},
+    )
+
+    with app.test_request_context("/api/content/pc-9/regenerate", method="POST", json={}):
+        response = studio_routes.regenerate_content_by_id.__wrapped__("pc-9")
+
+    assert response.get_json()["success"] is True
+    assert captured["row"]["id"] == "pc-9"
+    assert loaded_configs == [fake_user.id]
+
+
+def test_content_regenerate_ignores_failed_user_config_prefetch(monkeypatch):
+    import user_config
+
+    app = Flask(__name__)
+    fake_user = FakeUser()
+    captured = {}
+    store = {
+        "processed_content": [
+            {"id": "pc-9", "user_id": fake_user.id, "post_type": "post", "generated_text": "Body", "hook": "Hook"}
+        ]
+    }
+
+    def failing_config(_user_id):
+        raise RuntimeError("settings backend unavailable")
+
+    _patch_user(monkeypatch, fake_user)
+    monkeypatch.setattr(studio_routes, "_client", lambda: FakeClient(store))
+    monkeypatch.setattr(user_config, "get_user_config", failing_config)
+    monkeypatch.setattr(
+        studio_routes,
+        "_regenerate_existing_content",
+        lambda row, instruction="", tone=None: captured.update({"row": dict(row)}) or {"format": "post"},
+    )
+
+    with app.test_request_context("/api/content/pc-9/regenerate", method="POST", json={}):
+        response = studio_routes.regenerate_content_by_id.__wrapped__("pc-9")
+
+    assert response.get_json()["success"] is True
+    assert captured["row"]["id"] == "pc-9"
@@ -116,6 +116,36 @@ def test_oauth_select_page_uses_active_template(monkeypatch):
     assert response["context"]["active_page"] == "channels"
 
 
+def test_oauth_select_page_reuses_token_from_callback_pages(monkeypatch):
+    import facebook_oauth
+    import app.utils as app_utils
+
+    app = Flask(__name__)
+    app.secret_key = "test-secret"
+    saved = {}
+
+    def fail_get_page_token(*_args):
+        raise AssertionError("page token should come from the callback result")
+
+    monkeypatch.setattr(facebook_oauth, "get_page_token", fail_get_page_token)
+    monkeypatch.setattr(facebook_oauth, "get_instagram_account_for_page", lambda *_args: None)
+    monkeypatch.setattr(app_utils, "save_fb_page_for_user", lambda **kwargs: saved.update(kwargs) or True)
+    monkeypatch.setattr("flask_login.current_user", FakeUser())
+    monkeypatch.setattr(dashboard_routes, "url_for", lambda endpoint: "/channels")
+
+    with app.test_request_context("/oauth/facebook/select-page", method="POST", data={"page_id": "page-1"}):
+        session["fb_oauth_result"] = {
+            "user_token": "user-token",
+            "expires_in": 3600,
+            "pages": [{"id": "page-1", "name": "Main Page", "access_token": "page-token"}],
+        }
+        response = dashboard_routes.oauth_select_page.__wrapped__()
+
+    assert response.status_code == 302
+    assert saved["page_token"] == "page-token"
+    assert saved["page_name"] == "Main Page"
+
+
 def test_pending_content_includes_page_platform_language_and_context(monkeypatch):
     app = Flask(__name__)
     fake_user = FakeUser()